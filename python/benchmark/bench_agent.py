@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: many client processes starting up at once (resolve the env, list and load every category) straight
+from a local github stand-in with a fixed per request latency vs. from a configuration agent serving the host.
+
+    cd python
+    python -m benchmark.bench_agent
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from src.agent import ConfigAgent
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+CATEGORIES = 20
+SECTIONS_PER_CATEGORY = 200
+REQUEST_LATENCY = 0.03
+STARTUPS_PER_CLIENT = 5
+
+
+def build_branches():
+    category = {f"section{i}": {"url": "https://host/api", "retries": i, "tags": ["a", "b"]} for i in range(SECTIONS_PER_CATEGORY)}
+    files = {f"category{i}.json": json.dumps(category) for i in range(CATEGORIES)}
+    return {"master": {"sha": "0" * 40, "files": files}}
+
+
+def client_startups(provider, options):
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    Logger.instance().initialize("warning")
+    started = time.perf_counter()
+    for _ in range(STARTUPS_PER_CLIENT):
+        loader = EnvConfigLoaderFactory().get_loader(provider)
+        loader.set_options(options)
+        loader.set_env("master", [])
+        for category in loader.list_categories():
+            loader.load(category.lower())
+        if provider == "agent":
+            loader.close()
+    return (time.perf_counter() - started) / STARTUPS_PER_CLIENT * 1000
+
+
+def measure(clients, provider, options):
+    started = time.perf_counter()
+    with multiprocessing.Pool(clients) as pool:
+        startups = pool.starmap(client_startups, [(provider, options)] * clients)
+    elapsed = time.perf_counter() - started
+    return sum(startups) / len(startups), clients * STARTUPS_PER_CLIENT / elapsed
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    Logger.instance().initialize("warning")
+
+    server = GithubStubServer(build_branches(), latency=REQUEST_LATENCY).start()
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = os.path.join(socket_dir, "agent.sock")
+        agent = ConfigAgent("github", 1, server.loader_options()).start(socket_path)
+        try:
+            # warm the agent up, its first client pays for the github round trips
+            client_startups("agent", {"agent": {"socket": socket_path}})
+            for clients in [1, 8, 32]:
+                direct_ms, direct_rate = measure(clients, "github", server.loader_options())
+                agent_ms, agent_rate = measure(clients, "agent", {"agent": {"socket": socket_path}})
+                print(
+                    f"{clients:>4} clients  github {direct_ms:8.2f} ms/startup {direct_rate:8.1f} startups/s"
+                    f"  agent {agent_ms:7.2f} ms/startup {agent_rate:8.1f} startups/s"
+                )
+        finally:
+            agent.stop()
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
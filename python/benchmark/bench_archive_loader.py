@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: per file github loader vs. single archive (github-archive) loader, against a local github stand-in
+with a fixed per request latency (emulating the round trip to github).
+
+    cd python
+    python -m benchmark.bench_archive_loader
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import time
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+ROUNDS = 3
+REQUEST_LATENCY = 0.03
+
+
+def build_branches(categories_count):
+    files = {
+        f"category{i}.json": '{"section": {"key": %d, "values": [%s]}}' % (i, ",".join(["1"] * 200))
+        for i in range(categories_count)
+    }
+    return {"master": {"sha": "0" * 40, "files": files}}
+
+
+def run_startup(server, provider):
+    loader = EnvConfigLoaderFactory().get_loader(provider)
+    loader.set_options(server.loader_options())
+    loader.set_env("master", [])
+    for category in loader.list_categories():
+        loader.load(category.lower())
+
+
+def measure(server, provider, categories_count):
+    server.reset_counters()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        run_startup(server, provider)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    print(
+        f"{categories_count:>4} categories  {provider:<15} {elapsed * 1000:9.2f} ms/startup  "
+        f"{len(server.requests) // ROUNDS} round trips"
+    )
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    Logger.instance().initialize("warning")
+
+    for categories_count in [5, 20, 50]:
+        server = GithubStubServer(build_branches(categories_count), latency=REQUEST_LATENCY).start()
+        try:
+            measure(server, "github", categories_count)
+            measure(server, "github-archive", categories_count)
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: pooled loader session vs. a fresh connection per request, against a local github stand-in.
+
+    cd python
+    python -m benchmark.bench_http_pool
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import time
+import requests
+from src.github_env_conf_loader import GithubEnvConfigLoader, GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+CATEGORIES_COUNT = 20
+ROUNDS = 10
+# roughly a TLS handshake to github from a far region
+HANDSHAKE_LATENCY = 0.02
+
+
+def build_branches():
+    files = {f"category{i}.json": '{"section": {"key": %d}}' % i for i in range(CATEGORIES_COUNT)}
+    return {"master": {"sha": "0" * 40, "files": files}}
+
+
+def run_pooled(server):
+    loader = GithubEnvConfigLoader()
+    loader.set_options(server.loader_options())
+    loader.set_env("master", [])
+    for category in loader.list_categories():
+        loader.load(category.lower())
+
+
+def run_unpooled(server):
+    # the pre-pool behavior: every call is a bare requests.get (new connection each time)
+    headers = {"Authorization": "token dummy"}
+    requests.get(f"{server.api_url}/repos/{server.account}/{server.repo}/branches/master", headers=headers)
+    requests.get(f"{server.api_url}/repos/{server.account}/{server.repo}/contents/?ref=master", headers=headers)
+    for i in range(CATEGORIES_COUNT):
+        requests.get(f"{server.raw_url}/{server.account}/{server.repo}/master/category{i}.json", headers=headers)
+
+
+def measure(name, server, func):
+    server.reset_counters()
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(server)
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    print(
+        f"{name:<10} {elapsed * 1000:8.2f} ms/startup  "
+        f"{len(server.requests) // ROUNDS} requests over {server.connections / ROUNDS:.1f} connections per startup"
+    )
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    Logger.instance().initialize("warning")
+
+    server = GithubStubServer(build_branches(), handshake_latency=HANDSHAKE_LATENCY).start()
+    try:
+        measure("unpooled", server, run_unpooled)
+        measure("pooled", server, run_pooled)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
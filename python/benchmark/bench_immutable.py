@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: accessing a large section the way callers guard against mutating the loaded config - a defensive deep copy
+per access of the plain dicts - vs. the read only section returned as is (EnvConfig::set_immutable),
+and vs. the plain dicts compatibility mode (a plain copy per access).
+
+    cd python
+    python -m benchmark.bench_immutable
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import copy
+import json
+import os
+import timeit
+from src.common import ENV_VAR_NAME
+from src.config_context_handler import EnvConfigContext
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.env_config import EnvConfig, TWIST_ENV_KEY
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+ACCESSES = 200
+SECTION_SIZES = [10, 1000, 10000]
+
+
+def build_branches():
+    category = {
+        f"section{size}": {f"key{i}": {"url": "https://host/api", "retries": i, "tags": ["a", "b"]} for i in range(size)}
+        for size in SECTION_SIZES
+    }
+    return {"master": {"sha": "0" * 40, "files": {"large.json": json.dumps(category)}}}
+
+
+def per_access_us(access):
+    return timeit.timeit(access, number=ACCESSES) / ACCESSES * 1e6
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    os.environ.setdefault(ENV_VAR_NAME, "staging")
+    os.environ[TWIST_ENV_KEY] = "master"
+    Logger.instance().initialize("warning")
+
+    server = GithubStubServer(build_branches()).start()
+    try:
+        loader = EnvConfigLoaderFactory().get_loader("github")
+        loader.set_options(server.loader_options())
+        EnvConfig.instance().set_context_handler(EnvConfigContext("staging"))
+        EnvConfig.instance().set_loader(loader)
+        EnvConfig.instance().require_category("LARGE")
+
+        for size in SECTION_SIZES:
+            section = f"section{size}"
+            defensive = per_access_us(lambda: copy.deepcopy(EnvConfig.get("large", section, None)))
+            EnvConfig.instance().set_immutable()
+            immutable = per_access_us(lambda: EnvConfig.get("large", section, None))
+            EnvConfig.instance().set_immutable(plain_dicts=True)
+            plain_dicts = per_access_us(lambda: EnvConfig.get("large", section, None))
+            EnvConfig.instance().set_immutable(False)
+
+            print(
+                f"{size:>6} keys  deepcopy {defensive:10.1f} us/access  immutable {immutable:6.2f} us/access"
+                f"  plain_dicts {plain_dicts:10.1f} us/access"
+            )
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: startup cost of importing the package in a fresh interpreter (the way short lived CLI jobs pay it),
+vs. the interpreter alone and vs. the package along with the dependencies it used to import eagerly.
+Followed by the slowest imports reported by python -X importtime.
+
+    cd python
+    python -m benchmark.bench_import
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import subprocess
+import sys
+import time
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+ROUNDS = 20
+TOP_IMPORTS = 10
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EAGER_DEPENDENCIES = "import hvac, requests, json5, yaml, termcolor, http.server, asyncio"
+
+
+def run(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], cwd=PACKAGE_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+
+
+def measure(code):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        run(code)
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def slowest_imports(code):
+    imports = []
+    for line in run(code, "-X", "importtime").stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            imports.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return sorted(imports, reverse=True)[:TOP_IMPORTS]
+
+
+def main():
+    interpreter = measure("pass")
+    package = measure("import src")
+    eager = measure(f"import src; {EAGER_DEPENDENCIES}")
+
+    print(f"interpreter only            {interpreter:7.1f} ms")
+    print(f"import src                  {package:7.1f} ms  (+{package - interpreter:.1f} ms)")
+    print(f"import src + eager deps     {eager:7.1f} ms  (+{eager - interpreter:.1f} ms)")
+
+    print("\nslowest imports of 'import src' (self / cumulative us):")
+    for self_us, cumulative_us, name in slowest_imports("import src"):
+        print(f"{self_us:>8} {cumulative_us:>9}  {name}")
+
+
+if __name__ == "__main__":
+    main()
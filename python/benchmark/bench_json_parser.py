@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: category parsing with json5 vs. the strict json parsers (stdlib json, orjson when installed)
+on synthetic categories from 1KB to 10MB.
+
+    cd python
+    python -m benchmark.bench_json_parser
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import time
+from src.json_parsers import parse_json, PARSERS, PARSER_AUTO, PARSER_JSON5, PARSER_ORJSON
+from src import json_parsers
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+SIZES = [1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024]
+# json5 is slow, keep the total time of the big categories bounded
+MIN_ROUNDS = 1
+TARGET_SECONDS = 0.5
+# a single json5 parse of the biggest categories takes minutes, those are skipped
+JSON5_MAX_SIZE = 2 * 1024 * 1024
+
+
+def build_category(size):
+    """
+    A category shaped like the real ones (sections of mixed typed keys), about size bytes of json
+    """
+    def section(index):
+        return {
+            "name": f"service-{index}",
+            "enabled": index % 2 == 0,
+            "timeout": 30.5,
+            "retries": index,
+            "hosts": [f"host-{i}.internal" for i in range(5)],
+            "limits": {"cpu": "500m", "memory": "512Mi"},
+        }
+
+    section_size = len(json.dumps({"section0": section(0)}, indent=2))
+    sections_count = max(1, size // section_size)
+    return json.dumps({f"section{i}": section(i) for i in range(sections_count)}, indent=2)
+
+
+def measure(content, parser):
+    started = time.perf_counter()
+    rounds = 0
+    while rounds < MIN_ROUNDS or time.perf_counter() - started < TARGET_SECONDS:
+        parse_json(content, parser)
+        rounds += 1
+    return (time.perf_counter() - started) / rounds
+
+
+def main():
+    parsers = [PARSER_JSON5] + [p for p in PARSERS if p != PARSER_JSON5 and (p != PARSER_ORJSON or json_parsers.orjson)]
+    parsers.append(PARSER_AUTO)
+
+    print(f"{'size':>10}  " + "  ".join(f"{p:>12}" for p in parsers) + "  (ms/parse)")
+    for size in SIZES:
+        content = build_category(size)
+        timings = [
+            f"{measure(content, parser) * 1000:>12.3f}" if parser != PARSER_JSON5 or len(content) <= JSON5_MAX_SIZE else f"{'-':>12}"
+            for parser in parsers
+        ]
+        print(f"{len(content) / 1024:>8.0f}KB  " + "  ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: deep lookups of a loaded category through EnvConfig.get_path (served from the category path index)
+vs. chaining dict lookups off EnvConfig.get and vs. walking the split path on every call.
+
+    cd python
+    python -m benchmark.bench_path_index
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import os
+import timeit
+from src.common import ENV_VAR_NAME
+from src.config_context_handler import EnvConfigContext
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.env_config import EnvConfig, TWIST_ENV_KEY
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+LOOKUPS = 200000
+SECTIONS = 200
+DEPTHS = [2, 4, 8]
+
+
+def nested(depth):
+    value = "leaf"
+    for level in reversed(range(depth - 1)):
+        value = {f"level{level}": value, "sibling": level}
+    return value
+
+
+def build_branches():
+    category = {f"section{i}": nested(max(DEPTHS)) for i in range(SECTIONS)}
+    return {"master": {"sha": "0" * 40, "files": {"shipping.json": json.dumps(category)}}}
+
+
+def split_walk(category, path, default_value=None):
+    value = EnvConfig.get(category, None, None)
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return default_value
+        value = value[key]
+    return value
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    os.environ.setdefault(ENV_VAR_NAME, "staging")
+    os.environ[TWIST_ENV_KEY] = "master"
+    Logger.instance().initialize("warning")
+
+    server = GithubStubServer(build_branches()).start()
+    try:
+        loader = EnvConfigLoaderFactory().get_loader("github")
+        loader.set_options(server.loader_options())
+        EnvConfig.instance().set_context_handler(EnvConfigContext("staging"))
+        EnvConfig.instance().set_loader(loader)
+        # loading the category and building its path index, outside of the measured lookups
+        EnvConfig.get_path("shipping", "section0")
+
+        for depth in DEPTHS:
+            keys = ["section7"] + [f"level{level}" for level in range(depth - 1)]
+            path = ".".join(keys)
+
+            def chained():
+                value = EnvConfig.get("shipping", keys[0], None)
+                for key in keys[1:]:
+                    value = value[key]
+                return value
+
+            assert EnvConfig.get_path("shipping", path) == chained() == split_walk("shipping", path)
+            results = [
+                ("get_path", timeit.timeit(lambda: EnvConfig.get_path("shipping", path), number=LOOKUPS)),
+                ("get + chaining", timeit.timeit(chained, number=LOOKUPS)),
+                ("split + walk", timeit.timeit(lambda: split_walk("shipping", path), number=LOOKUPS)),
+            ]
+            print(f"depth {depth}  " + "  ".join(f"{name} {elapsed / LOOKUPS * 1e9:7.0f} ns" for name, elapsed in results))
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
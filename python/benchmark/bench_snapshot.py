@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Benchmark: cold startup (list, fetch, parse and context process every category from a local github stand-in
+with a fixed per request latency) vs. warm startup from a processed configuration snapshot.
+
+    cd python
+    python -m benchmark.bench_snapshot
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import os
+import tempfile
+import time
+from src.common import ENV_VAR_NAME
+from src.config_context_handler import EnvConfigContext
+from src.config_snapshot import ConfigSnapshot
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.logger import Logger
+from test.github_stub_server import GithubStubServer
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+ROUNDS = 5
+REQUEST_LATENCY = 0.03
+SECTIONS_PER_CATEGORY = 200
+
+
+def build_branches(categories_count):
+    category = {
+        "$context": {"staging": {"host": "staging.internal"}, "production": {"host": "production.internal"}},
+        **{f"section{i}": {"url": "https://{{ host }}/api", "retries": i, "tags": ["a", "b"]} for i in range(SECTIONS_PER_CATEGORY)},
+    }
+    files = {f"category{i}.json": json.dumps(category) for i in range(categories_count)}
+    return {"master": {"sha": "0" * 40, "files": files}}
+
+
+def cold_startup(server, context):
+    loader = EnvConfigLoaderFactory().get_loader("github")
+    loader.set_options(server.loader_options())
+    loader.set_env("master", [])
+    categories = loader.list_categories()
+    config_json = {c.lower(): context.process(loader.load(c.lower())) for c in categories}
+    return loader.revision(), categories, config_json
+
+
+def warm_startup(snapshot, revision, context):
+    return snapshot.load("master", revision, context.fingerprint())
+
+
+def measure(startup):
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        startup()
+    return (time.perf_counter() - started) / ROUNDS * 1000
+
+
+def main():
+    os.environ.setdefault(GIT_CONF_TOKEN_KEY, "dummy-token")
+    os.environ.setdefault(ENV_VAR_NAME, "staging")
+    Logger.instance().initialize("warning")
+    context = EnvConfigContext("staging")
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot = ConfigSnapshot(snapshot_dir)
+        for categories_count in [5, 20, 50]:
+            server = GithubStubServer(build_branches(categories_count), latency=REQUEST_LATENCY).start()
+            try:
+                revision, categories, config_json = cold_startup(server, context)
+                snapshot.save("master", revision, context.fingerprint(), categories, config_json)
+
+                cold = measure(lambda: cold_startup(server, context))
+                warm = measure(lambda: warm_startup(snapshot, revision, context))
+            finally:
+                server.stop()
+
+            print(f"{categories_count:>4} categories  cold {cold:9.2f} ms/startup  snapshot {warm:7.2f} ms/startup")
+
+
+if __name__ == "__main__":
+    main()
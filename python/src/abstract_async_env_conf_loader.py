@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Abstract base class for all asyncio EnvConfigLoaders...
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import asyncio
+from abc import ABC, abstractmethod
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def running_loop():
+    """
+    Returns:
+        asyncio.AbstractEventLoop -- the loop of the calling coroutine (get_running_loop is python 3.7+,
+        get_event_loop returns that very loop when called from a coroutine)
+    """
+    get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+    return get_running_loop()
+
+
+class AsyncEnvConfigLoader(ABC):
+    """
+    The awaitable counterpart of EnvConfigLoader (see abstract_env_conf_loader.py).
+    To be injected into EnvConfig (see EnvConfig::set_async_loader) and used by its awaitable accessors
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._version = 1
+        self._options = {}
+
+    async def set_env(self, environment, fallback_list):
+        self._env = environment
+        self._fallback_list = fallback_list
+        return await self.verify_env_or_fallback()
+
+    def set_version(self, version):
+        self._version = version
+
+    def set_options(self, options):
+        """
+        Loader specific settings as declared in the config block of .envConfig.yml
+
+        Arguments:
+            options {dict} -- the config block
+        """
+        self._options = options or {}
+
+    @abstractmethod
+    async def verify_env_or_fallback(self):
+        """
+        Same contract as EnvConfigLoader::verify_env_or_fallback without blocking the event loop
+        """
+        pass
+
+    @abstractmethod
+    async def load(self, category):
+        """
+        Same contract as EnvConfigLoader::load without blocking the event loop
+
+        Returns: dict (json)
+        """
+        pass
+
+    @abstractmethod
+    async def list_categories(self):
+        """
+        Same contract as EnvConfigLoader::list_categories without blocking the event loop
+        """
+        pass
@@ -12,7 +12,12 @@ Abstract base class for all EnvConfigLoaders...
 # IMPORT MODULES                                                            #
 #############################################################################
 
+import threading
 from abc import ABC, abstractmethod
+from .branch_cache import BranchCache, DEFAULT_BRANCH_CACHE_PATH, DEFAULT_BRANCH_CACHE_TTL
+from .common import get_config_folder
+from .json_parsers import parse_json, DEFAULT_PARSER
+from .logger import Logger
 
 #############################################################################
 # IMPLEMENTATION                                                            #
@@ -27,15 +32,177 @@ class EnvConfigLoader(ABC):
 
     def __init__(self):
         super().__init__()
+        self._version = 1
+        self._options = {}
+        # the exact version (ex. commit sha) of the env all reads are pinned to, once verified
+        self._revision = None
+        # background re-verification of a cached env resolution (see set_env)
+        self._branch_revalidation = None
+        # category => name of the parser its content was parsed with (see _parse)
+        self._category_parsers = {}
 
     def set_env(self, environment, fallback_list):
         self._env = environment
         self._fallback_list = fallback_list
-        return self.verify_env_or_fallback()
+
+        if "branch_cache" not in self._options:
+            return self.verify_env_or_fallback()
+
+        branch_cache = BranchCache(
+            self._get_option("branch_cache", "path", DEFAULT_BRANCH_CACHE_PATH),
+            self._get_option("branch_cache", "ttl", DEFAULT_BRANCH_CACHE_TTL),
+        )
+
+        # a fresh resolution from an earlier run - skip probing, refresh it for the next run in the background
+        cached = branch_cache.get(environment, fallback_list)
+        if cached is not None:
+            Logger.info(f"Using cached resolution of env {environment} to branch {cached['branch']} ({cached['revision']})")
+            self.pin(cached["branch"], cached["revision"])
+            self.__follow_cached_branch_head(branch_cache, environment, fallback_list)
+            self._branch_revalidation = threading.Thread(
+                target=self.__revalidate, args=(branch_cache, environment, fallback_list), daemon=True
+            )
+            self._branch_revalidation.start()
+            return True
+
+        env_exists = self.verify_env_or_fallback()
+        # only successful resolutions are kept, a failure might be transient (ex. github outage)
+        if env_exists:
+            branch_cache.put(environment, fallback_list, self._env, self._revision)
+        return env_exists
+
+    def __follow_cached_branch_head(self, branch_cache, environment, fallback_list):
+        # the branch might have moved since cached (ex. a configuration push right before a restart),
+        # a single head check rather than the whole fallback probing
+        try:
+            head = self.head_revision()
+        except Exception as ex:
+            Logger.warning(f"Could not check the head of cached branch {self._env}, serving {self._revision}: {ex}")
+            return
+
+        if head is not None and head != self._revision:
+            Logger.info(f"Cached branch {self._env} of env {environment} moved to {head}")
+            self.pin(self._env, head)
+            branch_cache.put(environment, fallback_list, self._env, head)
+
+    def __revalidate(self, branch_cache, environment, fallback_list):
+        # probing with a separate loader, this one keeps serving the cached resolution for its lifetime
+        probe = self._spawn()
+        try:
+            if probe.set_env(environment, fallback_list):
+                branch_cache.put(environment, fallback_list, probe._env, probe._revision)
+                if probe._revision != self._revision:
+                    Logger.info(f"Env {environment} now resolves to branch {probe._env} ({probe._revision}), effective on next start")
+        except Exception as ex:
+            Logger.warning(f"Failed revalidating cached resolution of env {environment}: {ex}")
 
     def set_version(self, version):
         self._version = version
 
+    def revision(self):
+        """
+        The exact version of the configuration served by this loader (ex. the commit sha the env branch
+        pointed to when verified) or None when the source has no such notion.
+        Stable for the loader lifetime, so consumers may key their caches on it.
+        """
+        return self._revision
+
+    def pin(self, branch, revision):
+        """
+        Serves the provided, already resolved branch at the provided revision - no verification involved
+        (ex. a resolution cached or shared by another process)
+        """
+        self._env = branch
+        self._revision = revision
+
+    def served_env(self):
+        """
+        The env (branch) actually served once verified - the requested one or the fallback it resolved to
+        """
+        return self._env
+
+    def categories_of_paths(self, paths):
+        """
+        The categories (lowercased) held by the provided repo file paths, for the served env
+        (ex. ["global.json", "qa/system.json", "README.md"] => ["global"] for v1)
+        """
+        folder = get_config_folder(self._env, self._version)
+        categories = []
+        for path in paths:
+            name = path[len(folder):] if path.startswith(folder) else None
+            if name is not None and "/" not in name and name.endswith(".json"):
+                categories.append(name[: -len(".json")].lower())
+        return categories
+
+    def head_revision(self):
+        """
+        The current head of the verified env (ex. the commit sha its branch points to right now), unlike
+        revision() which stays pinned. Used for detecting configuration changes (see EnvConfig::start_refresher).
+
+        Returns:
+            str -- head revision or None when the source has no such notion (or it could not be checked)
+        """
+        return None
+
+    def reset_connections(self):
+        """
+        Drops the connections (ex. pooled http sessions, sockets, pipes) the loader holds, without closing them
+        as they are shared with the parent process - called in forked children (see EnvConfig::freeze).
+        The next request connects afresh.
+        """
+        pass
+
+    def _spawn(self):
+        """
+        A new (env not set yet) loader of the same kind, version and options.
+        The branch resolution cache is left out, a spawned loader always resolves its env afresh.
+        """
+        spawned = type(self)()
+        spawned.set_version(self._version)
+        spawned.set_options({k: v for k, v in self._options.items() if k != "branch_cache"})
+        return spawned
+
+    def set_options(self, options):
+        """
+        Loader specific settings as declared in the config block of .envConfig.yml
+        (ex. {"http": {"pool_size": 10}}). Every loader picks the sub blocks it knows about.
+
+        Arguments:
+            options {dict} -- the config block
+        """
+        self._options = options or {}
+
+    def _get_option(self, block, key, default=None):
+        """
+        Reads self._options[block][key] falling back to default when either is missing
+        """
+        block_data = self._options.get(block) or {}
+        return block_data.get(key, default)
+
+    def _json_parser(self):
+        return self._get_option("json", "parser", DEFAULT_PARSER)
+
+    def _parse(self, category, content):
+        """
+        Parses a category file content with the configured parser (json block, parser key),
+        recording which parser made it
+
+        Returns:
+            dict -- parsed json
+        """
+        parsed, parser = parse_json(content, self._json_parser())
+        self._category_parsers[category] = parser
+        return parsed
+
+    def category_parsers(self):
+        """
+        Which parser (orjson, json or json5) parsed each of the loaded categories
+
+        Returns:
+            dict -- category => parser name
+        """
+        return dict(self._category_parsers)
+
     @abstractmethod
     def verify_env_or_fallback(self):
         """
@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+configuration agent (sidecar daemon): loads the configuration once per host and serves it to many
+client processes over a unix domain socket (see agent_protocol.py, agent_env_conf_loader.py)
+
+    python -m configuration_client.agent --config .envConfig.yml
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import argparse
+import json
+import os
+import socketserver
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from .agent_protocol import (
+    DEFAULT_AGENT_SOCKET,
+    OP_GET,
+    OP_HEAD,
+    OP_LIST,
+    OP_LOAD,
+    OP_PIN,
+    OP_RESOLVE,
+    STATUS_ERROR,
+    STATUS_NOT_FOUND,
+    STATUS_OK,
+    decode_fields,
+    encode_fields,
+    recv_frame,
+    send_frame,
+)
+from .env_conf_loader_factory import EnvConfigLoaderFactory
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+# seconds an env that could not be resolved is answered as such, without probing the source again
+DEFAULT_UNRESOLVED_TTL = 30
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class _ServedEnv:
+    """
+    A resolved env (its loader) and its listed and loaded categories, fetched once for all of the clients
+    (outside of the lock, see __fetch_once) and kept encoded
+    """
+
+    def __init__(self, loader):
+        self.loader = loader
+        self.lock = threading.Lock()
+        # None => listed category names, category => (parsed json, encoded json)
+        self.fetched = {}
+        # None or category => Future of its in flight fetch
+        self.fetching = {}
+
+    def __fetch_once(self, name, fetch, is_cacheable):
+        with self.lock:
+            if name in self.fetched:
+                return self.fetched[name]
+            in_flight = self.fetching.get(name)
+            if in_flight is not None:
+                is_fetcher = False
+            else:
+                in_flight = self.fetching[name] = Future()
+                is_fetcher = True
+
+        if not is_fetcher:
+            return in_flight.result()
+
+        try:
+            fetched = fetch()
+        except BaseException as ex:
+            with self.lock:
+                del self.fetching[name]
+            in_flight.set_exception(ex)
+            raise
+
+        with self.lock:
+            # failures are shared with the concurrent clients only, the next client fetches again
+            if is_cacheable(fetched):
+                self.fetched[name] = fetched
+            del self.fetching[name]
+        in_flight.set_result(fetched)
+        return fetched
+
+    def list_categories(self):
+        return self.__fetch_once(
+            None, lambda: [c.replace(".json", "").upper() for c in self.loader.list_categories()], lambda categories: True
+        )
+
+    def load(self, category):
+        category = category.lower()
+
+        def fetch():
+            parsed = self.loader.load(category)
+            return parsed, json.dumps(parsed, separators=(",", ":")).encode("utf-8")
+
+        # loaders log and yield {} when failing to fetch or parse - never cached
+        return self.__fetch_once(category, fetch, lambda loaded: loaded[0] != {})
+
+
+class ConfigAgent:
+    """
+    Serves raw (not context processed) categories of any env to the clients of the host: every env is resolved,
+    listed and every category fetched once (with the regular loaders, github token / vault included), then served
+    from memory. Clients process the categories with their own context, as if loaded directly.
+    Optionally follows the head of the served envs, serving the new revision once moved - to new clients only,
+    a client keeps being served the revision it resolved (or pinned) for its whole connection.
+    """
+
+    def __init__(self, provider=None, version=1, options=None, unresolved_ttl=DEFAULT_UNRESOLVED_TTL):
+        self.__provider = provider
+        self.__version = version
+        self.__options = options or {}
+        self.__unresolved_ttl = unresolved_ttl
+        # (env, fallback envs) => _ServedEnv of its current resolution
+        self.__envs = {}
+        # (branch, revision) => _ServedEnv, as long as a resolution or a client connection uses it
+        self.__revisions = weakref.WeakValueDictionary()
+        # (env, fallback envs) => Future of its in flight resolution (single flight, see resolve)
+        self.__resolving = {}
+        # (env, fallback envs) => when it could not be resolved (time.monotonic)
+        self.__unresolved = {}
+        self.__envs_lock = threading.Lock()
+        self.__server = None
+        self.__threads = []
+        self.__stop = threading.Event()
+
+    def __new_loader(self):
+        loader = EnvConfigLoaderFactory().get_loader(self.__provider)
+        loader.set_version(self.__version)
+        loader.set_options(self.__options)
+        return loader
+
+    def resolve(self, env, fallback_list):
+        """
+        Returns:
+            _ServedEnv -- the served env or None when neither the env nor its fallbacks exist
+                          (remembered for unresolved_ttl seconds)
+        """
+        key = (env, tuple(fallback_list))
+        with self.__envs_lock:
+            if key in self.__envs:
+                return self.__envs[key]
+            if time.monotonic() - self.__unresolved.get(key, float("-inf")) < self.__unresolved_ttl:
+                return None
+
+            # resolved (network round trips) outside of the lock, the clients of other envs are served meanwhile
+            # and the clients of this env wait for that very resolution
+            in_flight = self.__resolving.get(key)
+            if in_flight is not None:
+                is_resolver = False
+            else:
+                in_flight = self.__resolving[key] = Future()
+                is_resolver = True
+
+        if not is_resolver:
+            return in_flight.result()
+
+        try:
+            loader = self.__new_loader()
+            served = _ServedEnv(loader) if loader.set_env(env, list(fallback_list)) else None
+        except BaseException as ex:
+            # failures (ex. source unreachable) are not remembered, the next client tries again
+            with self.__envs_lock:
+                del self.__resolving[key]
+            in_flight.set_exception(ex)
+            raise
+
+        with self.__envs_lock:
+            if served is not None:
+                served = self.__envs[key] = self.__revisions.setdefault(self.__revision_key(served), served)
+            else:
+                now = time.monotonic()
+                self.__unresolved = {k: t for k, t in self.__unresolved.items() if now - t < self.__unresolved_ttl}
+                self.__unresolved[key] = now
+            del self.__resolving[key]
+        in_flight.set_result(served)
+        return served
+
+    @staticmethod
+    def __revision_key(served):
+        return served.loader.served_env(), served.loader.revision()
+
+    def pin(self, branch, revision):
+        """
+        Returns:
+            _ServedEnv -- the branch served at exactly the provided revision (no network involved), or resolved
+                          (see resolve) when the source has no revision notion
+        """
+        if revision is None:
+            return self.resolve(branch, [])
+
+        with self.__envs_lock:
+            served = self.__revisions.get((branch, revision))
+        if served is not None:
+            return served
+
+        loader = self.__new_loader()
+        loader.pin(branch, revision)
+        with self.__envs_lock:
+            return self.__revisions.setdefault((branch, revision), _ServedEnv(loader))
+
+    def handle(self, served, opcode, fields):
+        """
+        Returns:
+            tuple -- (status, body)
+        """
+        if opcode == OP_LIST:
+            return STATUS_OK, encode_fields(served.list_categories())
+
+        if opcode == OP_LOAD:
+            if fields[0].upper() not in served.list_categories():
+                return STATUS_NOT_FOUND, encode_fields([f"Unknown category {fields[0]}"])
+            return STATUS_OK, served.load(fields[0])[1]
+
+        if opcode == OP_GET:
+            return self.__get(served, fields)
+
+        if opcode == OP_HEAD:
+            return STATUS_OK, encode_fields([served.loader.head_revision() or ""])
+
+        return STATUS_ERROR, encode_fields([f"Unknown opcode {opcode}"])
+
+    def __get(self, served, fields):
+        if fields[0].upper() not in served.list_categories():
+            return STATUS_NOT_FOUND, encode_fields([f"Unknown category {fields[0]}"])
+
+        value = served.load(fields[0])[0]
+        for name in fields[1:]:
+            if not isinstance(value, dict) or name not in value:
+                return STATUS_NOT_FOUND, encode_fields([f"Unknown key {'/'.join(fields)}"])
+            value = value[name]
+        return STATUS_OK, json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def refresh(self):
+        """
+        Replaces every served env whose head moved by a freshly resolved one (categories loaded again on demand)
+        """
+        with self.__envs_lock:
+            served_envs = list(self.__envs.items())
+
+        for key, served in served_envs:
+            try:
+                head_revision = served.loader.head_revision()
+                if head_revision is None or head_revision == served.loader.revision():
+                    continue
+
+                loader = self.__new_loader()
+                if loader.set_env(key[0], list(key[1])):
+                    refreshed = _ServedEnv(loader)
+                    with self.__envs_lock:
+                        self.__envs[key] = self.__revisions.setdefault(self.__revision_key(refreshed), refreshed)
+                    Logger.info(f"Configuration agent serving env {key[0]} at {loader.revision()}")
+            except Exception as ex:
+                Logger.warning(f"Configuration agent failed refreshing env {key[0]}: {ex}")
+
+    def __refresh_periodically(self, interval):
+        while not self.__stop.wait(interval):
+            self.refresh()
+
+    def start(self, socket_path=DEFAULT_AGENT_SOCKET, refresh_interval=0):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        self.__server = _AgentServer(socket_path, _AgentRequestHandler)
+        self.__server.agent = self
+        # the served configuration is for the processes of this user only
+        os.chmod(socket_path, 0o600)
+
+        self.__stop.clear()
+        self.__threads = [threading.Thread(target=self.__server.serve_forever, args=(0.1,), name="config-agent", daemon=True)]
+        if refresh_interval > 0:
+            self.__threads.append(
+                threading.Thread(target=self.__refresh_periodically, args=(refresh_interval,), name="config-agent-refresh", daemon=True)
+            )
+        for thread in self.__threads:
+            thread.start()
+
+        Logger.info(f"Configuration agent listening on {socket_path}")
+        return self
+
+    def wait(self):
+        for thread in self.__threads:
+            thread.join()
+
+    def stop(self):
+        self.__stop.set()
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            if os.path.exists(self.__server.server_address):
+                os.remove(self.__server.server_address)
+            self.__server = None
+        self.wait()
+
+
+class _AgentServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _AgentRequestHandler(socketserver.BaseRequestHandler):
+    """
+    A client connection: resolves (or pins) an env first, then any number of requests about it - served at the
+    revision it resolved to, even once the agent serves a newer one to new connections (see ConfigAgent::refresh)
+    """
+
+    def setup(self):
+        self.served = None
+
+    def handle(self):
+        while True:
+            try:
+                payload = recv_frame(self.request)
+            except Exception as ex:
+                Logger.debug(f"Configuration agent dropping connection: {ex}")
+                return
+            if payload is None:
+                return
+
+            status, body = self.__dispatch(payload[0], decode_fields(memoryview(payload)[1:]))
+            try:
+                send_frame(self.request, bytes([status]) + body)
+            except OSError:
+                return
+
+    def __dispatch(self, opcode, fields):
+        agent = self.server.agent
+        try:
+            if opcode == OP_RESOLVE:
+                served = agent.resolve(fields[0], fields[1:])
+                if served is None:
+                    return STATUS_NOT_FOUND, encode_fields([f"Could not resolve env {fields[0]} nor its fallbacks"])
+                self.served = served
+                return STATUS_OK, encode_fields([served.loader.served_env(), served.loader.revision() or ""])
+
+            if opcode == OP_PIN:
+                served = agent.pin(fields[0], fields[1] or None)
+                if served is None:
+                    return STATUS_NOT_FOUND, encode_fields([f"Could not resolve env {fields[0]}"])
+                self.served = served
+                return STATUS_OK, encode_fields([served.loader.served_env(), served.loader.revision() or ""])
+
+            if self.served is None:
+                return STATUS_ERROR, encode_fields(["An env must be resolved first"])
+            return agent.handle(self.served, opcode, fields)
+        except Exception as ex:
+            Logger.error(f"Configuration agent failed handling opcode {opcode}: {ex}")
+            return STATUS_ERROR, encode_fields([str(ex)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="configuration agent - serves the configuration to the processes of this host")
+    parser.add_argument("--config", default=os.path.join(os.getcwd(), ".envConfig.yml"), help="env config yaml (its config block)")
+    parser.add_argument("--socket", default=DEFAULT_AGENT_SOCKET, help="unix domain socket path")
+    parser.add_argument("--refresh-interval", type=float, default=0, help="seconds between checks of the served envs heads (0 = off)")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    Logger.instance().initialize(args.log_level)
+
+    conf_data = {}
+    if os.path.exists(args.config):
+        import yaml
+
+        with open(args.config, "r") as env_file:
+            conf_data = (yaml.load(env_file, Loader=yaml.Loader) or {}).get("config") or {}
+
+    # the agent itself loads from the configured source, never from another agent
+    provider = conf_data.get("provider")
+    agent = ConfigAgent(None if provider == "agent" else provider, conf_data.get("version", 1), conf_data)
+    agent.start(args.socket, args.refresh_interval)
+    try:
+        agent.wait()
+    except KeyboardInterrupt:
+        agent.stop()
+
+
+if __name__ == "__main__":
+    main()
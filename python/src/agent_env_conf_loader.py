@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Concrete implementation of a configuration agent (see agent.py) client
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import os
+import socket
+import threading
+from .abstract_env_conf_loader import EnvConfigLoader
+from .agent_protocol import (
+    DEFAULT_AGENT_SOCKET,
+    OP_HEAD,
+    OP_LIST,
+    OP_LOAD,
+    OP_PIN,
+    OP_RESOLVE,
+    STATUS_NOT_FOUND,
+    STATUS_OK,
+    decode_fields,
+    encode_fields,
+    recv_frame,
+    send_frame,
+)
+from .logger import Logger
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class AgentEnvConfigLoader(EnvConfigLoader):
+    """
+    Configuration agent environment aware config loader.
+    Implements EnvConfigLoader in order to be injected into EnvConfig.
+    Everything is asked from the configuration agent of the host over its unix domain socket (path taken from
+    the "agent" options block) - a local round trip per request instead of the github and vault round trips,
+    which the agent made once for all the processes of the host.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__socket = None
+        self.__lock = threading.Lock()
+        # once resolved (or pinned), every connection is pinned to the served env and revision
+        self.__pinned = False
+
+    def __del__(self):
+        self.close()
+
+    def __socket_path(self):
+        return os.path.expanduser(self._get_option("agent", "socket", DEFAULT_AGENT_SOCKET))
+
+    def __request(self, opcode, *fields):
+        """
+        Returns:
+            tuple -- (status, body)
+        """
+        with self.__lock:
+            if self.__socket is None:
+                self.__connect()
+            return self.__exchange(opcode, fields)
+
+    def __connect(self):
+        self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.__socket.connect(self.__socket_path())
+        except OSError as ex:
+            self.__socket.close()
+            self.__socket = None
+            raise Exception(f"Could not reach the configuration agent at {self.__socket_path()}: {ex}")
+
+        # the agent serves this very revision on the new connection, even if the env moved since
+        if self.__pinned:
+            status, body = self.__exchange(OP_PIN, (self._env, self._revision or ""))
+            if status != STATUS_OK:
+                self.close()
+                raise Exception(f"Configuration agent could not serve env {self._env} at {self._revision}: {decode_fields(body)}")
+
+    def __exchange(self, opcode, fields):
+        try:
+            send_frame(self.__socket, bytes([opcode]) + encode_fields(fields))
+            response = recv_frame(self.__socket)
+        except OSError:
+            response = None
+        if response is None:
+            self.close()
+            raise Exception(f"Configuration agent at {self.__socket_path()} closed the connection")
+
+        return response[0], memoryview(response)[1:]
+
+    def __request_ok(self, opcode, *fields):
+        status, body = self.__request(opcode, *fields)
+        if status != STATUS_OK:
+            raise Exception(f"Configuration agent failed opcode {opcode} {list(fields)}: {decode_fields(body)}")
+        return body
+
+    def verify_env_or_fallback(self):
+        # the connection serves a single env (resolved first), reconnecting for another
+        self.close()
+        self.__pinned = False
+        status, body = self.__request(OP_RESOLVE, self._env, *self._fallback_list)
+        if status == STATUS_NOT_FOUND:
+            return False
+        if status != STATUS_OK:
+            raise Exception(f"Configuration agent could not resolve env {self._env}: {decode_fields(body)}")
+
+        served_env, revision = decode_fields(body)
+        Logger.info(f"Using configuration branch {served_env} served by the configuration agent at revision {revision[:6]}")
+        self._env = served_env
+        self._revision = revision or None
+        self.__pinned = True
+        return True
+
+    def list_categories(self):
+        return decode_fields(self.__request_ok(OP_LIST))
+
+    def load(self, category):
+        """
+        concrete implementation fo abstract method
+
+        Returns:
+            dict -- json parsed config
+        """
+        try:
+            return self._parse(category, self.__request_ok(OP_LOAD, category).tobytes())
+        except Exception as ex:
+            Logger.critical(
+                f'Failed loading and parsing config json content from the configuration agent, branch/env "{self._env}"\nexception: {ex}'
+            )
+            return {}
+
+    def pin(self, branch, revision):
+        # no request - the agent is asked for this revision once connecting (see __connect)
+        super().pin(branch, revision)
+        self._fallback_list = []
+        self.close()
+        self.__pinned = True
+
+    def head_revision(self):
+        return decode_fields(self.__request_ok(OP_HEAD))[0] or None
+
+    def reset_connections(self):
+        # the lock might have been held by another thread of the parent while forking
+        self.__lock = threading.Lock()
+        self.__socket = None
+
+    def close(self):
+        """
+        Closes the connection to the agent
+        """
+        sock = getattr(self, "_AgentEnvConfigLoader__socket", None)
+        if sock is not None:
+            sock.close()
+        self.__socket = None
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+binary protocol between the configuration agent (see agent.py) and its clients (see agent_env_conf_loader.py)
+
+    frame:    uint32 (big endian) payload length | payload
+    request:  uint8 opcode | fields
+    response: uint8 status | body (fields, or raw json bytes for LOAD / GET)
+    fields:   per field - uint32 (big endian) length | utf-8 bytes
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import os
+import struct
+import tempfile
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_AGENT_SOCKET = os.path.join(tempfile.gettempdir(), "configuration_client_agent.sock")
+
+# env, *fallback envs => served env, revision ("" when none)
+OP_RESOLVE = 1
+# => category names
+OP_LIST = 2
+# category => raw category json
+OP_LOAD = 3
+# category[, section[, key]] => json of the value
+OP_GET = 4
+# => current head revision of the served env ("" when unknown)
+OP_HEAD = 5
+# branch, revision ("" when none) => served env, revision - the branch served at exactly that revision
+OP_PIN = 6
+
+STATUS_OK = 0
+STATUS_NOT_FOUND = 1
+STATUS_ERROR = 2
+
+FRAME_HEADER = struct.Struct(">I")
+FIELD_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 256 * 1024 * 1024
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def encode_fields(fields):
+    parts = []
+    for field in fields:
+        data = field.encode("utf-8")
+        parts.append(FIELD_HEADER.pack(len(data)))
+        parts.append(data)
+    return b"".join(parts)
+
+
+def decode_fields(data):
+    fields = []
+    offset = 0
+    while offset < len(data):
+        (length,) = FIELD_HEADER.unpack_from(data, offset)
+        offset += FIELD_HEADER.size
+        fields.append(bytes(data[offset:offset + length]).decode("utf-8"))
+        offset += length
+    return fields
+
+
+def send_frame(sock, payload):
+    sock.sendall(FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock, size):
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            return None
+        received += count
+    return buffer
+
+
+def recv_frame(sock):
+    """
+    Returns:
+        bytearray -- the frame payload or None when the peer closed the connection
+    """
+    header = _recv_exact(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise Exception(f"Configuration agent frame of {length} bytes exceeds {MAX_FRAME_SIZE} bytes")
+    return _recv_exact(sock, length)
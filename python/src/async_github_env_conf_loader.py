@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+asyncio implementation of the github configuration repo reader
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import functools
+from .abstract_async_env_conf_loader import AsyncEnvConfigLoader, running_loop
+from .github_env_conf_loader import GithubEnvConfigLoader
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class AsyncGithubEnvConfigLoader(AsyncEnvConfigLoader):
+    """
+    Github environment aware config loader for coroutines.
+    Every blocking call of the wrapped loader (branch probe, listing, fetch + parse) is run on the
+    event loop's default executor, so awaiting it never blocks the loop and many loads can be gathered.
+
+    The wrapped loader keeps its pooled session and settings, so wrapping the very loader EnvConfig
+    already uses (see EnvConfig::aget) shares connections and the verified env with the sync API.
+    Any EnvConfigLoader can be wrapped, github is the default.
+    """
+
+    def __init__(self, loader=None):
+        super().__init__()
+        self.__loader = loader if loader is not None else GithubEnvConfigLoader()
+
+    async def __run(self, func, *args):
+        return await running_loop().run_in_executor(None, functools.partial(func, *args))
+
+    def set_version(self, version):
+        super().set_version(version)
+        self.__loader.set_version(version)
+
+    def set_options(self, options):
+        super().set_options(options)
+        self.__loader.set_options(options)
+
+    async def verify_env_or_fallback(self):
+        env_exists = await self.__run(self.__loader.set_env, self._env, self._fallback_list)
+        # the wrapped loader might have fallen back to another env
+        self._env = self.__loader._env
+        return env_exists
+
+    async def list_categories(self):
+        return await self.__run(self.__loader.list_categories)
+
+    async def load(self, category):
+        return await self.__run(self.__loader.load, category)
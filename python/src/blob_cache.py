@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+content addressed (git blob sha) cache of category files and their parsed json
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from .json_parsers import parse_json, DEFAULT_PARSER
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_BLOB_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "configuration_client", "blobs")
+# parsed blobs kept in memory (least recently used first out), the disk cache keeps all of them
+DEFAULT_MEMORY_ENTRIES = 64
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def git_blob_sha(content):
+    """
+    The sha git assigns to a file content (what the trees api reports per file)
+
+    Arguments:
+        content {bytes} -- file content
+    """
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class BlobCache:
+    """
+    Caches category files by their git blob sha - on disk (raw bytes) and in memory (parsed json).
+    As a blob sha identifies the content itself, an unchanged file is never downloaded or parsed twice,
+    whatever the branch (dynamic-* branches mostly share their files with the branch they were cut from).
+
+    The in memory parsed json is shared by all instances (the whole process) and must never be mutated
+    (EnvConfigContext::process works on a deep copy). It is bounded to the memory_entries most recently used blobs:
+    old blob versions (ex. replaced by a reload, or of envs no longer served) are dropped from memory.
+    """
+
+    __parsed = OrderedDict()
+    __max_parsed = DEFAULT_MEMORY_ENTRIES
+    __parsed_lock = threading.Lock()
+
+    def __init__(self, directory=DEFAULT_BLOB_CACHE_DIR, memory_entries=DEFAULT_MEMORY_ENTRIES):
+        self.__directory = os.path.expanduser(directory)
+        os.makedirs(self.__directory, exist_ok=True)
+        # process wide, as the parsed blobs themselves
+        BlobCache.__max_parsed = memory_entries
+
+    @staticmethod
+    def reset_after_fork():
+        # the lock might have been held by another thread of the parent while forking
+        BlobCache.__parsed_lock = threading.Lock()
+
+    def __blob_path(self, sha):
+        return os.path.join(self.__directory, sha[:2], sha)
+
+    def __read(self, sha):
+        try:
+            with open(self.__blob_path(sha), "rb") as blob_file:
+                content = blob_file.read()
+        except OSError:
+            return None
+
+        if git_blob_sha(content) != sha:
+            Logger.warning(f"Ignoring corrupted cached blob {sha}")
+            return None
+        return content
+
+    def __write(self, sha, content):
+        path = self.__blob_path(sha)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as blob_file:
+                blob_file.write(content)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            Logger.warning(f"Failed writing blob cache entry {sha}: {ex}")
+
+    def get_content(self, sha, fetch):
+        """
+        Raw content of the blob, from disk or else using fetch (verified against the sha and stored)
+
+        Arguments:
+            sha {str} -- git blob sha
+            fetch {callable} -- returns the blob content (bytes) from the remote
+        """
+        content = self.__read(sha)
+        if content is not None:
+            return content
+
+        content = fetch()
+        if git_blob_sha(content) != sha:
+            raise Exception(f"Fetched blob content does not match its sha {sha}")
+
+        self.__write(sha, content)
+        return content
+
+    def get_json(self, sha, fetch, parser=DEFAULT_PARSER):
+        """
+        Parsed content of the blob - see get_content and json_parsers::parse_json
+
+        Returns:
+            tuple -- (parsed json, name of the parser that parsed it)
+        """
+        # the same blob parsed by another parser might not parse the same (ex. json5 only syntax)
+        key = (sha, parser)
+        with BlobCache.__parsed_lock:
+            if key in BlobCache.__parsed:
+                BlobCache.__parsed.move_to_end(key)
+                return BlobCache.__parsed[key]
+
+        parsed = parse_json(self.get_content(sha, fetch), parser)
+
+        with BlobCache.__parsed_lock:
+            BlobCache.__parsed[key] = parsed
+            while len(BlobCache.__parsed) > max(BlobCache.__max_parsed, 0):
+                BlobCache.__parsed.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def clear_memory():
+        with BlobCache.__parsed_lock:
+            BlobCache.__parsed.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BlobCache.reset_after_fork)
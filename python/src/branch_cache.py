@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+persistent cache of resolved env branches (env + fallback list => branch and commit)
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import json
+import os
+import threading
+import time
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_BRANCH_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "configuration_client", "branches.json")
+DEFAULT_BRANCH_CACHE_TTL = 300
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class BranchCache:
+    """
+    Remembers, across process restarts, which branch (and commit) an env resolved to given its fallback list.
+    A resolution to a fallback branch is also the (negative) knowledge that the env branches before it
+    do not exist, so restarting processes skip their 404 probes altogether.
+    Entries expire after ttl seconds. A single json file, written atomically (last writer wins).
+    """
+
+    __lock = threading.Lock()
+
+    @staticmethod
+    def reset_after_fork():
+        # the lock might have been held by another thread of the parent while forking
+        BranchCache.__lock = threading.Lock()
+
+    def __init__(self, path=DEFAULT_BRANCH_CACHE_PATH, ttl=DEFAULT_BRANCH_CACHE_TTL):
+        self.__path = os.path.expanduser(path)
+        self.__ttl = ttl
+
+    @staticmethod
+    def __key(env, fallback_list):
+        return "|".join([env] + list(fallback_list))
+
+    def __read_all(self):
+        try:
+            with open(self.__path, "r") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, env, fallback_list):
+        """
+        Returns:
+            dict -- {"branch", "revision", "resolved_at"} or None when missing or expired
+        """
+        entry = self.__read_all().get(BranchCache.__key(env, fallback_list))
+        if entry is None or time.time() - entry["resolved_at"] > self.__ttl:
+            return None
+        return entry
+
+    def put(self, env, fallback_list, branch, revision):
+        with BranchCache.__lock:
+            entries = self.__read_all()
+            entries[BranchCache.__key(env, fallback_list)] = {
+                "branch": branch,
+                "revision": revision,
+                "resolved_at": time.time(),
+            }
+
+            tmp_path = f"{self.__path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+                with open(tmp_path, "w") as cache_file:
+                    json.dump(entries, cache_file)
+                os.replace(tmp_path, self.__path)
+            except OSError as ex:
+                Logger.warning(f"Failed writing resolved branch cache {self.__path}: {ex}")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=BranchCache.reset_after_fork)
@@ -49,3 +49,17 @@ def get_contextual_env():
 
     # default env context for dynamic branches
     return DEVELOPMENT_ENV_CONTEXT_NAME
+
+
+def get_config_folder(env, version):
+    """
+    The folder holding the category files of the provided env ("" for the root).
+    In version 2, files reside in a folder respective to the fixed environment (dev, qa staging etc)
+    """
+    if version != 2:
+        return ""
+
+    folder = env + "/"
+    if folder.startswith("dynamic-"):
+        folder = "dev/"  # TODO: should be base
+    return folder
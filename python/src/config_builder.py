@@ -1,18 +1,21 @@
 #!/usr/bin/env python
 
-import yaml
 import os
 import logging
 from .os_vars import OSVars
 from .env_config import EnvConfig
 from .config_context_handler import EnvConfigContext
 from .env_conf_loader_factory import EnvConfigLoaderFactory
+from .config_snapshot import ConfigSnapshot, DEFAULT_SNAPSHOT_DIR
+from .last_known_good import LastKnownGoodStore, DEFAULT_LAST_KNOWN_GOOD_DIR, DEFAULT_STARTUP_DEADLINE, DEFAULT_REVALIDATE_INTERVAL
 from .secrets import Secrets
 from .logger import Logger
 from .common import get_contextual_env
 
 yaml_type_to_python = {"String": str, "Bool": bool, "Int": int, "Float": float}
 
+DEFAULT_INVALIDATION_SECRET_VAR = "CONFIG_INVALIDATION_SECRET"
+
 
 class ConfigBuilder:
     def __init__(self, context):
@@ -59,20 +62,94 @@ class ConfigBuilder:
             Logger.info(f"Using configuration v{conf_version}")
 
         conf_loader.set_version(conf_version)
+        # loader specific settings (ex. "http" pool settings) are read from the config block itself
+        conf_loader.set_options(conf_data)
 
         if "parent_environments" in conf_data:
             EnvConfig.instance().set_env_fallback(conf_data["parent_environments"])
 
-        # injecting config loader (github, gitlab or whatever else)
-        EnvConfig.instance().set_loader(conf_loader)
-
         # injecting context handler and context data
-        EnvConfig.instance().set_context_handler(EnvConfigContext(EnvConfig.env()))
+        context_handler = EnvConfigContext(EnvConfig.env())
+        EnvConfig.instance().set_context_handler(context_handler)
         if self.__context is not None:
             for k, v in self.__context.items():
                 EnvConfig.add_context(k, v)
 
-        if "categories" not in conf_data:
+        self.__set_local_stores(conf_data, context_handler)
+
+        # read only loaded categories, returned as is by the accessors (or as plain copies, see EnvConfig::set_immutable)
+        if "immutable" in conf_data:
+            EnvConfig.instance().set_immutable(True, (conf_data["immutable"] or {}).get("plain_dicts", False))
+
+        # injecting config loader (github, gitlab or whatever else)
+        EnvConfig.instance().set_loader(conf_loader)
+
+        if "categories" in conf_data:
+            self.__load_categories(conf_data)
+            EnvConfig.instance().save_snapshot()
+        EnvConfig.instance().publish_shared_store()
+
+        self.__start_config_updates(conf_data)
+
+    def __set_local_stores(self, conf_data, context_handler):
+        # host wide shared configuration (one process loads, the others attach), per env and context
+        if "shared_store" in conf_data:
+            self.__set_shared_store(conf_data["shared_store"] or {}, context_handler)
+
+        # processed config snapshot, loaded by set_loader when matching the env commit and the context above
+        if "snapshot" in conf_data:
+            snapshot_dir = (conf_data["snapshot"] or {}).get("dir", DEFAULT_SNAPSHOT_DIR)
+            EnvConfig.instance().set_snapshot(ConfigSnapshot(snapshot_dir))
+
+        # last known good configuration, served when the env cannot be verified in time (source down or slow)
+        if "last_known_good" in conf_data:
+            last_known_good_conf = conf_data["last_known_good"] or {}
+            EnvConfig.instance().set_last_known_good(
+                LastKnownGoodStore(last_known_good_conf.get("dir", DEFAULT_LAST_KNOWN_GOOD_DIR)),
+                last_known_good_conf.get("startup_deadline", DEFAULT_STARTUP_DEADLINE),
+                last_known_good_conf.get("revalidate_interval", DEFAULT_REVALIDATE_INTERVAL),
+            )
+
+    def __set_shared_store(self, shared_store_conf, context_handler):
+        from .shared_config_store import SharedConfigStore, shared_store_name, DEFAULT_SEGMENT_SIZE_MB, DEFAULT_MAX_AGE
+
+        if not SharedConfigStore.is_supported():
+            Logger.warning("Shared configuration store requires python 3.8+ (multiprocessing.shared_memory), loading as usual")
+            return
+
+        EnvConfig.instance().set_shared_store(
+            SharedConfigStore(
+                shared_store_name(EnvConfig.env(), context_handler.fingerprint()),
+                shared_store_conf.get("size_mb", DEFAULT_SEGMENT_SIZE_MB),
+                shared_store_conf.get("max_age", DEFAULT_MAX_AGE),
+            )
+        )
+
+    def __start_config_updates(self, conf_data):
+        # opt-in hot reload of the loaded categories
+        if "refresh_interval" in conf_data and conf_data["refresh_interval"] > 0:
+            EnvConfig.instance().start_refresher(conf_data["refresh_interval"])
+
+        # opt-in pushed change notifications
+        if "invalidation" in conf_data:
+            self.__start_invalidation_listener(conf_data["invalidation"] or {})
+
+    def __start_invalidation_listener(self, invalidation_conf):
+        # the shared secret is never kept in the yaml itself
+        secret_var = invalidation_conf.get("secret_var", DEFAULT_INVALIDATION_SECRET_VAR)
+        if secret_var not in os.environ:
+            raise Exception(f"Configuration invalidation listener requires its shared secret in env var {secret_var}")
+
+        EnvConfig.instance().start_invalidation_listener(
+            os.environ[secret_var],
+            invalidation_conf.get("host"),
+            invalidation_conf.get("port", 0),
+        )
+
+    def __load_categories(self, conf_data):
+        # loading the declared categories concurrently when configured to do so
+        if "prefetch_workers" in conf_data and conf_data["prefetch_workers"] > 1:
+            EnvConfig.instance().prefetch_categories(conf_data["categories"], conf_data["prefetch_workers"])
             return
 
         for category in conf_data["categories"]:
@@ -125,6 +202,8 @@ class ConfigBuilder:
         if path_to_env_yaml is None:
             path = os.getcwd() + "/.envConfig.yml"
 
+        import yaml
+
         print(f"Attempting to read env config yaml from {path}")
         env_file = open(path, "r")
         data = yaml.load(env_file, Loader=yaml.Loader)
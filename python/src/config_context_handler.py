@@ -12,6 +12,8 @@ Base class and implementation of config context
 # IMPORT MODULES                                                            #
 #############################################################################
 import copy
+import hashlib
+import json
 import re
 from .logger import Logger
 from .common import ENV_VAR_NAME
@@ -96,6 +98,16 @@ class EnvConfigContext:
         Logger.debug(f"Adding context: {key} => {value}")
         self.__app_context_data[key] = value
 
+    def fingerprint(self):
+        """
+        A hash of the context data - processing the same config with the same fingerprint yields the same result
+
+        Returns:
+            str -- hex digest
+        """
+        serialized = json.dumps(self.__app_context_data, sort_keys=True, default=repr)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def __normalize(self, returned_json):
         # deleting the context declaration from the to-be-consumed config
         if CONTEXT_DECLARATION_KEY in returned_json:
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+binary snapshot of the fully processed configuration, for instant warm startups
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import os
+import threading
+from .logger import Logger
+from .marshal_file import MarshalFiles
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".cache", "configuration_client", "snapshots")
+
+SNAPSHOT_MAGIC = b"ECSNAP"
+SNAPSHOT_FORMAT_VERSION = 1
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def snapshot_key(env, revision, context_hash):
+    """
+    Digest identifying a processed configuration: same env, same commit and same app context
+    yield the very same processed categories
+    """
+    return hashlib.sha256(f"{env}\0{revision}\0{context_hash}".encode("utf-8")).digest()
+
+
+class ConfigSnapshot:
+    """
+    Stores the processed categories (post EnvConfigContext::process) of an env at a given commit and app context,
+    in a versioned binary file: a fixed header followed by a marshal payload (see MarshalFiles).
+    Loading is a single read and a marshal load - no fetching, no json parsing and no template processing.
+
+    Snapshots are keyed by env, commit sha and app context hash, so a stale snapshot is never served
+    (it simply does not match), and files of other versions of this format or of python are ignored.
+    """
+
+    def __init__(self, directory=DEFAULT_SNAPSHOT_DIR):
+        self.__files = MarshalFiles(directory, SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, "snap", "configuration snapshot")
+        self.__lock = threading.Lock()
+
+    def load(self, env, revision, context_hash):
+        """
+        Returns:
+            dict -- {"categories": listed category names, "config": category => processed config}
+                    or None when there is no (valid) snapshot for this key
+        """
+        return self.__files.read(snapshot_key(env, revision, context_hash))
+
+    def save(self, env, revision, context_hash, categories, config_json):
+        """
+        Arguments:
+            categories {list} -- the listed categories of the env (ex. ["GLOBAL", "SYSTEM"])
+            config_json {dict} -- category => processed config, of the loaded categories
+        """
+        key = snapshot_key(env, revision, context_hash)
+        with self.__lock:
+            if not self.__files.write(key, {"categories": list(categories), "config": config_json}):
+                return False
+
+        Logger.debug(f"Configuration snapshot of env {env} at {revision} saved to {self.__files.path(key)}")
+        return True
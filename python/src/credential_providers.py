@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+pluggable, memoized credentials (access tokens) for the remote config loaders
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import os
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from datetime import datetime
+from .secrets import Secrets
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+GIT_CONF_TOKEN_KEY = "GIT_CONFIG_TOKEN"
+DEFAULT_REFRESH_AHEAD = 300
+GITHUB_APP_JWT_TTL = 540
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class CredentialProvider(ABC):
+    """
+    A base class for any token source
+    """
+
+    @abstractmethod
+    def fetch(self):
+        """
+        Resolves a fresh token from the provider's source
+
+        Returns:
+            tuple -- (token, expires_at) where expires_at is an epoch time or None when the token never expires
+        """
+        pass
+
+
+class EnvCredentialProvider(CredentialProvider):
+    def __init__(self, var_name=GIT_CONF_TOKEN_KEY):
+        self.__var_name = var_name
+
+    def fetch(self):
+        return os.environ.get(self.__var_name), None
+
+
+class SecretsCredentialProvider(CredentialProvider):
+    def __init__(self, category="common", key=GIT_CONF_TOKEN_KEY):
+        self.__category = category
+        self.__key = key
+
+    def fetch(self):
+        return Secrets.instance().get(self.__category)[self.__key], None
+
+
+class FileCredentialProvider(CredentialProvider):
+    """
+    Token read from a file (ex. a mounted kubernetes secret). With ttl the file is read again every ttl seconds,
+    picking up rotated tokens
+    """
+
+    def __init__(self, path, ttl=None):
+        self.__path = os.path.expanduser(path)
+        self.__ttl = ttl
+
+    def fetch(self):
+        with open(self.__path, "r") as token_file:
+            token = token_file.read().strip()
+        return token, (time.time() + self.__ttl if self.__ttl is not None else None)
+
+
+class GithubAppCredentialProvider(CredentialProvider):
+    """
+    Github App installation access token (expires after an hour). Requires PyJWT with cryptography (RS256)
+    """
+
+    def __init__(self, app_id, installation_id, private_key_path, api_url="https://api.github.com"):
+        self.__app_id = app_id
+        self.__installation_id = installation_id
+        self.__private_key_path = os.path.expanduser(private_key_path)
+        self.__api_url = api_url
+
+    def __app_jwt(self):
+        try:
+            import jwt
+        except ImportError:
+            raise Exception("github-app credentials require the PyJWT package (pip install pyjwt[crypto])")
+
+        with open(self.__private_key_path, "r") as key_file:
+            private_key = key_file.read()
+
+        now = int(time.time())
+        # backdating a minute for clock drift, as github recommends
+        claims = {"iat": now - 60, "exp": now + GITHUB_APP_JWT_TTL, "iss": str(self.__app_id)}
+        return jwt.encode(claims, private_key, algorithm="RS256")
+
+    def fetch(self):
+        import requests
+
+        # API reference: https://docs.github.com/en/rest/apps/apps#create-an-installation-access-token-for-an-app
+        response = requests.post(
+            f"{self.__api_url}/app/installations/{self.__installation_id}/access_tokens",
+            headers={"Accept": "application/vnd.github+json", "Authorization": f"Bearer {self.__app_jwt()}"},
+            timeout=30,
+        )
+        if response.status_code != 201:
+            raise Exception(f"Could not create github app installation token, status code: {response.status_code}")
+
+        token_json = response.json()
+        expires_at = datetime.strptime(token_json["expires_at"], "%Y-%m-%dT%H:%M:%SZ")
+        return token_json["token"], (expires_at - datetime(1970, 1, 1)).total_seconds()
+
+
+class ChainCredentialProvider(CredentialProvider):
+    """
+    First provider yielding a token wins (the default chain is: env var, then vault common secret)
+    """
+
+    def __init__(self, providers):
+        self.__providers = providers
+
+    def fetch(self):
+        for provider in self.__providers:
+            token, expires_at = provider.fetch()
+            if token is not None and token != "":
+                return token, expires_at
+        return None, None
+
+
+class CachedCredentials:
+    """
+    Memoizes the token of a provider for the whole process.
+    A token is resolved once and served from memory until it gets close to its expiry (refresh_ahead seconds before):
+    from then on it is refreshed in the background while the still valid token keeps being served, so fetches
+    in progress are never blocked. Only a missing or already expired token is resolved synchronously.
+    """
+
+    # process wide count of actual token resolutions (all instances)
+    resolutions = 0
+    __resolutions_lock = threading.Lock()
+    # all instances, their state is reset in forked children (see reset_after_fork)
+    __instances = weakref.WeakSet()
+
+    def __init__(self, provider, refresh_ahead=DEFAULT_REFRESH_AHEAD):
+        self.__provider = provider
+        self.__refresh_ahead = refresh_ahead
+        self.__token = None
+        self.__expires_at = None
+        self.__lock = threading.Lock()
+        self.__refreshing = False
+        CachedCredentials.__instances.add(self)
+
+    @staticmethod
+    def reset_after_fork():
+        """
+        Called in forked children: the locks might have been held, and refreshes ahead been in progress, by threads
+        of the parent while forking - which are not forked along. The resolved tokens are kept.
+        """
+        CachedCredentials.__resolutions_lock = threading.Lock()
+        for credentials in list(CachedCredentials.__instances):
+            credentials.__lock = threading.Lock()
+            credentials.__refreshing = False
+
+    def __resolve(self):
+        token, expires_at = self.__provider.fetch()
+        with CachedCredentials.__resolutions_lock:
+            CachedCredentials.resolutions += 1
+
+        if token is None or token == "":
+            raise Exception(
+                f"Missing git configuration repo access token. See Vault::secret/common or set env var {GIT_CONF_TOKEN_KEY}"
+            )
+
+        self.__token, self.__expires_at = token, expires_at
+
+    def __refresh_in_background(self):
+        try:
+            self.__resolve()
+        except Exception as ex:
+            Logger.warning(f"Failed refreshing access token ahead of its expiry: {ex}")
+        finally:
+            self.__refreshing = False
+
+    def token(self):
+        now = time.time()
+
+        with self.__lock:
+            if self.__token is None or (self.__expires_at is not None and now >= self.__expires_at):
+                self.__resolve()
+                return self.__token
+
+            if self.__expires_at is not None and now >= self.__expires_at - self.__refresh_ahead and not self.__refreshing:
+                self.__refreshing = True
+                threading.Thread(target=self.__refresh_in_background, daemon=True).start()
+
+            return self.__token
+
+
+def create_credential_provider(options):
+    """
+    Builds the provider described by the "credentials" options block (default: env var then vault)
+
+    Arguments:
+        options {dict} -- ex. {"provider": "file", "path": "/var/run/secrets/git-token"}
+    """
+    provider_name = options.get("provider", "default")
+
+    if provider_name == "env":
+        return EnvCredentialProvider(options.get("var_name", GIT_CONF_TOKEN_KEY))
+    if provider_name == "secrets":
+        return SecretsCredentialProvider(options.get("category", "common"), options.get("key", GIT_CONF_TOKEN_KEY))
+    if provider_name == "file":
+        return FileCredentialProvider(options["path"], options.get("ttl"))
+    if provider_name == "github-app":
+        return GithubAppCredentialProvider(
+            options["app_id"], options["installation_id"], options["private_key_path"], options.get("api_url", "https://api.github.com")
+        )
+    if provider_name == "default":
+        return ChainCredentialProvider([EnvCredentialProvider(), SecretsCredentialProvider()])
+
+    raise Exception(f"Unknown credentials provider {provider_name}")
+
+
+_shared_credentials = {}
+_shared_credentials_lock = threading.Lock()
+
+
+def get_credentials(options):
+    """
+    The process wide memoized credentials of the provided "credentials" options block
+    (loaders configured alike share the very same token)
+    """
+    key = repr(sorted(options.items()))
+    with _shared_credentials_lock:
+        if key not in _shared_credentials:
+            _shared_credentials[key] = CachedCredentials(
+                create_credential_provider(options), options.get("refresh_ahead", DEFAULT_REFRESH_AHEAD)
+            )
+        return _shared_credentials[key]
+
+
+def _reset_after_fork():
+    global _shared_credentials_lock
+    _shared_credentials_lock = threading.Lock()
+    CachedCredentials.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,4 +1,5 @@
-from collections.abc import MutableMapping
+from collections.abc import Mapping
+from types import MappingProxyType
 import copy
 
 
@@ -6,20 +7,32 @@ def flatten_dict(d, parent_key="", sep="."):
     result = []
     for k, v in d.items():
         new_key = parent_key + sep + k if parent_key else k
-        if isinstance(v, MutableMapping):
+        if isinstance(v, Mapping):
             result.extend(flatten_dict(v, new_key, sep=sep).items())
         else:
             result.append((new_key, v))
     return dict(result)
 
 
+# every nested key path (leaves and intermediate dicts alike) => its value, ex. {"a": {"b": 1}} => {"a": {"b": 1}, "a.b": 1}
+def index_paths(d, parent_key="", sep=".", index=None):
+    if index is None:
+        index = {}
+    for k, v in d.items():
+        new_key = parent_key + sep + k if parent_key else k
+        index[new_key] = v
+        if isinstance(v, Mapping):
+            index_paths(v, new_key, sep, index)
+    return index
+
+
 # behaves more or less like Object.assign in JS (see unit tests)
 def override_dict(target, source):
     result = copy.deepcopy(target)
 
     for k, v in source.items():
         if k in result:
-            if not isinstance(result[k], MutableMapping):
+            if not isinstance(result[k], Mapping):
                 result[k] = v
             else:
                 result[k] = override_dict(result[k], v)
@@ -27,3 +40,21 @@ def override_dict(target, source):
             result[k] = v
 
     return result
+
+
+# read only (nested) copy: dicts become MappingProxyType and lists tuples
+def freeze_dict(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze_dict(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_dict(v) for v in value)
+    return value
+
+
+# plain (nested) copy of a frozen dict (see freeze_dict), ex. for serializing it
+def thaw_dict(value):
+    if isinstance(value, Mapping):
+        return {k: thaw_dict(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw_dict(v) for v in value]
+    return value
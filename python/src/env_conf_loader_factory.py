@@ -12,6 +12,8 @@ helper to generating a conf loader per strategy
 # IMPORT MODULES                                                            #
 #############################################################################
 
+import importlib
+
 
 #############################################################################
 # IMPLEMENTATION                                                            #
@@ -28,16 +30,20 @@ class EnvConfigLoaderFactory:
         Returns:
             EnvConfLoader concrete instance -- the sought after loader
         """
-        from .github_env_conf_loader import GithubEnvConfigLoader
-
+        # only the requested loader module (and its dependencies, ex. requests) is imported
         loaders_map = {
-            "github": GithubEnvConfigLoader,
-            "default": GithubEnvConfigLoader,
+            "github": (".github_env_conf_loader", "GithubEnvConfigLoader"),
+            "github-archive": (".github_archive_env_conf_loader", "GithubArchiveEnvConfigLoader"),
+            "local": (".local_dir_env_conf_loader", "LocalDirEnvConfigLoader"),
+            "git": (".git_env_conf_loader", "GitEnvConfigLoader"),
+            "agent": (".agent_env_conf_loader", "AgentEnvConfigLoader"),
+            "default": (".github_env_conf_loader", "GithubEnvConfigLoader"),
         }
 
-        loader = loaders_map["default"]
+        module_name, class_name = loaders_map["default"]
 
         if name is not None:
-            loader = loaders_map[name]
+            module_name, class_name = loaders_map[name]
 
+        loader = getattr(importlib.import_module(module_name, __package__), class_name)
         return loader()
@@ -13,13 +13,20 @@ type conversions and defaults
 # IMPORT MODULES                                                            #
 #############################################################################
 
+import atexit
+import gc
 import os
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from .env_conf_loader_factory import EnvConfigLoaderFactory
 from .os_vars import OSVars
 from .logger import Logger
 from .common import ENV_VAR_NAME
-from .dict_utils import flatten_dict
+from .dict_utils import flatten_dict, freeze_dict, index_paths, thaw_dict
+from .last_known_good import DEFAULT_STARTUP_DEADLINE, DEFAULT_REVALIDATE_INTERVAL, LAST_KNOWN_GOOD_SAVE_DELAY
+from .value_parsers import parse_bool, parse_bytes, parse_duration, parse_float, parse_int, parse_list
 
 #############################################################################
 # IMPLEMENTATION                                                            #
@@ -27,6 +34,12 @@ from .dict_utils import flatten_dict
 TWIST_ENV_KEY = ENV_VAR_NAME
 CONFIGURATION_BASE_KEY = "CONFIG_BASE_ENV"
 DEFAULT_ENV_FALLBACK = ["master"]
+DEFAULT_PREFETCH_WORKERS = 8
+DEFAULT_REFRESH_INTERVAL = 60
+# seconds categories lazily loaded by the publishing process are gathered for before being published together
+SHARED_REPUBLISH_DELAY = 1
+# tells a missing config value apart from any default value, see the typed accessors
+MISSING_VALUE = object()
 
 
 OSVars.register_mandatory(
@@ -106,8 +119,15 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
         EnvConfig.GENE("section1", "key5", "some_default") # yields "some_default"
         EnvConfig.GLOBAL("sectionX") # yields a dict having keys & values of "sectionX"
 
-    # TODO: support nested object accessor such as:
-        EnvConfig.SHIPPING("person/address/city", "name")
+    Nested values at any depth are accessed by their dotted path:
+
+        EnvConfig.get_path("shipping", "person.address.city.name", "some_default")
+
+    Typed accessors coerce a value once, and serve the coerced value until its category is reloaded:
+
+        EnvConfig.get_int("global", "timeouts", "retries", 3)
+        EnvConfig.get_duration("global", "timeouts", "http") # "1m30s" yields 90.0 (seconds)
+        EnvConfig.get_list("global", "hosts", "ports", item_type=int) # "80, 443" yields (80, 443)
     """
 
     TWIST_ENV_KEY = TWIST_ENV_KEY
@@ -146,11 +166,61 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
             Logger.info(
                 f"**** !!! PULLING CONFIGURATION from {self.__env} instead of {os.environ[TWIST_ENV_KEY]} because overriding {CONFIGURATION_BASE_KEY} is provided"
             )
+        # replaced as a whole on reload (see reload), readers take a single reference to it
         self.__config_json = {}
+        # category => Future of its in flight load (single flight, see __load_category)
+        self.__loads_in_flight = {}
+        self.__loads_lock = threading.Lock()
         # to be injected:
         self.__config_loader = None
+        # to be injected (or wrapping __config_loader on first awaitable access):
+        self.__async_loader = None
         # to be injected:
         self.__context = None
+        # to be injected (optional, see set_snapshot):
+        self.__snapshot = None
+        # (env, revision, context fingerprint) of the snapshot in use, and the categories it held when loaded
+        self.__snapshot_key = None
+        self.__snapshot_categories = set()
+        self.__snapshot_exit_hook = False
+        # opt-in hot reload (see start_refresher)
+        self.__refresher = None
+        self.__refresher_stop = None
+        self.__reload_lock = threading.Lock()
+        self.__last_reload = None
+        # opt-in pushed change notifications (see start_invalidation_listener)
+        self.__invalidation_listener = None
+        # to be injected (optional, see set_shared_store)
+        self.__shared_store = None
+        # generation of the shared configuration installed (attached processes only), and the published categories
+        # (None until published), lazily loaded categories are published again by a timer (see publish_shared_store)
+        self.__shared_generation = None
+        self.__shared_categories = None
+        self.__shared_republisher = None
+        # to be injected (optional, see set_last_known_good)
+        self.__last_known_good = None
+        self.__startup_deadline = DEFAULT_STARTUP_DEADLINE
+        self.__revalidate_interval = DEFAULT_REVALIDATE_INTERVAL
+        # categories to be saved to the last known good together (see __save_last_known_good): (env, context
+        # fingerprint, branch, revision, listed categories, category => config), and the timer saving them
+        self.__last_known_good_pending = None
+        self.__last_known_good_saver = None
+        self.__last_known_good_lock = threading.Lock()
+        self.__last_known_good_save_lock = threading.Lock()
+        self.__last_known_good_exit_hook = False
+        # serving the last known good rather than the current configuration, until revalidated
+        self.__stale = False
+        self.__revalidator = None
+        # pre-fork mode (see freeze): loaded categories are kept read only
+        self.__immutable = False
+        self.__plain_dicts = False
+        self.__frozen = False
+        self.__fork_hook = False
+        self.__refresh_interval = None
+        # category => (the category config indexed, its path => value index), see get_path
+        self.__path_indexes = {}
+        # category => (the category config coerced, its (section, key) => (parser, parser args, coerced value))
+        self.__typed_values = {}
         # the below is a Set - helper to hold collection of listed (yet not loaded) categories.
         self.__config_categories = {"___dummyKey__"}
         self.__env_fallback_list = DEFAULT_ENV_FALLBACK
@@ -159,6 +229,22 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
     def env():
         return EnvConfig.instance().__env
 
+    @staticmethod
+    def version():
+        """
+        The exact version of the loaded configuration (for github - the commit sha of the env branch
+        at verification time, all categories are read at that commit). Suitable as a cache key.
+
+        Returns:
+            str -- version identifier or None when the loader has no such notion
+        """
+        return EnvConfig.instance().__version()
+
+    def __version(self):
+        if self.__config_loader is None:
+            self.set_loader()
+        return self.__config_loader.revision()
+
     def set_env_fallback(self, fallback_list):
         """
         A list of environments that if the current running environment (indicated by TWIST_ENV)
@@ -180,21 +266,44 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
         if config_loader is None:
             config_loader = EnvConfigLoaderFactory().get_loader()
 
-        env_exists = config_loader.set_env(self.__env, self.__env_fallback_list)
-        if not env_exists:
-            Logger.error(
-                f"could not find configuration env using the following fallback list: {[self.__env] + self.__env_fallback_list}"
-            )
-            sys.exit(1)
+        # another process of the host published the processed configuration already - no verification needed
+        installed = self.__attach_shared_store(config_loader)
+        listed = None
+        if not installed:
+            env_exists, listed = self.__set_env(config_loader)
+            # the source is unreachable (or slow) - the last known good configuration is served meanwhile
+            if not env_exists and self.__last_known_good is not None:
+                stale_loader = self.__install_last_known_good(config_loader)
+                if stale_loader is not None:
+                    config_loader, env_exists, installed = stale_loader, True, True
+            if not env_exists:
+                Logger.error(
+                    f"could not find configuration env using the following fallback list: {[self.__env] + self.__env_fallback_list}"
+                )
+                sys.exit(1)
 
         Logger.debug(f"Config loader has been set to: {config_loader}")
 
         self.__config_loader = config_loader
-        # for the first time, query all environment existing categories.
-        self.__list_categories()
+        # for the first time, query all environment existing categories (unless the shared store, the last known good
+        # or a snapshot already lists them).
+        if not installed and not self.__load_snapshot():
+            self.__list_categories(listed)
+        self.__flush_last_known_good()
 
         EnvConfigMetaClass.env_conf_categories_loaded = True
 
+    def set_async_loader(self, async_loader):
+        """
+        Dependency injection of an awaitable config loader that adheres to the AsyncEnvConfigLoader interface.
+        Used by the awaitable accessors (aget, aprefetch) only, the loaded config is shared with the sync API.
+        Its env is expected to be set already (see AsyncEnvConfigLoader::set_env)
+
+        Arguments:
+            async_loader {AsyncEnvConfigLoader} -- the concrete awaitable configuration loader
+        """
+        self.__async_loader = async_loader
+
     def set_context_handler(self, context_handler):
         """
         Dependency injection of a config context processor that adheres to EnvConfigContext interface
@@ -204,6 +313,681 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
         """
         self.__context = context_handler
 
+    def set_snapshot(self, snapshot):
+        """
+        Dependency injection of a processed configuration snapshot store (see ConfigSnapshot).
+        When set before the loader (and after the context handler and its context data), a snapshot matching
+        the env, the loader revision and the context is loaded instead of listing, fetching and processing categories.
+        The loaded config is snapshotted by save_snapshot, and at process exit.
+
+        Arguments:
+            snapshot {ConfigSnapshot} -- the snapshot store, or None to stop using snapshots
+        """
+        self.__snapshot = snapshot
+        self.__snapshot_key = None
+        self.__snapshot_categories = set()
+
+        if snapshot is not None and not self.__snapshot_exit_hook:
+            # lazily loaded categories are snapshotted as well, for the next run
+            atexit.register(self.save_snapshot)
+            self.__snapshot_exit_hook = True
+
+    def __current_snapshot_key(self, config_loader=None):
+        config_loader = config_loader if config_loader is not None else self.__config_loader
+        revision = config_loader.revision() if config_loader is not None else None
+        if revision is None or self.__context is None:
+            return None
+        return self.__env, revision, self.__context.fingerprint()
+
+    def __load_snapshot(self):
+        """
+        Installs the snapshot matching the current env, loader revision and context (if any)
+
+        Returns:
+            bool -- whether a snapshot was loaded
+        """
+        if self.__snapshot is None:
+            return False
+
+        # loaders with no revision notion (or no context yet) cannot be snapshotted safely
+        self.__snapshot_key = self.__current_snapshot_key()
+        if self.__snapshot_key is None:
+            return False
+
+        snapshot_data = self.__snapshot.load(*self.__snapshot_key)
+        if snapshot_data is None:
+            return False
+
+        for category in snapshot_data["categories"]:
+            EnvConfig.load_configuration_category(category)
+        with self.__loads_lock:
+            for category, config in snapshot_data["config"].items():
+                self.__config_json.setdefault(category, self.__installable(config))
+        self.__snapshot_categories = set(snapshot_data["config"])
+        self.__save_last_known_good(snapshot_data["config"])
+
+        Logger.info(f"Loaded configuration snapshot of env {self.__env} at {self.__snapshot_key[1]}")
+        return True
+
+    def save_snapshot(self):
+        """
+        Snapshots the loaded configuration (when a snapshot store is set and something new was loaded)
+        """
+        if self.__snapshot is None or self.__snapshot_key is None:
+            return
+
+        # categories processed with another context (ex. context added after loading) must not be snapshotted
+        if self.__current_snapshot_key() != self.__snapshot_key:
+            Logger.debug("Configuration snapshot not saved, the loader revision or context changed since startup")
+            return
+
+        with self.__loads_lock:
+            config_json = dict(self.__config_json)
+        if set(config_json) == self.__snapshot_categories:
+            return
+        if self.__immutable:
+            config_json = thaw_dict(config_json)
+
+        categories = sorted(self.__config_categories - {"___dummyKey__"})
+        if self.__snapshot.save(*self.__snapshot_key, categories, config_json):
+            self.__snapshot_categories = set(config_json)
+
+    def set_shared_store(self, shared_store):
+        """
+        Dependency injection of a host wide shared configuration store (see SharedConfigStore), set before the loader.
+        When the store holds a (fresh) configuration it is attached to instead of verifying, listing and loading.
+        Otherwise the first process of the host loads it (the others wait for it, see set_loader) and publishes it
+        with publish_shared_store - categories it loads lazily later on are published again, SHARED_REPUBLISH_DELAY
+        seconds after. Attached processes refreshing (see start_refresher) follow the published generations, and once
+        the publisher stops publishing (ex. a recycled worker) one of them polls the env and publishes instead.
+
+        Arguments:
+            shared_store {SharedConfigStore} -- the shared store, or None to stop using it
+        """
+        self.__shared_store = shared_store
+        self.__shared_generation = None
+        self.__shared_categories = None
+
+    def __attach_shared_store(self, config_loader):
+        """
+        Installs the configuration published in the shared store (if any)
+
+        Returns:
+            bool -- whether attached
+        """
+        if self.__shared_store is None:
+            return False
+
+        shared = self.__shared_store.read()
+        if shared is None:
+            # a single process of the host loads and publishes, the others wait for it (lock held until published)
+            if not self.__shared_store.acquire_publisher_lock():
+                return False
+            shared = self.__shared_store.read()
+            if shared is None:
+                return False
+            self.__shared_store.release_publisher_lock()
+
+        config_loader.pin(shared["branch"], shared["revision"])
+        for category in shared["categories"]:
+            EnvConfig.load_configuration_category(category)
+        with self.__loads_lock:
+            self.__config_json = {category: self.__installable(config) for category, config in shared["config"].items()}
+        self.__shared_generation = shared["generation"]
+        self.__shared_categories = set(shared["config"])
+
+        Logger.info(f"Attached to shared configuration {self.__shared_store.name()} generation {shared['generation']}")
+        return True
+
+    def publish_shared_store(self):
+        """
+        Publishes the loaded configuration to the shared store (when set, and something new was loaded - or nothing
+        was published yet, so the listing alone is published when no category is loaded at startup) and lets the
+        processes waiting for it attach. Processes attached to the store never publish.
+        """
+        if self.__shared_store is None:
+            return
+
+        try:
+            with self.__loads_lock:
+                config_json = dict(self.__config_json)
+            if self.__config_loader is None or self.__shared_generation is not None or set(config_json) == self.__shared_categories:
+                return
+            # held since set_loader when publishing at startup, taken again for republishing (a single writer)
+            if not self.__shared_store.holds_publisher_lock() and not self.__shared_store.acquire_publisher_lock():
+                return
+
+            categories = sorted(self.__config_categories - {"___dummyKey__"})
+            if self.__immutable:
+                config_json = thaw_dict(config_json)
+            loader = self.__config_loader
+            if self.__shared_store.publish(loader.served_env(), loader.revision(), categories, config_json):
+                self.__shared_categories = set(config_json)
+        finally:
+            self.__shared_store.release_publisher_lock()
+
+    def __schedule_shared_store_publish(self):
+        # categories lazily loaded by the publishing process, once published at startup - published a batch at a time
+        if self.__shared_store is None or self.__shared_generation is not None or self.__shared_categories is None:
+            return
+        with self.__loads_lock:
+            if self.__shared_republisher is not None:
+                return
+            self.__shared_republisher = threading.Timer(SHARED_REPUBLISH_DELAY, self.__republish_shared_store)
+            self.__shared_republisher.daemon = True
+            self.__shared_republisher.start()
+
+    def __republish_shared_store(self):
+        with self.__loads_lock:
+            self.__shared_republisher = None
+        self.publish_shared_store()
+
+    @staticmethod
+    def __is_shared_store_advancing(shared, interval):
+        # the publisher polls (publishing or touching) every interval as well
+        return shared is not None and time.time() - shared["published_at"] <= 2 * interval
+
+    def __follow_shared_store(self, interval):
+        shared = self.__shared_store.read()
+        if not EnvConfig.__is_shared_store_advancing(shared, interval):
+            self.__take_over_shared_store(interval)
+            return
+        if shared["generation"] == self.__shared_generation:
+            return
+
+        loader = self.__config_loader._spawn()
+        loader.pin(shared["branch"], shared["revision"])
+        with self.__loads_lock:
+            # categories lazily loaded by this process only are dropped, loaded again on access
+            self.__config_loader = loader
+            self.__config_json = {category: self.__installable(config) for category, config in shared["config"].items()}
+        self.__async_loader = None
+        self.__shared_generation = shared["generation"]
+        self.__shared_categories = set(shared["config"])
+        Logger.info(f"Configuration of env {self.__env} updated to shared generation {shared['generation']} ({shared['revision']})")
+
+    def __take_over_shared_store(self, interval):
+        """
+        The shared configuration stopped advancing, its publisher is gone (ex. a recycled worker) - this process polls
+        the env and publishes from now on, unless another attached process took over meanwhile
+        """
+        if not self.__shared_store.acquire_publisher_lock():
+            return
+        try:
+            if EnvConfig.__is_shared_store_advancing(self.__shared_store.read(), interval):
+                # taken over by another process, followed on the next poll
+                return
+
+            Logger.info(f"Shared configuration {self.__shared_store.name()} is no longer published, taking over")
+            self.__shared_generation = None
+            self.__shared_categories = None
+            head_revision = self.__config_loader.head_revision()
+            if head_revision is not None and head_revision != self.__config_loader.revision():
+                # publishes the reloaded configuration
+                self.reload()
+            else:
+                self.publish_shared_store()
+        finally:
+            self.__shared_store.release_publisher_lock()
+
+    def set_last_known_good(self, last_known_good, startup_deadline=DEFAULT_STARTUP_DEADLINE, revalidate_interval=DEFAULT_REVALIDATE_INTERVAL):
+        """
+        Dependency injection of a last known good configuration store (see LastKnownGoodStore), set before the loader
+        (and after the context handler and its context data). Every successfully loaded category is saved to it -
+        together with the other categories loaded by the same prefetch or reload, lazily loaded ones are gathered for
+        LAST_KNOWN_GOOD_SAVE_DELAY seconds first (and saved at process exit at the latest).
+        When the env cannot be verified and listed (source down, or slower than startup_deadline) the last known good
+        is served right away instead of exiting, and the configuration is reloaded in the background (every
+        revalidate_interval seconds until it succeeds, see reload). Meanwhile is_stale is True. With no stored configuration yet (ex. first
+        deploy), the source is waited for as usual. Categories failing to load later on are served from it as well.
+
+        Arguments:
+            last_known_good {LastKnownGoodStore} -- the store, or None to stop using it
+
+        Keyword Arguments:
+            startup_deadline {float} -- seconds the env verification may take (default: {DEFAULT_STARTUP_DEADLINE})
+            revalidate_interval {float} -- seconds between background reloads while stale (default: {DEFAULT_REVALIDATE_INTERVAL})
+        """
+        # categories pending for the previous store are saved to it
+        self.__flush_last_known_good()
+        self.__last_known_good = last_known_good
+        self.__startup_deadline = startup_deadline
+        self.__revalidate_interval = revalidate_interval
+
+        if last_known_good is not None and not self.__last_known_good_exit_hook:
+            atexit.register(self.__flush_last_known_good)
+            self.__last_known_good_exit_hook = True
+
+    @staticmethod
+    def is_stale():
+        """
+        Returns:
+            bool -- whether the last known good configuration is served (the source could not be reached)
+        """
+        return EnvConfig.instance().__stale
+
+    def __has_last_known_good(self):
+        if self.__last_known_good is None or self.__context is None:
+            return False
+        self.__flush_last_known_good()
+        return self.__last_known_good.load(self.__env, self.__context.fingerprint()) is not None
+
+    def __set_env(self, config_loader):
+        """
+        Verifies the env - and lists its categories too, when the last known good can be served instead of both
+
+        Returns:
+            tuple -- (whether the env exists, the listed category file names or None when not listed)
+        """
+        # nothing to serve instead (ex. first deploy or a new context) - waiting for the source as long as it takes
+        if not self.__has_last_known_good():
+            return config_loader.set_env(self.__env, self.__env_fallback_list), None
+
+        # verified and listed on another thread, so startup never waits longer than the deadline (nor fails) on the source
+        started = Future()
+
+        def start():
+            try:
+                env_exists = config_loader.set_env(self.__env, self.__env_fallback_list)
+                snapshot_key = self.__current_snapshot_key(config_loader)
+                # a matching snapshot lists the categories itself (see __load_snapshot)
+                if not env_exists or (self.__snapshot is not None and snapshot_key is not None and self.__snapshot.load(*snapshot_key)):
+                    started.set_result((env_exists, None))
+                else:
+                    started.set_result((True, config_loader.list_categories()))
+            except BaseException as ex:
+                started.set_exception(ex)
+
+        threading.Thread(target=start, name="env-config-startup", daemon=True).start()
+        try:
+            return started.result(timeout=self.__startup_deadline)
+        except Exception as ex:
+            Logger.warning(f"Configuration env {self.__env} could not be verified and listed within {self.__startup_deadline}s: {ex!r}")
+            return False, None
+
+    def __install_last_known_good(self, config_loader):
+        """
+        Installs the last known good configuration of the env and context (if any)
+
+        Returns:
+            EnvConfigLoader -- a loader pinned to the last known good branch and revision, or None when there is none
+        """
+        self.__flush_last_known_good()
+        stored = None if self.__context is None else self.__last_known_good.load(self.__env, self.__context.fingerprint())
+        if stored is None:
+            return None
+
+        # the loader might still be verifying in the background, a pinned copy of it is served instead
+        loader = config_loader._spawn()
+        loader.pin(stored["branch"], stored["revision"])
+        for category in stored["categories"]:
+            EnvConfig.load_configuration_category(category)
+        with self.__loads_lock:
+            self.__config_json = {category: self.__installable(config) for category, config in stored["config"].items()}
+
+        self.__mark_stale(f"serving the last known good configuration of {stored['branch']} at {stored['revision']}")
+        return loader
+
+    def __last_known_good_category(self, category, reason):
+        """
+        Returns:
+            dict -- the category from the last known good configuration (marking the configuration stale),
+                    or None when there is no such store or category
+        """
+        if self.__last_known_good is None or self.__context is None:
+            return None
+        self.__flush_last_known_good()
+        stored = self.__last_known_good.load(self.__env, self.__context.fingerprint())
+        if stored is None or category not in stored["config"]:
+            return None
+
+        self.__mark_stale(f"serving category {category} from the last known good configuration at {stored['revision']} ({reason})")
+        return self.__installable(stored["config"][category])
+
+    def __save_last_known_good(self, config_json):
+        """
+        Adds the loaded categories to the pending last known good save, each save rewriting the whole store - so
+        the categories of a prefetch or reload are saved at once (see __flush_last_known_good), and lazily loaded
+        ones by a timer once LAST_KNOWN_GOOD_SAVE_DELAY seconds passed
+        """
+        if self.__last_known_good is None or self.__stale or self.__context is None or self.__config_loader is None:
+            return
+        loader = self.__config_loader
+        # loaders log and yield {} when failing to fetch or parse - never saved over a good one
+        config_json = {category: config for category, config in config_json.items() if config != {}}
+        if loader.revision() is None or len(config_json) == 0:
+            return
+
+        if self.__immutable:
+            config_json = thaw_dict(config_json)
+        categories = sorted(self.__config_categories - {"___dummyKey__"})
+        key = (self.__env, self.__context.fingerprint(), loader.served_env(), loader.revision())
+
+        with self.__last_known_good_lock:
+            pending = self.__last_known_good_pending
+            # categories of a previous revision are dropped by the store anyway
+            pending_json = pending[5] if pending is not None and pending[:4] == key else {}
+            pending_json.update(config_json)
+            self.__last_known_good_pending = (*key, categories, pending_json)
+
+            if self.__last_known_good_saver is None:
+                self.__last_known_good_saver = threading.Timer(LAST_KNOWN_GOOD_SAVE_DELAY, self.__flush_last_known_good)
+                self.__last_known_good_saver.daemon = True
+                self.__last_known_good_saver.start()
+
+    def __flush_last_known_good(self):
+        # saves are serialized, so a pending save of a previous revision never lands after the current one
+        with self.__last_known_good_save_lock:
+            with self.__last_known_good_lock:
+                pending, self.__last_known_good_pending = self.__last_known_good_pending, None
+                if self.__last_known_good_saver is not None:
+                    self.__last_known_good_saver.cancel()
+                    self.__last_known_good_saver = None
+            if pending is not None and self.__last_known_good is not None:
+                self.__last_known_good.save(*pending)
+
+    def __mark_stale(self, reason):
+        Logger.warning(f"Configuration of env {self.__env} is stale, {reason}")
+        self.__stale = True
+        if self.__revalidator is None or not self.__revalidator.is_alive():
+            self.__revalidator = threading.Thread(target=self.__revalidate, name="env-config-revalidator", daemon=True)
+            self.__revalidator.start()
+
+    def __revalidate(self):
+        while True:
+            # also waiting for set_loader to install the stale loader first
+            time.sleep(self.__revalidate_interval)
+            if not self.__stale:
+                return
+            if self.__config_loader is not None and self.reload():
+                return
+
+    def start_refresher(self, interval=DEFAULT_REFRESH_INTERVAL):
+        """
+        Opt-in hot reload: a daemon thread polling the head revision of the env (see EnvConfigLoader::head_revision)
+        every interval seconds, and reloading the configuration once it moved (see reload)
+
+        Keyword Arguments:
+            interval {float} -- seconds between polls (default: {DEFAULT_REFRESH_INTERVAL})
+        """
+        if self.__refresher is not None and self.__refresher.is_alive():
+            return
+
+        self.__refresh_interval = interval
+        self.__refresher_stop = threading.Event()
+        self.__refresher = threading.Thread(
+            target=self.__poll_head_revision, args=(interval, self.__refresher_stop), name="env-config-refresher", daemon=True
+        )
+        self.__refresher.start()
+
+    def stop_refresher(self):
+        if self.__refresher is None:
+            return
+        self.__refresher_stop.set()
+        self.__refresher.join()
+        self.__refresher = None
+        self.__refresh_interval = None
+
+    def __poll_head_revision(self, interval, stop):
+        while not stop.wait(interval):
+            try:
+                # attached to a shared configuration - its publisher polls, this process only follows it
+                if self.__shared_store is not None and self.__shared_generation is not None:
+                    self.__follow_shared_store(interval)
+                    continue
+
+                head_revision = self.__config_loader.head_revision()
+                if head_revision is not None and head_revision != self.__config_loader.revision():
+                    Logger.info(f"Configuration env {self.__env} moved to {head_revision}, reloading")
+                    self.reload()
+                elif self.__shared_store is not None:
+                    # still current (or no head to check), keeping the published configuration from being taken over
+                    self.__shared_store.touch()
+            except Exception as ex:
+                Logger.warning(f"Failed refreshing configuration of env {self.__env}: {ex}")
+
+    def reload(self, categories=None, expected_revision=None):
+        """
+        Reloads the configuration at the current head of the env: the env is resolved again by a new loader,
+        and every loaded category is fetched, processed and validated again. Only when all of them succeed,
+        the new configuration replaces the loaded one at once - readers see either the old or the new one.
+        On any failure the loaded configuration is kept.
+
+        Keyword Arguments:
+            categories {list} -- only these loaded categories changed (others are kept as is) or None for all of them
+            expected_revision {str} -- the revision the categories changed at, when the env resolves to another
+                                       revision (ex. moved again since) all loaded categories are reloaded
+
+        Returns:
+            bool -- whether the configuration was reloaded
+        """
+        with self.__reload_lock:
+            started = time.perf_counter()
+            try:
+                loader, listed, config_json, reloaded = self.__load_revision(categories, expected_revision)
+            except Exception as ex:
+                Logger.error(f"Configuration of env {self.__env} not reloaded, keeping revision {self.__version()}: {ex}")
+                return False
+
+            with self.__loads_lock:
+                # categories lazily loaded meanwhile (from the previous revision) are dropped, loaded again on access
+                self.__config_loader = loader
+                self.__config_json = config_json
+            if self.__stale:
+                Logger.info(f"Configuration of env {self.__env} revalidated, no longer serving the last known good")
+                self.__stale = False
+            self.__save_last_known_good(config_json)
+            self.__flush_last_known_good()
+            # the awaitable accessors wrap the new loader on their next access
+            self.__async_loader = None
+
+            for category in listed:
+                if category not in self.__config_categories:
+                    EnvConfig.load_configuration_category(category)
+
+            self.__last_reload = {
+                "revision": loader.revision(),
+                "categories": len(config_json),
+                "reloaded": reloaded,
+                "duration_ms": (time.perf_counter() - started) * 1000,
+            }
+            Logger.info(
+                f"Configuration of env {self.__env} reloaded to revision {self.__last_reload['revision']} "
+                f"({reloaded} of {len(config_json)} categories) in {self.__last_reload['duration_ms']:.1f} ms"
+            )
+
+            if self.__snapshot is not None:
+                self.__snapshot_key = self.__current_snapshot_key()
+                self.__snapshot_categories = set()
+                self.save_snapshot()
+            if self.__shared_store is not None and self.__shared_generation is None:
+                self.__shared_categories = None
+                self.publish_shared_store()
+            return True
+
+    def __load_revision(self, changed_categories, expected_revision):
+        loader = self.__config_loader._spawn()
+        if not loader.set_env(self.__env, self.__env_fallback_list):
+            raise Exception(f"could not find configuration env using the fallback list: {[self.__env] + self.__env_fallback_list}")
+
+        if changed_categories is not None and (expected_revision is None or loader.revision() != expected_revision):
+            Logger.info(f"Env {self.__env} resolved to {loader.revision()} rather than {expected_revision}, reloading all categories")
+            changed_categories = None
+
+        listed = {c.replace(".json", "").upper() for c in loader.list_categories()}
+        current = self.__config_json
+
+        def reload_category(category):
+            if category.upper() not in listed:
+                raise Exception(f"category {category} no longer exists")
+            raw_json = loader.load(category)
+            # loaders log and yield {} when failing to fetch or parse
+            if raw_json == {} and current[category] != {}:
+                raise Exception(f"category {category} could not be fetched or parsed")
+            return self.__installable(self.__context.process(raw_json))
+
+        categories = [c for c in current if changed_categories is None or c in changed_categories]
+        config_json = dict(current)
+        if len(categories) > 0:
+            with ThreadPoolExecutor(max_workers=min(DEFAULT_PREFETCH_WORKERS, len(categories))) as executor:
+                config_json.update(zip(categories, executor.map(reload_category, categories)))
+
+        return loader, listed, config_json, len(categories)
+
+    def notify_change(self, branch, revision, files=None):
+        """
+        Handles a change notification (see InvalidationListener): changes of branches other than the served env
+        (or the requested env when served from a fallback) are ignored, otherwise only the loaded categories held
+        by the changed files are reloaded
+
+        Arguments:
+            branch {str} -- the changed branch
+            revision {str} -- the commit it changed to
+
+        Keyword Arguments:
+            files {list} -- the changed repo file paths or None when unknown (default: {None})
+
+        Returns:
+            bool -- whether the configuration was reloaded
+        """
+        loader = self.__config_loader
+        if loader is None or branch not in [loader.served_env(), self.__env]:
+            return False
+
+        if branch != loader.served_env():
+            # the requested env branch showed up (or changed) while serving a fallback
+            return self.reload()
+
+        if revision == loader.revision():
+            return False
+
+        changed_categories = None if files is None else loader.categories_of_paths(files)
+        return self.reload(changed_categories, revision)
+
+    def start_invalidation_listener(self, secret, host=None, port=0):
+        """
+        Opt-in pushed change notifications: a local http listener reloading the changed categories
+        on every authenticated notification (see InvalidationListener, notify_change)
+
+        Arguments:
+            secret {str} -- the shared secret notifications are signed with
+
+        Keyword Arguments:
+            host {str} -- interface to listen on (default: {None} - invalidation_listener.DEFAULT_LISTENER_HOST)
+            port {int} -- port to listen on (default: {0} - any free port)
+
+        Returns:
+            InvalidationListener -- the started listener (ex. listener.url)
+        """
+        if self.__invalidation_listener is None:
+            from .invalidation_listener import InvalidationListener, DEFAULT_LISTENER_HOST
+
+            self.__invalidation_listener = InvalidationListener(secret, self.notify_change, host or DEFAULT_LISTENER_HOST, port).start()
+        return self.__invalidation_listener
+
+    def stop_invalidation_listener(self):
+        if self.__invalidation_listener is None:
+            return
+        self.__invalidation_listener.stop()
+        self.__invalidation_listener = None
+
+    @staticmethod
+    def last_reload():
+        """
+        Returns:
+            dict -- {"revision", "categories", "reloaded", "duration_ms"} of the latest reload or None when never reloaded
+        """
+        return EnvConfig.instance().__last_reload
+
+    @staticmethod
+    def freeze():
+        """
+        Pre-fork mode: call once the configuration is loaded in the parent process of a pre-fork server (ex. the
+        gunicorn master, with preload_app) and right before its workers fork, for the workers to share the loaded
+        configuration pages with it (copy on write) rather than each holding a copy:
+        - loaded (and later loaded or reloaded) categories are converted to read only structures (see set_immutable)
+        - the objects allocated so far are moved out of reach of the cyclic garbage collector (gc.freeze, python 3.7+),
+          whose collections would otherwise write to (and so copy) every page holding them
+        - forked children drop the loader connections (and the vault client, see Secrets) shared with the parent,
+          reset the locks of the process wide credentials and caches (see CachedCredentials::reset_after_fork),
+          and restart the refresher (see start_refresher) when running - the invalidation listener remains the parent's
+        """
+        EnvConfig.instance().__freeze()
+
+    def __freeze(self):
+        self.set_immutable(True, self.__plain_dicts)
+        self.__frozen = True
+
+        if not self.__fork_hook and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.__after_fork_in_child)
+            self.__fork_hook = True
+
+        # the garbage left over is collected first, freed memory must not end up in (shared) frozen pages
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()
+        Logger.info(f"Configuration of env {self.__env} frozen ({len(self.__config_json)} categories)")
+
+    @staticmethod
+    def is_frozen():
+        return EnvConfig.instance().__frozen
+
+    def set_immutable(self, immutable=True, plain_dicts=False):
+        """
+        Read only mode: loaded (and later loaded or reloaded) categories are converted to read only structures
+        (see dict_utils::freeze_dict - dicts become MappingProxyType and lists tuples), which the accessors return
+        as is - callers can no longer mutate the loaded config by accident, and need no defensive copies of it.
+
+        Keyword Arguments:
+            immutable {bool} -- read only mode on, or off to store plain dicts again (default: {True})
+            plain_dicts {bool} -- compatibility, for callers still expecting dicts and lists: accessors return
+                                  plain (mutable) copies of the read only structures (default: {False})
+        """
+        if not immutable and self.__frozen:
+            raise Exception("Frozen configuration (see freeze) cannot be made mutable again")
+
+        with self.__loads_lock:
+            self.__immutable = immutable
+            self.__plain_dicts = immutable and plain_dicts
+            convert = freeze_dict if immutable else thaw_dict
+            self.__config_json = {category: convert(config) for category, config in self.__config_json.items()}
+
+    @staticmethod
+    def is_immutable():
+        return EnvConfig.instance().__immutable
+
+    def __served(self, value):
+        return thaw_dict(value) if self.__plain_dicts else value
+
+    def __installable(self, config):
+        return freeze_dict(config) if self.__immutable else config
+
+    def __after_fork_in_child(self):
+        # locks might have been held by threads of the parent while forking, and their loads never complete here
+        self.__loads_lock = threading.Lock()
+        self.__reload_lock = threading.Lock()
+        self.__loads_in_flight = {}
+        # the parent saves its own pending categories, its saver timer is not forked along
+        self.__last_known_good_lock = threading.Lock()
+        self.__last_known_good_save_lock = threading.Lock()
+        self.__last_known_good_pending = None
+        self.__last_known_good_saver = None
+        self.__shared_republisher = None
+
+        if self.__config_loader is not None:
+            self.__config_loader.reset_connections()
+        # the awaitable accessors wrap the (reset) loader on their next access
+        self.__async_loader = None
+
+        # threads are not forked along
+        self.__invalidation_listener = None
+        self.__revalidator = None
+        if self.__stale:
+            self.__mark_stale("revalidating in the forked process")
+        if self.__refresher is not None:
+            self.__refresher = None
+            self.start_refresher(self.__refresh_interval)
+
     @staticmethod
     def add_context(key, val):
         EnvConfig.instance().__context.add(key, val)
@@ -220,19 +1004,218 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
 
         try:
             raw_json = self.__config_loader.load(category.lower())
-            return self.__context.process(raw_json)
+        except Exception as ex:
+            return self.__failed_config(category, ex)
+        return self.__processed_config(category, raw_json)
+
+    def __failed_config(self, category, ex):
+        """
+        Returns:
+            dict -- the category from the last known good configuration, when loading it failed (exits when none)
+        """
+        raw_json = self.__last_known_good_category(category, ex)
+        if raw_json is None:
+            Logger.error(
+                f"Failed loading config for provided environment {self.__env}. Exception: {ex}"
+            )
+            sys.exit(1)
+        return raw_json
+
+    def __processed_config(self, category, raw_json):
+        # loaders log and yield {} when failing to fetch or parse
+        if raw_json == {}:
+            last_known_good = self.__last_known_good_category(category, "fetched empty")
+            if last_known_good is not None:
+                return last_known_good
+
+        try:
+            return self.__installable(self.__context.process(raw_json))
         except Exception as ex:
             Logger.error(
                 f"Failed loading config for provided environment {self.__env}. Exception: {ex}"
             )
             sys.exit(1)
 
+    def __start_load(self, category):
+        """
+        Joins the in flight load of a category or starts it (see __load_category).
+
+        Returns:
+            tuple -- (the config_json to install the load into, the loaded category config when already loaded,
+                      the Future of the in flight load - None when already loaded, whether the caller is the loader)
+        """
+        with self.__loads_lock:
+            config_json = self.__config_json
+            if category in config_json:
+                return config_json, config_json[category], None, False
+
+            in_flight = self.__loads_in_flight.get(category)
+            if in_flight is not None:
+                return config_json, None, in_flight, False
+            in_flight = self.__loads_in_flight[category] = Future()
+            return config_json, None, in_flight, True
+
+    def __fail_load(self, category, in_flight, ex):
+        # failure is shared with the waiters, the next access tries again
+        with self.__loads_lock:
+            del self.__loads_in_flight[category]
+        in_flight.set_exception(ex)
+
+    def __finish_load(self, category, config_json, in_flight, loaded):
+        """
+        Returns:
+            bool -- whether the loaded category was installed
+        """
+        with self.__loads_lock:
+            # loaded from the previous revision while reloading - not installed, the next access loads it again
+            installed = self.__config_json is config_json
+            if installed:
+                config_json[category] = loaded
+            del self.__loads_in_flight[category]
+        in_flight.set_result(loaded)
+
+        if installed:
+            self.__schedule_shared_store_publish()
+        return installed
+
+    def __load_category(self, category):
+        """
+        Single flight loading of a category into the loaded config: the first caller loads it while concurrent
+        callers of the same category wait for that very load and share its result (or its failure).
+        Different categories load concurrently.
+
+        Returns:
+            dict -- the loaded category config
+        """
+        config_json, loaded, in_flight, is_loader = self.__start_load(category)
+        if in_flight is None:
+            return loaded
+        if not is_loader:
+            return in_flight.result()
+
+        try:
+            loaded = self.__load_config(category)
+        except BaseException as ex:
+            self.__fail_load(category, in_flight, ex)
+            raise
+
+        if self.__finish_load(category, config_json, in_flight, loaded):
+            self.__save_last_known_good({category: loaded})
+        return loaded
+
+    async def __aload_category(self, category):
+        """
+        awaitable version of __load_category, sharing its in flight loads with the sync accessors
+
+        Returns:
+            tuple -- (the loaded category config, whether this very call installed it)
+        """
+        import asyncio
+
+        config_json, loaded, in_flight, is_loader = self.__start_load(category)
+        if in_flight is None:
+            return loaded, False
+        if not is_loader:
+            return await asyncio.wrap_future(in_flight), False
+
+        try:
+            loaded = await self.__aload_config(category)
+        except BaseException as ex:
+            self.__fail_load(category, in_flight, ex)
+            raise
+
+        return loaded, self.__finish_load(category, config_json, in_flight, loaded)
+
+    async def __aload_config(self, category):
+        """
+        awaitable version of __load_config, using the injected async loader
+        """
+        try:
+            raw_json = await self.__async_loader.load(category.lower())
+        except Exception as ex:
+            return self.__failed_config(category, ex)
+        return self.__processed_config(category, raw_json)
+
+    async def __ensure_async_loader(self):
+        # first access ever - the env verification and listing are blocking, keep them off the event loop
+        if self.__config_loader is None:
+            from .abstract_async_env_conf_loader import running_loop
+
+            await running_loop().run_in_executor(None, self.set_loader)
+
+        if self.__async_loader is None:
+            from .async_github_env_conf_loader import AsyncGithubEnvConfigLoader
+
+            self.__async_loader = AsyncGithubEnvConfigLoader(self.__config_loader)
+
+    @staticmethod
+    async def aprefetch(categories):
+        """
+        Awaitable, concurrent (asyncio.gather) loading of the provided categories.
+        Already loaded categories are skipped, the rest are installed as each is loaded - sharing the in flight
+        loads of the sync accessors (see load_configuration_category).
+
+        Arguments:
+            categories {list} -- category names (ex. ["GLOBAL", "SYSTEM"])
+        """
+        await EnvConfig.instance().__aprefetch(categories)
+
+    async def __aprefetch(self, categories):
+        await self.__ensure_async_loader()
+
+        import asyncio
+
+        missing = [c.lower() for c in dict.fromkeys(categories) if c.lower() not in self.__config_json]
+        loads = await asyncio.gather(*[self.__aload_category(category) for category in missing])
+
+        installed = {category: loaded for category, (loaded, is_installed) in zip(missing, loads) if is_installed}
+        if installed:
+            self.__save_last_known_good(installed)
+            self.__flush_last_known_good()
+
+    @staticmethod
+    async def aget(category, section, key, default_value=None):
+        """
+        Awaitable version of the main configuration accessor (see get).
+        The first access to a category fetches it without blocking the event loop.
+        """
+        await EnvConfig.instance().__aprefetch([category])
+        return EnvConfig.instance().__served(EnvConfig.instance().__get(category.lower(), section, key, default_value))
+
     def require_category(self, category):
         EnvConfig.load_configuration_category(category)
-        self.__config_json[category.lower()] = self.__load_config(category)
+        # already loaded (ex. by an earlier get) or being loaded - no need to fetch it again
+        self.__load_category(category.lower())
+
+    def prefetch_categories(self, categories, max_workers=DEFAULT_PREFETCH_WORKERS):
+        """
+        Concurrent version of require_category for many categories at once.
+        Fetching, parsing and context processing run on a bounded thread pool, each category is installed
+        into the loaded config once loaded (accessors of a category being prefetched wait for it).
+
+        Arguments:
+            categories {list} -- category names (ex. ["GLOBAL", "SYSTEM"])
 
-    def __list_categories(self):
-        categories = self.__config_loader.list_categories()
+        Keyword Arguments:
+            max_workers {int} -- max concurrent loads (default: {DEFAULT_PREFETCH_WORKERS})
+        """
+        for category in categories:
+            EnvConfig.load_configuration_category(category)
+
+        # unique, not yet loaded categories (keeping declaration order)
+        missing = [c.lower() for c in dict.fromkeys(categories) if c.lower() not in self.__config_json]
+        if len(missing) == 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            # consuming the results, so failures are raised
+            list(executor.map(self.__load_category, missing))
+        # the prefetched categories are saved to the last known good at once
+        self.__flush_last_known_good()
+
+    def __list_categories(self, categories=None):
+        if categories is None:
+            categories = self.__config_loader.list_categories()
         for category in categories:
             normalized_category = category.replace(".json", "").upper()
             EnvConfig.load_configuration_category(normalized_category)
@@ -240,7 +1223,7 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
     @staticmethod
     def __generate_get_function(func_name):
         def _func(self, section, key, default_value=None):
-            return self.__get(func_name.lower(), section, key, default_value)
+            return self.__served(self.__get(func_name.lower(), section, key, default_value))
 
         return _func
 
@@ -305,7 +1288,131 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
         Returns:
             any -- value associated with section/key. Can be as simple as string or int or as complex as a whole dict
         """
-        return EnvConfig.instance().__get(category.lower(), section, key, default_value)
+        return EnvConfig.instance().__served(EnvConfig.instance().__get(category.lower(), section, key, default_value))
+
+    @staticmethod
+    def get_path(category, path, default_value=None):
+        """
+        Nested configuration accessor, at any depth.
+        Served from an index of all of the category key paths, built on first access to the loaded category
+        (and again once the category is replaced, ex. reloaded) - a single dict lookup per access.
+
+        Arguments:
+            category {string} -- name of category for the queried config
+            path {string} -- dot separated keys path (ex. "person.address.city.name"), keys holding dots cannot be reached
+
+        Keyword Arguments:
+            default_value {any} -- default value to use when the path isn't present in loaded config data (default: {None})
+
+        Returns:
+            any -- value at the provided path
+        """
+        return EnvConfig.instance().__get_path(category.lower(), path, default_value)
+
+    def __get_path(self, category, path, default_value=None):
+        indexed = self.__path_indexes.get(category)
+        # the index of a replaced category object (ex. reloaded) is stale
+        if indexed is None or indexed[0] is not self.__config_json.get(category):
+            category_json = self.__get(category, None, None)
+            indexed = self.__path_indexes[category] = (category_json, index_paths(category_json))
+
+        return self.__served(indexed[1].get(path, default_value))
+
+    @staticmethod
+    def get_int(category, section, key, default_value=None):
+        """
+        Typed configuration accessor, of ints or int strings (ex. " 42 ").
+        See get_typed for the arguments, raises ValueError for malformed values.
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_int)
+
+    @staticmethod
+    def get_float(category, section, key, default_value=None):
+        """
+        Typed configuration accessor, of numbers or number strings (ex. "0.5").
+        See get_typed for the arguments, raises ValueError for malformed values.
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_float)
+
+    @staticmethod
+    def get_bool(category, section, key, default_value=None):
+        """
+        Typed configuration accessor, of bools, 0 / 1 or bool strings (true / false, yes / no, on / off, 1 / 0).
+        See get_typed for the arguments, raises ValueError for malformed values.
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_bool)
+
+    @staticmethod
+    def get_duration(category, section, key, default_value=None):
+        """
+        Typed configuration accessor, of seconds (float) - of numbers of seconds or duration strings (ex. "1h30m", "200ms").
+        See get_typed for the arguments, raises ValueError for malformed values.
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_duration)
+
+    @staticmethod
+    def get_bytes(category, section, key, default_value=None):
+        """
+        Typed configuration accessor, of bytes (int) - of numbers of bytes or size strings (ex. "10KB", "1.5MiB").
+        See get_typed for the arguments, raises ValueError for malformed values.
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_bytes)
+
+    @staticmethod
+    def get_list(category, section, key, default_value=None, *, item_type=None):
+        """
+        Typed configuration accessor, of tuples - of lists or comma separated strings (ex. "a, b").
+        See get_typed for the arguments, raises ValueError for malformed values (or items).
+
+        Keyword Arguments:
+            item_type {type} -- keyword only, str, int, float, bool or any parser function coercing each of the items
+                                (default: {None})
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parse_list, item_type)
+
+    @staticmethod
+    def get_typed(category, section, key, parser, default_value=None):
+        """
+        Typed configuration accessor.
+        The value is coerced by the parser on first access, the coerced value is memoized per key
+        until the category is replaced (ex. reloaded). A single coerced value is kept per key: accessing a key
+        with another parser (ex. a lambda defined on every call) coerces it again, replacing the memoized value.
+
+        Arguments:
+            category {string} -- name of category for the queried config
+            section {string} -- name of section / object name
+            key {string} -- name of key under provided section
+            parser {function} -- coerces a config value, raising ValueError when malformed (see value_parsers)
+
+        Keyword Arguments:
+            default_value {any} -- returned as is when section/key isn't present in loaded config data (default: {None})
+
+        Returns:
+            any -- the coerced value associated with section/key
+        """
+        return EnvConfig.instance().__get_typed(category.lower(), section, key, default_value, parser)
+
+    def __get_typed(self, category, section, key, default_value, parser, *parser_args):
+        memo = self.__typed_values.get(category)
+        # the values coerced of a replaced category object (ex. reloaded) are stale
+        if memo is None or memo[0] is not self.__config_json.get(category):
+            memo = self.__typed_values[category] = (self.__get(category, None, None), {})
+        else:
+            memoized = memo[1].get((section, key))
+            # bounded by the category keys, whatever parsers are used
+            if memoized is not None and memoized[0] is parser and memoized[1] == parser_args:
+                return memoized[2]
+
+        value = self.__get(category, section, key, MISSING_VALUE)
+        if value is MISSING_VALUE:
+            return default_value
+        try:
+            coerced = parser(value, *parser_args)
+        except ValueError as ex:
+            raise ValueError(f"Malformed config value of {category}/{section}/{key}: {ex}") from None
+
+        memo[1][(section, key)] = (parser, parser_args, coerced)
+        return coerced
 
     def __get(self, category, section, key, default_value=None):
         """
@@ -328,29 +1435,32 @@ class EnvConfig(metaclass=EnvConfigMetaClass):
         if self.__config_loader is None:
             self.set_loader()
 
-        # category is being accessed for the first time, load it
-        if category not in self.__config_json:
-            self.__config_json[category] = self.__load_config(category)
+        # a single reference to the loaded config, a concurrent reload replaces it as a whole
+        category_json = self.__config_json.get(category)
+
+        # category is being accessed for the first time, load it (once, even when accessed concurrently)
+        if category_json is None:
+            category_json = self.__load_category(category)
 
         # someone wants to get a hold of the entire category config
         if section is None:
-            return self.__config_json[category]
+            return category_json
 
         # someone wants to get a hold of an entire section structure
         if (
             section is not None
             and key is None
-            and section in self.__config_json[category]
+            and section in category_json
         ):
-            return self.__config_json[category][section]
+            return category_json[section]
 
         # missing section
-        if section not in self.__config_json[category]:
+        if section not in category_json:
             return default_value
 
         # missing key in section
-        if key not in self.__config_json[category][section]:
+        if key not in category_json[section]:
             return default_value
 
         # actual config indicated data
-        return self.__config_json[category][section][key]
+        return category_json[section][key]
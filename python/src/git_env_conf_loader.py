@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Concrete implementation of a local git repository (ex. bare mirror of the configuration repo) reader
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import os
+import subprocess
+import threading
+from .abstract_env_conf_loader import EnvConfigLoader
+from .common import get_config_folder
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+# branch name candidates, in order: a mirror/bare clone holds heads, a regular clone remote branches
+BRANCH_REF_FORMATS = ["refs/heads/{}", "refs/remotes/origin/{}"]
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class GitEnvConfigLoader(EnvConfigLoader):
+    """
+    Git object database environment aware config loader.
+    Implements EnvConfigLoader in order to be injected into EnvConfig.
+    Reads a local clone of the configuration repo (path taken from the "git" options block):
+        branches and fallbacks are resolved with git rev-parse (and pinned to the resolved commit),
+        categories are listed with git ls-tree,
+        all category blobs are streamed through a single long lived "git cat-file --batch" process.
+    An exact, commit consistent view with no http involved.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__cat_file = None
+        self.__lock = threading.Lock()
+
+    def __del__(self):
+        self.close()
+
+    def __repo_path(self):
+        return os.path.expanduser(self._get_option("git", "path", "."))
+
+    def __git(self, *args):
+        result = subprocess.run(
+            ["git", "--git-dir", self.__git_dir()] + list(args),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        return result.returncode, result.stdout.decode("utf-8")
+
+    def __git_dir(self):
+        # bare clones are the git dir themselves
+        dot_git = os.path.join(self.__repo_path(), ".git")
+        return dot_git if os.path.isdir(dot_git) else self.__repo_path()
+
+    def __resolve(self, branch_name):
+        for ref_format in BRANCH_REF_FORMATS:
+            return_code, output = self.__git("rev-parse", "--verify", "--quiet", ref_format.format(branch_name) + "^{commit}")
+            if return_code == 0:
+                return output.strip()
+        return None
+
+    def verify_env_or_fallback(self):
+        env_list = [self._env] + self._fallback_list
+
+        for candidate_env in env_list:
+            commit_hash = self.__resolve(candidate_env)
+            if commit_hash is not None:
+                Logger.info(f"Using configuration branch {candidate_env} with commit hash: {commit_hash[:6]}")
+                self._env = candidate_env
+                self._revision = commit_hash
+                return True
+
+            Logger.info(f"{candidate_env} does not exist on {self.__repo_path()} trying next...")
+
+        return False
+
+    def head_revision(self):
+        # the repo is expected to be kept up to date (ex. a periodically fetched mirror)
+        return self.__resolve(self._env)
+
+    def __tree_ish(self):
+        folder = get_config_folder(self._env, self._version)
+        return f"{self._revision}:{folder}" if folder else self._revision
+
+    def list_categories(self):
+        return_code, output = self.__git("ls-tree", "-z", self.__tree_ish())
+        if return_code != 0:
+            raise Exception(f"Could not list configuration files of {self._env} at {self._revision} in {self.__repo_path()}")
+
+        files_list = []
+        # entries: "<mode> <type> <sha>\t<name>"
+        for entry in filter(None, output.split("\0")):
+            meta, name = entry.split("\t", 1)
+            if meta.split(" ")[1] == "blob" and name.endswith(".json"):
+                files_list.append(name.replace(".json", "").upper())
+        return files_list
+
+    def load(self, category):
+        """
+        concrete implementation fo abstract method
+
+        Returns:
+            dict -- json parsed config
+        """
+        try:
+            folder = get_config_folder(self._env, self._version)
+            return self._parse(category, self.__cat_blob(f"{self._revision}:{folder}{category}.json"))
+
+        except Exception as ex:
+            Logger.critical(
+                f'Failed loading and parsing config json content from branch/env "{self._env}"\nexception: {ex}'
+            )
+            return {}
+
+    def __cat_blob(self, object_name):
+        with self.__lock:
+            if self.__cat_file is None or self.__cat_file.poll() is not None:
+                self.__cat_file = subprocess.Popen(
+                    ["git", "--git-dir", self.__git_dir(), "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                )
+
+            self.__cat_file.stdin.write(object_name.encode("utf-8") + b"\n")
+            self.__cat_file.stdin.flush()
+
+            # "<sha> <type> <size>\n<content>\n" or "<object name> missing\n"
+            header = self.__cat_file.stdout.readline().decode("utf-8").split()
+            if len(header) != 3:
+                raise Exception(f"Could not find {object_name} in {self.__repo_path()}")
+
+            content = self.__cat_file.stdout.read(int(header[2]))
+            self.__cat_file.stdout.read(1)
+
+        if header[1] != "blob":
+            raise Exception(f"{object_name} is a {header[1]}, not a file")
+        return content
+
+    def reset_connections(self):
+        # the git cat-file process is the parent's child, not ours (never waited for here)
+        self.__lock = threading.Lock()
+        self.__cat_file = None
+
+    def close(self):
+        """
+        Ends the long lived git cat-file process
+        """
+        cat_file = getattr(self, "_GitEnvConfigLoader__cat_file", None)
+        if cat_file is not None and cat_file.poll() is None:
+            cat_file.stdin.close()
+            cat_file.wait()
+            cat_file.stdout.close()
+        self.__cat_file = None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+github configuration repo reader fetching the whole branch as a single archive
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import io
+import tarfile
+import threading
+from .github_env_conf_loader import GithubEnvConfigLoader, TWIST_GITHUB_ACCOUNT, CONFIGURATION_REPO
+from .logger import Logger
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class GithubArchiveEnvConfigLoader(GithubEnvConfigLoader):
+    """
+    Github environment aware config loader downloading the branch tarball once (a single round trip
+    instead of a listing + one fetch per category). Only the category files (root level *.json, or the
+    v2 env folder ones) are extracted while streaming over the archive, and served from memory afterwards.
+
+    Best suited for services consuming most of the categories, otherwise the per file loader downloads less.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # category name (lowercased, no .json suffix) => raw file content
+        self.__files = None
+        self.__lock = threading.Lock()
+
+    def _uses_trees_listing(self):
+        # the archive holds every file already, there is nothing to list or fetch per blob
+        return False
+
+    def verify_env_or_fallback(self):
+        # the env might change, drop whatever was extracted for the previous one
+        self.__files = None
+        return super().verify_env_or_fallback()
+
+    def list_categories(self):
+        return [category.upper() for category in self.__get_files()]
+
+    def _get_category_content(self, category):
+        files = self.__get_files()
+        if category not in files:
+            raise Exception(f"Could not find configuration file {category}.json in configuration repo archive of branch = {self._env}")
+        return files[category]
+
+    def __get_files(self):
+        # the archive is downloaded once, even when categories are loaded concurrently
+        with self.__lock:
+            if self.__files is None:
+                self.__files = self.__download_archive()
+        return self.__files
+
+    def __download_archive(self):
+        # API reference: https://docs.github.com/en/rest/repos/contents#download-a-repository-archive-tar
+        github_api_url = f"{self._api_url()}/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/tarball/{self._ref()}"
+
+        headers = {
+            "Accept": "application/vnd.github.v3.raw",
+            "Authorization": f"token {self._get_github_token()}",
+        }
+
+        Logger.debug(f'Fetching configuration archive from {github_api_url} on branch/env "{self._env}"')
+
+        response = self._http_get(github_api_url, headers=headers)
+
+        if response.status_code == 401:
+            raise Exception("Could not authenticate and get configuration repo archive using provided token")
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Could not get configuration archive for branch = {self._env} status code: {response.status_code}"
+            )
+
+        return self.__extract_categories(response.content)
+
+    def __extract_categories(self, archive):
+        folder = self._config_folder()
+        files = {}
+
+        # stream mode ("r|gz"), members are visited in archive order without building an index
+        with tarfile.open(fileobj=io.BytesIO(archive), mode="r|gz") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+
+                # github archives nest everything under a single "{account}-{repo}-{sha}/" top folder
+                path = member.name.split("/", 1)[-1]
+                if not path.startswith(folder) or not path.endswith(".json"):
+                    continue
+
+                name = path[len(folder):]
+                # only the files directly in the folder (not nested)
+                if "/" in name:
+                    continue
+
+                files[name[: -len(".json")].lower()] = tar.extractfile(member).read().decode("utf-8")
+
+        Logger.debug(f"Extracted {len(files)} configuration categories from archive of branch/env {self._env}")
+        return files
@@ -12,13 +12,16 @@ Concrete implementation of github configuration repo reader
 # IMPORT MODULES                                                            #
 #############################################################################
 
-import requests
+import threading
 import urllib
-import json5
-import os
+from concurrent.futures import ThreadPoolExecutor
 from .abstract_env_conf_loader import EnvConfigLoader
-from .secrets import Secrets
+from .http_session import create_http_session, DEFAULT_POOL_SIZE, DEFAULT_REQUEST_TIMEOUT
+from .http_cache import HttpDiskCache, DEFAULT_CACHE_DIR, DEFAULT_MAX_SIZE_MB
+from .blob_cache import BlobCache, DEFAULT_BLOB_CACHE_DIR, DEFAULT_MEMORY_ENTRIES
+from .credential_providers import get_credentials, GIT_CONF_TOKEN_KEY  # noqa: F401 (GIT_CONF_TOKEN_KEY re-exported)
 from .logger import Logger
+from .common import get_config_folder
 
 
 #############################################################################
@@ -27,7 +30,11 @@ from .logger import Logger
 
 TWIST_GITHUB_ACCOUNT = "Twistbioscience"
 CONFIGURATION_REPO = "configuration"
-GIT_CONF_TOKEN_KEY = "GIT_CONFIG_TOKEN"
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_RAW_URL = "https://raw.githubusercontent.com"
+# github.listing option values
+CONTENTS_LISTING = "contents"
+TREES_LISTING = "trees"
 
 #############################################################################
 # IMPLEMENTATION                                                            #
@@ -39,12 +46,91 @@ class GithubEnvConfigLoader(EnvConfigLoader):
     Github environment aware config loader.
     Implements EnvConfigLoader in order to be injected into EnvConfig.
     Reads and lists repo files.
+    All requests go through a single loader owned keep-alive session (see http_session.py)
     """
 
     def __init__(self):
         super().__init__()
+        self.__session = None
+        self.__session_lock = threading.Lock()
+        self.__http_cache = None
+        self.__blob_cache = None
+        # repo file path => git blob sha (trees listing only)
+        self.__blob_shas = None
+
+    def set_options(self, options):
+        super().set_options(options)
+        self.__http_cache = None
+        if "cache" in self._options:
+            self.__http_cache = HttpDiskCache(
+                self._get_option("cache", "dir", DEFAULT_CACHE_DIR),
+                self._get_option("cache", "max_size_mb", DEFAULT_MAX_SIZE_MB),
+            )
+        self.__blob_cache = None
+        if self._uses_trees_listing():
+            self.__blob_cache = BlobCache(
+                self._get_option("blob_cache", "dir", DEFAULT_BLOB_CACHE_DIR),
+                self._get_option("blob_cache", "memory_entries", DEFAULT_MEMORY_ENTRIES),
+            )
+
+    def http_cache(self):
+        """
+        The conditional requests disk cache, when enabled by the "cache" options block (otherwise None)
+        """
+        return self.__http_cache
+
+    def _http_get(self, url, headers):
+        """
+        GET using the loader's pooled session (created on first use from the "http" options block), giving up
+        after the "http" timeout.
+        When the disk cache is enabled the request is conditional and a 304 is served from the cache.
+        """
+        session = self.__session if self.__session is not None else self.__create_session()
+
+        timeout = self._get_option("http", "timeout", DEFAULT_REQUEST_TIMEOUT)
+        cache = self.http_cache()
+        if cache is None:
+            return session.get(url, headers=headers, timeout=timeout)
+
+        entry = cache.get(url)
+        if entry is not None:
+            headers = {**headers, **cache.conditional_headers(entry)}
+
+        response = session.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry is not None:
+            return cache.hit(url, entry)
+        if response.status_code == 200:
+            cache.miss(url, response)
+        return response
+
+    def __create_session(self):
+        # concurrent first requests (ex. the fallback branch probes) share a single pooled session
+        with self.__session_lock:
+            if self.__session is None:
+                self.__session = create_http_session(
+                    self._get_option("http", "pool_size", DEFAULT_POOL_SIZE),
+                    self._get_option("http", "http2", False),
+                )
+            return self.__session
+
+    def reset_connections(self):
+        # the lock might have been held by another thread of the parent while forking
+        self.__session_lock = threading.Lock()
+        self.__session = None
+
+    def _api_url(self):
+        return self._get_option("github", "api_url", GITHUB_API_URL)
+
+    def _raw_url(self):
+        return self._get_option("github", "raw_url", GITHUB_RAW_URL)
+
+    def _uses_trees_listing(self):
+        return self._get_option("github", "listing", CONTENTS_LISTING) == TREES_LISTING
 
     def list_categories(self):
+        if self._uses_trees_listing():
+            return self.__get_tree_file_list()
         return self.__get_repo_file_list()
 
     def load(self, category):
@@ -55,8 +141,11 @@ class GithubEnvConfigLoader(EnvConfigLoader):
             dict -- json parsed config
         """
         try:
-            config_raw_content = self.__get_file_content(f"{category}.json", self._env)
-            return json5.loads(config_raw_content)
+            if self._uses_trees_listing():
+                return self.__load_blob(category)
+
+            config_raw_content = self._get_category_content(category)
+            return self._parse(category, config_raw_content)
 
         except Exception as ex:
             Logger.critical(
@@ -64,75 +153,103 @@ class GithubEnvConfigLoader(EnvConfigLoader):
             )
             return {}
 
-    @staticmethod
-    def __get_github_token():
-        # first chance to env var...
-        if GIT_CONF_TOKEN_KEY in os.environ:
-            github_conf_token = os.environ[GIT_CONF_TOKEN_KEY]
-        else:
-            # otherwise fetch from secrets
-            common = Secrets.instance().get("common")
-            github_conf_token = common[GIT_CONF_TOKEN_KEY]
-
-        if github_conf_token is None or github_conf_token == "":
-            raise Exception(
-                f"Missing git configuration repo access token. See Vault::secret/common or set env var {GIT_CONF_TOKEN_KEY}"
-            )
+    def _get_category_content(self, category):
+        """
+        The raw (unparsed) content of the provided category
+        """
+        return self.__get_file_content(f"{category}.json", self._ref())
 
-        return github_conf_token
+    def _ref(self):
+        """
+        The git ref all reads are made at - the commit sha resolved while verifying the env, so every
+        category (even one lazily loaded hours later) comes from the very same commit.
+        Immutable sha urls are also far better cached by the raw CDN than a moving branch name.
+        """
+        return self._revision if self._revision is not None else self._env
 
-    def verify_env_or_fallback(self):
-        github_conf_token = GithubEnvConfigLoader.__get_github_token()
-        env_list = [self._env] + self._fallback_list
-
-        # checking branch exists on repo, otherwise falling back to other (from list)
-        for candidate_env in env_list:
-            # https://developer.github.com/v3/repos/branches/
-            github_url = f"https://api.github.com/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/branches/{candidate_env}"
-
-            headers = {
-                "Accept-Encoding": "gzip, deflate",
-                "Accept": "application/json",
-                "Authorization": f"token {github_conf_token}",
-            }
-
-            Logger.debug(
-                f"Validating existence of branch {candidate_env} on {CONFIGURATION_REPO}"
-            )
+    def _config_folder(self):
+        """
+        The repo folder holding the category files ("" for the repo root)
+        """
+        return get_config_folder(self._env, self._version)
 
-            response = requests.get(github_url, headers=headers)
+    def _get_github_token(self):
+        # memoized for the whole process (see credential_providers.py), by default: env var first, then vault common secret
+        return get_credentials(self._options.get("credentials") or {}).token()
 
-            if response.status_code == 200:
-                commit_hash = response.json()["commit"]["sha"][:6]
-                Logger.info(
-                    f"Using configuration branch {candidate_env} with commit hash: {commit_hash}"
-                )
-                self._env = candidate_env
-                return True
+    def __probe_branch(self, candidate_env, github_conf_token):
+        # https://developer.github.com/v3/repos/branches/
+        github_url = f"{self._api_url()}/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/branches/{candidate_env}"
 
-            if response.status_code == 404:
-                Logger.info(
-                    f"{candidate_env} does not exist on {CONFIGURATION_REPO} trying next..."
-                )
-            else:
-                Logger.error(
-                    f"Unknown response code {response.status_code} while trying to verify branch {candidate_env} on {CONFIGURATION_REPO}"
-                )
-                return False
+        headers = {
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/json",
+            "Authorization": f"token {github_conf_token}",
+        }
+
+        Logger.debug(
+            f"Validating existence of branch {candidate_env} on {CONFIGURATION_REPO}"
+        )
 
-        return False
+        return self._http_get(github_url, headers=headers)
+
+    def verify_env_or_fallback(self):
+        # the env might change, drop the file shas listed for the previous one
+        self.__blob_shas = None
+        self._revision = None
+        github_conf_token = self._get_github_token()
+        env_list = list(dict.fromkeys([self._env] + self._fallback_list))
+
+        # all candidates are probed at once (a single round trip instead of one per missing branch),
+        # but still decided in priority order: the first existing branch of the list wins.
+        executor = ThreadPoolExecutor(max_workers=len(env_list))
+        probes = [executor.submit(self.__probe_branch, candidate_env, github_conf_token) for candidate_env in env_list]
+        try:
+            # checking branch exists on repo, otherwise falling back to other (from list)
+            for candidate_env, probe in zip(env_list, probes):
+                response = probe.result()
+
+                if response.status_code == 200:
+                    commit_hash = response.json()["commit"]["sha"]
+                    Logger.info(
+                        f"Using configuration branch {candidate_env} with commit hash: {commit_hash[:6]}"
+                    )
+                    self._env = candidate_env
+                    # pinning all following reads to this very commit
+                    self._revision = commit_hash
+                    return True
+
+                if response.status_code == 404:
+                    Logger.info(
+                        f"{candidate_env} does not exist on {CONFIGURATION_REPO} trying next..."
+                    )
+                else:
+                    Logger.error(
+                        f"Unknown response code {response.status_code} while trying to verify branch {candidate_env} on {CONFIGURATION_REPO}"
+                    )
+                    return False
+
+            return False
+        finally:
+            # lower priority probes are irrelevant once decided - cancel the pending ones, ignore the running ones
+            for probe in probes:
+                probe.cancel()
+            executor.shutdown(wait=False)
+
+    def head_revision(self):
+        # with the http cache on, an unchanged branch is a cheap 304
+        response = self.__probe_branch(self._env, self._get_github_token())
+        if response.status_code != 200:
+            Logger.warning(f"Could not check the head of configuration branch {self._env}, status code: {response.status_code}")
+            return None
+        return response.json()["commit"]["sha"]
 
     def __get_file_content(self, file_path, branch_name):
-        github_conf_token = GithubEnvConfigLoader.__get_github_token()
+        github_conf_token = self._get_github_token()
 
-        folder = ""
-        # in version 2, files reside in folder respective to fixed environment (dev, qa staging etc)
-        if self._version == 2:
-            folder = self._env + "/"
-            if folder.startswith('dynamic-'):
-                folder = "dev/"  # TODO: should be base
+        folder = self._config_folder()
 
-        github_url = f"https://raw.githubusercontent.com/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/{branch_name}/{folder}{file_path}"
+        github_url = f"{self._raw_url()}/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/{branch_name}/{folder}{file_path}"
         file_path = urllib.parse.quote(file_path, safe="")
 
         headers = {
@@ -145,7 +262,7 @@ class GithubEnvConfigLoader(EnvConfigLoader):
             f'Fetching {file_path} from {github_url} on branch/env "{branch_name}"'
         )
 
-        response = requests.get(github_url, headers=headers)
+        response = self._http_get(github_url, headers=headers)
 
         if response.status_code == 401:
             raise Exception(
@@ -167,9 +284,9 @@ class GithubEnvConfigLoader(EnvConfigLoader):
         Returns:
             [list] -- list of files, uppercased and without the .json suffix
         """
-        github_conf_token = GithubEnvConfigLoader.__get_github_token()
+        github_conf_token = self._get_github_token()
         # API reference: https://developer.github.com/v3/repos/contents/
-        github_api_url = f"https://api.github.com/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/contents/?ref={self._env}"
+        github_api_url = f"{self._api_url()}/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/contents/?ref={self._ref()}"
 
         headers = {
             "Accept-Encoding": "gzip, deflate",
@@ -181,7 +298,7 @@ class GithubEnvConfigLoader(EnvConfigLoader):
             f'Fetching file list from {github_api_url} on branch/env "{self._env}"'
         )
 
-        response = requests.get(github_api_url, headers=headers)
+        response = self._http_get(github_api_url, headers=headers)
         files_json = response.json()
 
         if response.status_code == 401:
@@ -207,3 +324,81 @@ class GithubEnvConfigLoader(EnvConfigLoader):
         )
 
         return files_list
+
+    def __load_blob(self, category):
+        """
+        Trees listing mode - the category is looked up by its blob sha, so it is only downloaded
+        (and parsed) when its content isn't in the blob cache already
+        """
+        if self.__blob_shas is None:
+            self.__get_tree_file_list()
+
+        path = f"{self._config_folder()}{category}.json"
+        if path not in self.__blob_shas:
+            raise Exception(f"Could not find configuration file {path} in configuration repo in branch = {self._env}")
+
+        blob_sha = self.__blob_shas[path]
+        parsed, self._category_parsers[category] = self.__blob_cache.get_json(
+            blob_sha, lambda: self.__get_blob_content(blob_sha), self._json_parser()
+        )
+        return parsed
+
+    def __get_blob_content(self, blob_sha):
+        # API reference: https://docs.github.com/en/rest/git/blobs#get-a-blob
+        github_api_url = f"{self._api_url()}/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/git/blobs/{blob_sha}"
+
+        headers = {
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/vnd.github.v3.raw",
+            "Authorization": f"token {self._get_github_token()}",
+        }
+
+        Logger.debug(f'Fetching blob {blob_sha} from {github_api_url} on branch/env "{self._env}"')
+
+        response = self._http_get(github_api_url, headers=headers)
+
+        if response.status_code != 200:
+            raise Exception(f"Could not get blob {blob_sha} from configuration repo status code: {response.status_code}")
+
+        return response.content
+
+    def __get_tree_file_list(self):
+        """
+        Based on self environment, pull the whole repo tree (with the blob sha of every file) in a single call
+
+        Returns:
+            [list] -- list of root level files, uppercased and without the .json suffix
+        """
+        # API reference: https://docs.github.com/en/rest/git/trees#get-a-tree
+        github_api_url = f"{self._api_url()}/repos/{TWIST_GITHUB_ACCOUNT}/{CONFIGURATION_REPO}/git/trees/{self._ref()}?recursive=1"
+
+        headers = {
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/json",
+            "Authorization": f"token {self._get_github_token()}",
+        }
+
+        Logger.debug(f'Fetching file tree from {github_api_url} on branch/env "{self._env}"')
+
+        response = self._http_get(github_api_url, headers=headers)
+
+        if response.status_code == 401:
+            raise Exception("Could not authenticate and get configuration repo tree using provided token")
+
+        if response.status_code != 200:
+            raise Exception(
+                f"Could not find configuration branch at configuration repo with name = {self._env} status code: {response.status_code}"
+            )
+
+        tree_json = response.json()
+        if tree_json.get("truncated", False):
+            Logger.warning(f"Configuration repo tree of {self._env} is truncated, some categories might be missing")
+
+        self.__blob_shas = {f["path"]: f["sha"] for f in tree_json["tree"] if f["type"] == "blob"}
+
+        # same rule as the contents listing: root level .json files only
+        return [
+            path.replace(".json", "").upper()
+            for path in self.__blob_shas
+            if path.endswith(".json") and path.find("/") == -1
+        ]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+on disk http cache for conditional (ETag / Last-Modified) requests
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import json
+import os
+import threading
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "configuration_client", "http")
+DEFAULT_MAX_SIZE_MB = 50
+ENTRY_SUFFIX = ".entry"
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class CachedResponse:
+    """
+    Stands in for a 200 response when the server answered 304 (Not Modified) and the body
+    is served from the cache instead
+    """
+
+    def __init__(self, url, content, headers):
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.headers = headers
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpDiskCache:
+    """
+    Stores GET response bodies keyed by url, along with their ETag / Last-Modified validators, so the next
+    request of the same url can be conditional and a 304 answer is served from disk.
+    Every entry is a single file (json meta line + body). Total size is capped, the least recently used
+    entries (by file mtime, refreshed on every hit) are evicted first.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_size_mb=DEFAULT_MAX_SIZE_MB):
+        self.__directory = os.path.expanduser(directory)
+        self.__max_bytes = int(max_size_mb * 1024 * 1024)
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+    def __entry_path(self, url):
+        return os.path.join(self.__directory, hashlib.sha256(url.encode()).hexdigest() + ENTRY_SUFFIX)
+
+    def get(self, url):
+        """
+        Returns:
+            dict -- {"etag", "last_modified", "headers", "body"} or None when url isn't cached
+        """
+        try:
+            with open(self.__entry_path(url), "rb") as entry_file:
+                meta = json.loads(entry_file.readline())
+                meta["body"] = entry_file.read()
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry["etag"] is not None:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"] is not None:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def hit(self, url, entry):
+        """
+        The server confirmed (304) the cached entry, mark it as recently used and serve it
+        """
+        with self.__lock:
+            self.hits += 1
+        try:
+            os.utime(self.__entry_path(url))
+        except OSError:
+            pass
+        return CachedResponse(url, entry["body"], entry["headers"])
+
+    def miss(self, url, response):
+        """
+        A full response was downloaded, store it when it carries a validator
+        """
+        with self.__lock:
+            self.misses += 1
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            return
+
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+        }
+        path = self.__entry_path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as entry_file:
+                entry_file.write(json.dumps(meta).encode() + b"\n")
+                entry_file.write(response.content)
+            # atomic, concurrent readers see either the old or the new entry
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            Logger.warning(f"Failed writing http cache entry for {url}: {ex}")
+            return
+
+        self.__evict()
+
+    def __evict(self):
+        with self.__lock:
+            entries = []
+            for name in os.listdir(self.__directory):
+                if not name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.__directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+            total_size = sum(size for _, size, _ in entries)
+            # oldest first
+            for _, size, name in sorted(entries):
+                if total_size <= self.__max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.__directory, name))
+                except OSError:
+                    pass
+                total_size -= size
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+pooled keep-alive http sessions for the remote config loaders
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import requests
+from requests.adapters import HTTPAdapter
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_POOL_SIZE = 10
+# seconds to wait for a connection, or between bytes of a response, before giving up on a request
+DEFAULT_REQUEST_TIMEOUT = 30
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def create_http_session(pool_size=DEFAULT_POOL_SIZE, http2=False):
+    """
+    Creates a session that keeps its connections alive between requests so consecutive
+    calls to the same host skip the TCP + TLS handshake.
+
+    Keyword Arguments:
+        pool_size {int} -- max connections kept open per host (default: {DEFAULT_POOL_SIZE})
+        http2 {bool} -- multiplex all requests over a single HTTP/2 connection (requires httpx) (default: {False})
+
+    Returns:
+        requests.Session | httpx.Client -- both expose get(url, headers=...) returning a response
+        with status_code, text, content, headers and json()
+    """
+    if http2:
+        try:
+            import httpx
+        except ImportError:
+            raise Exception("HTTP/2 config loading requires the httpx package (pip install httpx[http2])")
+
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        return httpx.Client(http2=True, limits=limits)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+local http listener for pushed configuration change notifications (instead of polling github)
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_LISTENER_HOST = "127.0.0.1"
+# the github webhook signature header (hmac sha256 of the body)
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+MAX_PAYLOAD_SIZE = 1024 * 1024
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def sign_payload(secret, body):
+    """
+    The signature header value of a notification body, for senders (same scheme as github webhooks)
+
+    Arguments:
+        secret {str} -- shared secret
+        body {bytes} -- request body
+    """
+    return "sha256=" + hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def parse_notification(payload):
+    """
+    Extracts the changed branch, commit and files of a notification. Either the plain form:
+        {"branch": "qa", "sha": "<commit sha>", "files": ["global.json", "qa/system.json"]}
+    or a github push webhook payload (ref, after and the added / modified / removed files of its commits)
+
+    Returns:
+        tuple -- (branch, sha, files) where files is None when unknown (everything might have changed)
+    """
+    if "ref" in payload:
+        branch = payload["ref"][len("refs/heads/"):] if payload["ref"].startswith("refs/heads/") else payload["ref"]
+        files = None
+        if "commits" in payload:
+            files = sorted(
+                {path for commit in payload["commits"] for kind in ["added", "modified", "removed"] for path in commit.get(kind, [])}
+            )
+        return branch, payload["after"], files
+
+    files = payload.get("files")
+    return payload["branch"], payload["sha"], (list(files) if files is not None else None)
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer, which is python 3.7+
+    daemon_threads = True
+
+
+class _InvalidationRequestHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def __respond(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        listener = self.server.listener
+
+        length = int(self.headers.get("Content-Length", 0))
+        if length > MAX_PAYLOAD_SIZE:
+            self.__respond(413)
+            return
+
+        body = self.rfile.read(length)
+        if not listener.verify(body, self.headers.get(SIGNATURE_HEADER)):
+            Logger.warning(f"Rejected configuration change notification with a bad signature from {self.client_address[0]}")
+            self.__respond(401)
+            return
+
+        try:
+            change = parse_notification(json.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError) as ex:
+            Logger.warning(f"Rejected malformed configuration change notification: {ex}")
+            self.__respond(400)
+            return
+
+        # the sender is answered right away, the change is handled afterwards
+        self.__respond(202)
+        listener.dispatch(*change)
+
+
+class InvalidationListener:
+    """
+    Receives configuration change notifications pushed over http (ex. relayed from the configuration repo
+    push webhook), so changes propagate right away with no per process polling.
+    Notifications are POSTed json bodies (see parse_notification), authenticated with a shared secret
+    the way github signs webhooks (see sign_payload). Unsigned or badly signed notifications are rejected.
+
+    on_change(branch, sha, files) is called for every accepted notification.
+    """
+
+    def __init__(self, secret, on_change, host=DEFAULT_LISTENER_HOST, port=0):
+        if secret is None or secret == "":
+            raise Exception("Configuration invalidation listener requires a shared secret")
+
+        self.__secret = secret
+        self.__on_change = on_change
+        self.__server = _ThreadingHTTPServer((host, port), _InvalidationRequestHandler)
+        self.__server.listener = self
+        self.__thread = None
+
+    @property
+    def port(self):
+        return self.__server.server_address[1]
+
+    @property
+    def url(self):
+        return f"http://{self.__server.server_address[0]}:{self.port}/"
+
+    def verify(self, body, signature):
+        if signature is None:
+            return False
+        return hmac.compare_digest(sign_payload(self.__secret, body), signature)
+
+    def dispatch(self, branch, sha, files):
+        Logger.info(f"Configuration change notification: branch {branch} at {sha} ({len(files) if files is not None else 'all'} files)")
+        try:
+            self.__on_change(branch, sha, files)
+        except Exception as ex:
+            Logger.error(f"Failed handling configuration change notification of branch {branch}: {ex}")
+
+    def start(self):
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, args=(0.1,), name="env-config-invalidation-listener", daemon=True
+        )
+        self.__thread.start()
+        Logger.info(f"Listening for configuration change notifications on {self.url}")
+        return self
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
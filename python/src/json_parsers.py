@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+category file parsing strategies - a fast strict json parser first, json5 only when needed
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+# strict json parser (orjson when installed, stdlib json otherwise), falling back to json5
+PARSER_AUTO = "auto"
+PARSER_ORJSON = "orjson"
+PARSER_JSON = "json"
+PARSER_JSON5 = "json5"
+DEFAULT_PARSER = PARSER_AUTO
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def _parse_orjson(content):
+    return orjson.loads(content)
+
+
+def _parse_json(content):
+    return json.loads(content)
+
+
+def _parse_json5(content):
+    # only imported once a category actually needs it (see parse_json)
+    import json5
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+    return json5.loads(content)
+
+
+def strict_parser_name():
+    """
+    The strict (plain json only) parser in use: orjson when installed, else the stdlib json
+    """
+    return PARSER_ORJSON if orjson is not None else PARSER_JSON
+
+
+def parse_json(content, parser=DEFAULT_PARSER):
+    """
+    Parses a category file content.
+    With the auto parser the content is parsed by the (much faster) strict parser, and only documents
+    actually using json5 syntax (comments, unquoted keys, trailing commas...) fail it and are parsed by json5.
+
+    Arguments:
+        content {str|bytes} -- utf-8 json/json5 document
+
+    Keyword Arguments:
+        parser {str} -- one of auto, orjson, json, json5 (default: {DEFAULT_PARSER})
+
+    Returns:
+        tuple -- (parsed json, name of the parser that parsed it)
+    """
+    if parser == PARSER_AUTO:
+        strict_parser = strict_parser_name()
+        try:
+            return PARSERS[strict_parser](content), strict_parser
+        except ValueError:
+            # orjson and json decode errors are both ValueErrors
+            return _parse_json5(content), PARSER_JSON5
+
+    if parser not in PARSERS:
+        raise Exception(f"Unknown json parser {parser}, expected one of {[PARSER_AUTO] + list(PARSERS)}")
+    if parser == PARSER_ORJSON and orjson is None:
+        raise Exception("orjson json parser requested but the orjson package is not installed")
+
+    return PARSERS[parser](content), parser
+
+
+PARSERS = {
+    PARSER_ORJSON: _parse_orjson,
+    PARSER_JSON: _parse_json,
+    PARSER_JSON5: _parse_json5,
+}
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+local last known good store of the processed configuration, served when the configuration source is unreachable
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import os
+import threading
+import time
+from .logger import Logger
+from .marshal_file import MarshalFiles
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_LAST_KNOWN_GOOD_DIR = os.path.join(os.path.expanduser("~"), ".cache", "configuration_client", "last_known_good")
+# seconds the remote startup (env verification and listing) may take before serving the last known good
+DEFAULT_STARTUP_DEADLINE = 10
+# seconds between background attempts to reach the source again while serving the last known good
+DEFAULT_REVALIDATE_INTERVAL = 30
+# seconds lazily loaded categories are gathered for before being saved together (each save rewrites the whole store)
+LAST_KNOWN_GOOD_SAVE_DELAY = 1
+
+LAST_KNOWN_GOOD_MAGIC = b"ECLKG\0"
+LAST_KNOWN_GOOD_FORMAT_VERSION = 1
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def last_known_good_key(env, context_hash):
+    """
+    Digest identifying the last known good configuration of an env processed with a given app context
+    (unlike snapshots, the commit is not part of the key - it is unknown while the source is unreachable)
+    """
+    return hashlib.sha256(f"{env}\0{context_hash}".encode("utf-8")).digest()
+
+
+class LastKnownGoodStore:
+    """
+    Keeps the latest successfully processed categories (post EnvConfigContext::process) of an env and app context,
+    along with the branch and commit sha they were loaded at, in a versioned binary file (a fixed header followed
+    by a marshal payload, see MarshalFiles), updated on every successful load.
+
+    All of the stored categories belong to a single commit: once categories of a new commit are saved,
+    those of the previous one are dropped - the last known good is never a mix of revisions.
+    """
+
+    def __init__(self, directory=DEFAULT_LAST_KNOWN_GOOD_DIR):
+        self.__files = MarshalFiles(
+            directory, LAST_KNOWN_GOOD_MAGIC, LAST_KNOWN_GOOD_FORMAT_VERSION, "lkg", "last known good configuration"
+        )
+        self.__lock = threading.Lock()
+
+    def load(self, env, context_hash):
+        """
+        Returns:
+            dict -- {"branch", "revision", "categories": listed category names, "config": category => processed config,
+                    "saved_at": epoch seconds} or None when there is no (valid) last known good for this env and context
+        """
+        return self.__files.read(last_known_good_key(env, context_hash))
+
+    def save(self, env, context_hash, branch, revision, categories, config_json):
+        """
+        Adds (or replaces) the provided categories to the last known good of the env and context
+
+        Arguments:
+            branch {str} -- the branch the env was served from (the env itself or one of its fallbacks)
+            revision {str} -- the commit sha the categories were loaded at
+            categories {list} -- the listed categories of the env (ex. ["GLOBAL", "SYSTEM"])
+            config_json {dict} -- category => processed config, of the successfully loaded categories
+
+        Returns:
+            bool -- whether saved
+        """
+        key = last_known_good_key(env, context_hash)
+        with self.__lock:
+            stored = self.__files.read(key)
+            if stored is None or stored["revision"] != revision or stored["branch"] != branch:
+                stored = {"branch": branch, "revision": revision, "config": {}}
+            stored["categories"] = list(categories)
+            stored["config"].update(config_json)
+            stored["saved_at"] = time.time()
+            if not self.__files.write(key, stored):
+                return False
+
+        Logger.debug(f"Last known good configuration of env {env} at {revision} saved to {self.__files.path(key)} ({', '.join(config_json)})")
+        return True
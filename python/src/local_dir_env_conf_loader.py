@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Concrete implementation of a local directory (ex. checked out configuration repo) reader
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import os
+import threading
+from .abstract_env_conf_loader import EnvConfigLoader
+from .common import get_config_folder
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_LOCAL_PATH = "."
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class LocalDirEnvConfigLoader(EnvConfigLoader):
+    """
+    Local directory environment aware config loader.
+    Implements EnvConfigLoader in order to be injected into EnvConfig.
+    Reads the category files of a directory tree laid out like the configuration repo (a checkout of it
+    in the usual case) - no network, no github token and no vault involved.
+
+    Directory is taken from the "local" options block (path), with the same v1/v2 layout rules as github:
+        v1 - category files at the directory root
+        v2 - category files in the env folder (dynamic-* envs use the dev folder), falling back to
+             the folders of the fallback envs
+    Files are read (as bytes, handed to the parser as is) and parsed lazily on their first load.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # category => parsed json (parsed once, on first load)
+        self.__parsed = {}
+        self.__lock = threading.Lock()
+
+    def __root(self):
+        return os.path.expanduser(self._get_option("local", "path", DEFAULT_LOCAL_PATH))
+
+    def __folder_path(self, env=None):
+        return os.path.join(self.__root(), get_config_folder(env or self._env, self._version))
+
+    def verify_env_or_fallback(self):
+        self.__parsed = {}
+        env_list = [self._env] + self._fallback_list
+
+        for candidate_env in env_list:
+            folder_path = self.__folder_path(candidate_env)
+            if os.path.isdir(folder_path):
+                Logger.info(f"Using configuration env {candidate_env} from local directory {folder_path}")
+                self._env = candidate_env
+                return True
+
+            Logger.info(f"{folder_path} does not exist, trying next...")
+
+        return False
+
+    def list_categories(self):
+        folder_path = self.__folder_path()
+        return [
+            name.replace(".json", "").upper()
+            for name in sorted(os.listdir(folder_path))
+            if name.endswith(".json") and os.path.isfile(os.path.join(folder_path, name))
+        ]
+
+    def load(self, category):
+        """
+        concrete implementation fo abstract method
+
+        Returns:
+            dict -- json parsed config
+        """
+        with self.__lock:
+            if category in self.__parsed:
+                return self.__parsed[category]
+
+        try:
+            parsed = self._parse(category, self.__read(os.path.join(self.__folder_path(), f"{category}.json")))
+        except Exception as ex:
+            Logger.critical(
+                f'Failed loading and parsing config json content from local env "{self._env}"\nexception: {ex}'
+            )
+            return {}
+
+        with self.__lock:
+            self.__parsed[category] = parsed
+        return parsed
+
+    @staticmethod
+    def __read(file_path):
+        with open(file_path, "rb") as config_file:
+            return config_file.read()
@@ -13,7 +13,6 @@
 import logging
 import sys
 import os
-import termcolor
 import traceback
 
 #############################################################################
@@ -32,6 +31,8 @@ def colored(msg, color, _attrs=None):
     """
 
     if Logger.colored:
+        import termcolor
+
         return termcolor.colored(msg, color, attrs=_attrs)
     return msg
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+versioned binary files of processed configuration (see ConfigSnapshot, LastKnownGoodStore)
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import marshal
+import os
+import struct
+import sys
+import threading
+from .logger import Logger
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+# magic, format version, marshal version, python major / minor (marshal data is python version specific), key digest
+MARSHAL_FILE_HEADER = struct.Struct(">6sHHBB32s")
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class MarshalFiles:
+    """
+    A directory of files keyed by a digest, each holding a fixed header followed by a marshal payload.
+    Files of another format version, of another python (marshal) version or of another key are ignored,
+    files are replaced atomically.
+    """
+
+    def __init__(self, directory, magic, format_version, extension, description):
+        """
+        Arguments:
+            magic {bytes} -- 6 bytes identifying the kind of file
+            description {str} -- what the files hold, for the logs (ex. "configuration snapshot")
+        """
+        self.__directory = os.path.expanduser(directory)
+        self.__magic = magic
+        self.__format_version = format_version
+        self.__extension = extension
+        self.__description = description
+
+    def path(self, key):
+        return os.path.join(self.__directory, f"{key.hex()}.{self.__extension}")
+
+    def __header(self, key):
+        return MARSHAL_FILE_HEADER.pack(
+            self.__magic, self.__format_version, marshal.version, sys.version_info[0], sys.version_info[1], key
+        )
+
+    def read(self, key):
+        """
+        Returns:
+            object -- the unmarshalled payload or None when there is no (valid) file for this key
+        """
+        try:
+            with open(self.path(key), "rb") as marshal_file:
+                data = marshal_file.read()
+        except OSError:
+            return None
+
+        if data[: MARSHAL_FILE_HEADER.size] != self.__header(key):
+            Logger.debug(f"Ignoring {self.__description} {self.path(key)} of another format version or key")
+            return None
+
+        try:
+            return marshal.loads(memoryview(data)[MARSHAL_FILE_HEADER.size:])
+        except (EOFError, ValueError, TypeError) as ex:
+            Logger.warning(f"Ignoring corrupted {self.__description} {self.path(key)}: {ex}")
+            return None
+
+    def write(self, key, data):
+        """
+        Returns:
+            bool -- whether written
+        """
+        try:
+            payload = marshal.dumps(data)
+        except ValueError as ex:
+            # app context values are injected as is, and might not be plain json types
+            Logger.warning(f"{self.__description.capitalize()} not saved, processed config is not serializable: {ex}")
+            return False
+
+        path = self.path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.__directory, exist_ok=True)
+            with open(tmp_path, "wb") as marshal_file:
+                marshal_file.write(self.__header(key))
+                marshal_file.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            Logger.warning(f"Failed writing {self.__description} {path}: {ex}")
+            return False
+        return True
@@ -40,6 +40,7 @@ class OSVars:
 
       register
       register_mandatory
+      is_registered
       initialize
       get
       usage
@@ -109,27 +110,30 @@ class OSVars:
         Then it sets mem db (__vars) value to the actual (default or os.environ provided)
         """
         for (var_key, var_obj) in self.__vars.items():
-            # default case if the other conditions dont apply
-            value = var_obj["default"]
-
-            if var_key not in os.environ:
-                if var_obj["is_mandatory"] is True:
-                    self.__critical_fault(
-                        f"Missing mandatory os env var {var_key} ({var_obj['description']})"
-                    )
-            else:
-                value = os.environ[var_key]
-
-            # type checking and casting
-            if var_obj["var_type"] != str and value is not None:
-                try:
-                    value = var_obj["var_type"](value)
-                except Exception as ex:
-                    self.__critical_fault(
-                        f"provided value for {var_key} is expected to be {var_obj['var_type']} but its not (actual: {type(value)})\nDetailed exception: {type(ex)}: {ex}"
-                    )
-
-            var_obj["value"] = value
+            self.__validate_and_set_var(var_key, var_obj)
+
+    def __validate_and_set_var(self, var_key, var_obj):
+        # default case if the other conditions dont apply
+        value = var_obj["default"]
+
+        if var_key not in os.environ:
+            if var_obj["is_mandatory"] is True:
+                self.__critical_fault(
+                    f"Missing mandatory os env var {var_key} ({var_obj['description']})"
+                )
+        else:
+            value = os.environ[var_key]
+
+        # type checking and casting
+        if var_obj["var_type"] != str and value is not None:
+            try:
+                value = var_obj["var_type"](value)
+            except Exception as ex:
+                self.__critical_fault(
+                    f"provided value for {var_key} is expected to be {var_obj['var_type']} but its not (actual: {type(value)})\nDetailed exception: {type(ex)}: {ex}"
+                )
+
+        var_obj["value"] = value
 
     def __register(
         self,
@@ -157,6 +161,14 @@ class OSVars:
             "default": default_value,
         }
 
+        # registered late (ex. by a subsystem on its first use), validated right away
+        if self.__initialized is True:
+            self.__validate_and_set_var(var_key, self.__vars[var_key])
+
+    @staticmethod
+    def is_registered(var_key):
+        return var_key in OSVars.instance().__vars
+
     @staticmethod
     def get(var_key):
         return OSVars.instance().__get(var_key)
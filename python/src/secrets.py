@@ -10,7 +10,7 @@ encapsulation to secret management api using Vault
 #############################################################################
 # IMPORT MODULES                                                            #
 #############################################################################
-import hvac
+import os
 from .os_vars import OSVars
 from .logger import Logger
 from .dict_utils import override_dict
@@ -75,6 +75,7 @@ class Secrets:
         self.__cache = {}
         # secrets cache (key is path to secret)
         self.__path_to_secrets = {}
+        self.__fork_hook = False
 
     def connect(self):
         if self.__client is not None:
@@ -88,15 +89,27 @@ class Secrets:
         Logger.info(f"connecting to vault on: {vault_url} with user: {vault_user}")
 
         try:
+            # the vault client (and its http stack) is only imported once actually connecting
+            import hvac
+
             self.__client = hvac.Client(url=vault_url, timeout=30)
             self.__client.auth_userpass(vault_user, vault_pass)
         except Exception as ex:
             Logger.error(f"Failed connecting to vault. error: {ex}")
             return False
 
+        # forked children (ex. pre-fork servers workers) must not share the client connections with their parent
+        if not self.__fork_hook and hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.__reset_client)
+            self.__fork_hook = True
+
         Logger.debug(f"connected to vault on {vault_url}")
         return True
 
+    def __reset_client(self):
+        # connecting (and authenticating) again on next use, the fetched secrets are kept
+        self.__client = None
+
     def __perform_override(self, secret, path_to_secret):
         twist_env = OSVars.get(ENV_VAR_NAME)
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+host wide shared memory store of the processed configuration (one loading process, many attached ones)
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import hashlib
+import marshal
+import os
+import struct
+import tempfile
+import threading
+import time
+from .logger import Logger
+
+try:
+    import fcntl
+except ImportError:
+    # no cross process publisher lock (windows), every process might end up loading
+    fcntl = None
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # python < 3.8
+    resource_tracker = shared_memory = None
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+DEFAULT_SEGMENT_SIZE_MB = 32
+# a segment not published (or touched by its publisher) for that long is ignored
+DEFAULT_MAX_AGE = 3600
+DEFAULT_LOCK_TIMEOUT = 60
+
+SEGMENT_MAGIC = b"ENVCSHM\0"
+SEGMENT_FORMAT_VERSION = 1
+# magic, format version, marshal version, generation (odd while being written), published at, payload length
+SEGMENT_HEADER = struct.Struct("<8sHHQdQ")
+GENERATION_OFFSET = 12
+PUBLISHED_AT_OFFSET = 20
+MAX_READ_ATTEMPTS = 100
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def shared_store_name(env, context_hash):
+    """
+    The segment name of an env configuration processed with a given app context
+    (processes sharing a segment must see the very same processed configuration)
+    """
+    return "envconfig_" + hashlib.sha256(f"{env}\0{context_hash}".encode("utf-8")).hexdigest()[:24]
+
+
+class SharedConfigStore:
+    """
+    Processed configuration (categories listing, processed categories, served branch and revision) published by a
+    single process of the host into a named shared memory segment, for all the other processes (ex. gunicorn / uwsgi
+    workers) to attach to instead of fetching and processing it all over again.
+
+    The segment holds a fixed header and a marshal payload, and is generation counted (a seqlock): the generation
+    is odd while a publish is in progress, and readers retry until they read a payload within a stable, even
+    generation - a reader never sees a partially published configuration.
+    Readers deserialize straight out of the mapped segment (no copy of the segment, no fetching, no json parsing).
+
+    Segments outlive their publisher on purpose (workers get recycled), a segment published (or touched) more than
+    max_age seconds ago is considered stale.
+    """
+
+    def __init__(self, name, size_mb=DEFAULT_SEGMENT_SIZE_MB, max_age=DEFAULT_MAX_AGE):
+        self.__name = name
+        self.__size = int(size_mb * 1024 * 1024)
+        self.__max_age = max_age
+        self.__segment = None
+        self.__lock_file = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def is_supported():
+        return shared_memory is not None
+
+    def name(self):
+        return self.__name
+
+    def __attach(self, create=False):
+        if self.__segment is not None:
+            return self.__segment
+        if not SharedConfigStore.is_supported():
+            return None
+
+        try:
+            segment = shared_memory.SharedMemory(self.__name, create=create, size=self.__size if create else 0)
+        except FileExistsError:
+            segment = shared_memory.SharedMemory(self.__name)
+        except FileNotFoundError:
+            return None
+
+        # the segment belongs to the host, not to this process - do not let the resource tracker unlink it on exit
+        try:
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+
+        self.__segment = segment
+        return segment
+
+    def generation(self):
+        """
+        Returns:
+            int -- current generation of the segment (0 - missing or never published)
+        """
+        segment = self.__attach()
+        if segment is None:
+            return 0
+        return struct.unpack_from("<Q", segment.buf, GENERATION_OFFSET)[0]
+
+    def read(self):
+        """
+        Returns:
+            dict -- {"branch", "revision", "categories", "config", "generation", "published_at": epoch seconds it was
+                    published or touched} or None when the segment is missing, never published, stale or of another
+                    format version
+        """
+        segment = self.__attach()
+        if segment is None:
+            return None
+
+        for _ in range(MAX_READ_ATTEMPTS):
+            magic, format_version, marshal_version, generation, published_at, length = SEGMENT_HEADER.unpack_from(segment.buf, 0)
+            if magic != SEGMENT_MAGIC or format_version != SEGMENT_FORMAT_VERSION or marshal_version != marshal.version:
+                return None
+            if generation == 0:
+                return None
+            if generation % 2 == 1:
+                # being published right now
+                time.sleep(0.001)
+                continue
+
+            try:
+                data = marshal.loads(segment.buf[SEGMENT_HEADER.size:SEGMENT_HEADER.size + length])
+            except (EOFError, ValueError, TypeError):
+                data = None
+
+            # published over while deserializing - retry
+            if struct.unpack_from("<Q", segment.buf, GENERATION_OFFSET)[0] != generation or data is None:
+                continue
+
+            if self.__max_age is not None and time.time() - published_at > self.__max_age:
+                Logger.debug(f"Ignoring stale shared configuration {self.__name} (published {time.time() - published_at:.0f}s ago)")
+                return None
+
+            data["generation"] = generation
+            data["published_at"] = published_at
+            return data
+
+        Logger.warning(f"Could not read a consistent shared configuration from {self.__name}")
+        return None
+
+    def publish(self, branch, revision, categories, config_json):
+        """
+        Publishes the processed configuration for the other processes of the host
+
+        Returns:
+            bool -- whether it was published
+        """
+        try:
+            payload = marshal.dumps(
+                {"branch": branch, "revision": revision, "categories": list(categories), "config": config_json}
+            )
+        except ValueError as ex:
+            Logger.warning(f"Shared configuration not published, processed config is not serializable: {ex}")
+            return False
+
+        with self.__lock:
+            segment = self.__attach(create=True)
+            if segment is None:
+                return False
+            if SEGMENT_HEADER.size + len(payload) > segment.size:
+                Logger.warning(
+                    f"Shared configuration not published, {len(payload)} bytes exceed the {segment.size} bytes segment {self.__name}"
+                )
+                return False
+
+            generation = self.generation()
+            # odd - readers hold off (or retry) until the publish is done
+            struct.pack_into("<Q", segment.buf, GENERATION_OFFSET, generation + 1 if generation % 2 == 0 else generation)
+            segment.buf[SEGMENT_HEADER.size:SEGMENT_HEADER.size + len(payload)] = payload
+            generation += 2 if generation % 2 == 0 else 1
+            SEGMENT_HEADER.pack_into(
+                segment.buf, 0, SEGMENT_MAGIC, SEGMENT_FORMAT_VERSION, marshal.version, generation, time.time(), len(payload)
+            )
+
+        Logger.info(f"Published shared configuration {self.__name} generation {generation} ({len(payload)} bytes)")
+        return True
+
+    def touch(self):
+        """
+        Marks the published configuration as still current (see max_age)
+        """
+        segment = self.__attach()
+        if segment is not None:
+            struct.pack_into("<d", segment.buf, PUBLISHED_AT_OFFSET, time.time())
+
+    def acquire_publisher_lock(self, timeout=DEFAULT_LOCK_TIMEOUT):
+        """
+        Host wide lock electing the process loading and publishing the configuration, the others wait for it
+
+        Returns:
+            bool -- whether the lock was acquired (False when timed out or unsupported)
+        """
+        if fcntl is None or self.__lock_file is not None:
+            return False
+
+        lock_file = open(os.path.join(tempfile.gettempdir(), f"{self.__name}.lock"), "w")
+        deadline = time.time() + timeout
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self.__lock_file = lock_file
+                return True
+            except OSError:
+                if time.time() > deadline:
+                    lock_file.close()
+                    Logger.warning(f"Timed out waiting for the publisher of shared configuration {self.__name}")
+                    return False
+                time.sleep(0.05)
+
+    def holds_publisher_lock(self):
+        return self.__lock_file is not None
+
+    def release_publisher_lock(self):
+        if self.__lock_file is None:
+            return
+        fcntl.flock(self.__lock_file.fileno(), fcntl.LOCK_UN)
+        self.__lock_file.close()
+        self.__lock_file = None
+
+    def close(self):
+        """
+        Detaches this process from the segment (the segment itself remains, see unlink)
+        """
+        self.release_publisher_lock()
+        if self.__segment is not None:
+            self.__segment.close()
+            self.__segment = None
+
+    def unlink(self):
+        """
+        Removes the segment from the host
+        """
+        segment = self.__attach()
+        if segment is not None:
+            # unlink unregisters the segment from the resource tracker (see __attach)
+            try:
+                resource_tracker.register(segment._name, "shared_memory")
+            except Exception:
+                pass
+            segment.unlink()
+        self.close()
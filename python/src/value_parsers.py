@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+coercion of configuration values to the types served by the typed accessors (see EnvConfig.get_int and alike)
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+
+import math
+import re
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+TRUE_VALUES = {"true", "yes", "on", "1"}
+FALSE_VALUES = {"false", "no", "off", "0"}
+
+# seconds per duration unit
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+# ex. "1h30m", "1.5s", "200ms"
+DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d)")
+DURATION = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|s|m|h|d))+")
+
+# bytes per size unit, decimal (KB) and binary (KiB) alike
+BYTES_UNITS = {
+    "b": 1,
+    "kb": 1000, "mb": 1000 ** 2, "gb": 1000 ** 3, "tb": 1000 ** 4,
+    "kib": 1024, "mib": 1024 ** 2, "gib": 1024 ** 3, "tib": 1024 ** 4,
+}
+# ex. "512", "10KB", "1.5 MiB"
+BYTES = re.compile(r"(\d+(?:\.\d+)?)\s*([a-z]*)")
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def _is_number(value):
+    # bool is an int as far as python is concerned, yet "true" is no valid number of anything
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_finite_number(value):
+    # json numbers out of the float range (ex. 1e999) are parsed as inf, no count of anything either
+    return _is_number(value) and math.isfinite(value)
+
+
+def _stripped(value, expected):
+    if not isinstance(value, str):
+        raise ValueError(f"expected {expected}, got {type(value).__name__} {value!r}")
+    return value.strip().lower()
+
+
+def parse_int(value):
+    if _is_finite_number(value) and int(value) == value:
+        return int(value)
+    try:
+        return int(_stripped(value, "an int"))
+    except ValueError:
+        raise ValueError(f"expected an int, got {value!r}") from None
+
+
+def parse_float(value):
+    if _is_number(value):
+        return float(value)
+    try:
+        return float(_stripped(value, "a float"))
+    except ValueError:
+        raise ValueError(f"expected a float, got {value!r}") from None
+
+
+def parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    if _is_number(value) and value in (0, 1):
+        return bool(value)
+
+    stripped = _stripped(value, "a bool")
+    if stripped in TRUE_VALUES:
+        return True
+    if stripped in FALSE_VALUES:
+        return False
+    raise ValueError(f"expected a bool ({', '.join(sorted(TRUE_VALUES | FALSE_VALUES))}), got {value!r}")
+
+
+def parse_duration(value):
+    """
+    Returns:
+        float -- seconds, of a number of seconds or a string of (units ms, s, m, h, d), ex. "1h30m", "1.5s", "200ms"
+    """
+    if _is_finite_number(value) and value >= 0:
+        return float(value)
+
+    stripped = _stripped(value, "a duration").replace(" ", "")
+    try:
+        seconds = float(stripped)
+    except ValueError:
+        seconds = None
+    if seconds is not None and math.isfinite(seconds) and seconds >= 0:
+        return seconds
+    if DURATION.fullmatch(stripped):
+        seconds = sum(float(amount) * DURATION_UNITS[unit] for amount, unit in DURATION_PART.findall(stripped))
+        if math.isfinite(seconds):
+            return seconds
+    raise ValueError(f"expected a duration (ex. 30, \"1.5s\", \"200ms\", \"1h30m\"), got {value!r}")
+
+
+def parse_bytes(value):
+    """
+    Returns:
+        int -- bytes, of a number of bytes or a string of (units B, KB, MB, GB, TB, KiB, MiB, GiB, TiB), ex. "1.5MiB"
+    """
+    if _is_finite_number(value) and value >= 0 and int(value) == value:
+        return int(value)
+
+    match = BYTES.fullmatch(_stripped(value, "a size in bytes"))
+    unit = (match.group(2) or "b") if match is not None else None
+    # too many digits overflow to inf
+    size = float(match.group(1)) * BYTES_UNITS[unit] if unit in BYTES_UNITS else math.inf
+    if not math.isfinite(size):
+        raise ValueError(f"expected a size in bytes (ex. 512, \"10KB\", \"1.5MiB\"), got {value!r}")
+    return int(size)
+
+
+def parse_list(value, item_parser=None):
+    """
+    Returns:
+        tuple -- items of a list or of a comma separated string, each coerced by item_parser when provided
+        (a parser function or one of the types str, int, float, bool) - a tuple, as parsed values are memoized
+        and shared by all of the callers
+    """
+    if isinstance(value, str):
+        items = [item.strip() for item in value.split(",")] if value.strip() else []
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        raise ValueError(f"expected a list or a comma separated string, got {type(value).__name__} {value!r}")
+
+    if isinstance(item_parser, type):
+        item_parser = ITEM_PARSERS.get(item_parser, item_parser)
+    if item_parser is None:
+        return tuple(items)
+
+    parsed = []
+    for position, item in enumerate(items):
+        try:
+            parsed.append(item_parser(item))
+        except ValueError as ex:
+            raise ValueError(f"item {position}: {ex}") from None
+    return tuple(parsed)
+
+
+# list item types => their parsers, see parse_list
+ITEM_PARSERS = {str: str, int: parse_int, float: parse_float, bool: parse_bool}
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import glob
+import os
 from invoke import task
 
 
@@ -27,6 +29,17 @@ def test(runner):
     runner.run("python -m unittest discover -s ./test/ -v  -t .")
 
 
+@task
+def bench(runner):
+    """
+    this will run all benchmarks found in the benchmark directory (against local stand-ins, no network)
+    """
+    for bench_file in sorted(glob.glob("benchmark/bench_*.py")):
+        module = os.path.splitext(bench_file)[0].replace("/", ".")
+        print(f"\n==== {module}")
+        runner.run(f"python -m {module}")
+
+
 @task
 def bump_build(runner):
     """
@@ -0,0 +1,241 @@
+#!/usr/bin/env python
+
+#############################################################################
+# HEADER                                                                    #
+#############################################################################
+"""
+Local stand-in for the github api + raw content endpoints used by GithubEnvConfigLoader.
+Serves branches and files from memory and counts connections / requests for assertions.
+"""
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import hashlib
+import io
+import json
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse, parse_qs
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    # http.server.ThreadingHTTPServer, which is python 3.7+
+    daemon_threads = True
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    # keep-alive is only possible with HTTP/1.1 (and a Content-Length on every response)
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid the delayed-ack stall on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.stub.count_connection()
+        # emulating the TCP + TLS handshake cost paid by every new connection
+        if self.server.stub.handshake_latency > 0:
+            time.sleep(self.server.stub.handshake_latency)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub.count_request(self.path)
+
+        if stub.latency > 0:
+            time.sleep(stub.latency)
+
+        status, body, headers = stub.route(self.path, self.headers)
+
+        # conditional requests support, the way github does it (ETag is a digest of the body)
+        if status == 200:
+            headers["ETag"] = '"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                stub.count_not_modified()
+                status, body = 304, b""
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class GithubStubServer:
+    """
+    branches is a dict of branch name => {"sha": commit sha, "files": {path: content}}
+    (and optionally "status": http status the branch api answers with instead of 200, "contents_status": the same
+    for the contents api listing)
+    """
+
+    def __init__(self, branches, account="Twistbioscience", repo="configuration", latency=0.0, handshake_latency=0.0):
+        self.branches = branches
+        self.account = account
+        self.repo = repo
+        self.latency = latency
+        self.handshake_latency = handshake_latency
+        self.connections = 0
+        self.requests = []
+        self.not_modified = 0
+        self.__lock = threading.Lock()
+        self.__server = None
+        self.__thread = None
+
+    @property
+    def api_url(self):
+        return f"http://127.0.0.1:{self.__server.server_port}"
+
+    @property
+    def raw_url(self):
+        return f"http://127.0.0.1:{self.__server.server_port}/raw"
+
+    def loader_options(self):
+        return {"github": {"api_url": self.api_url, "raw_url": self.raw_url}}
+
+    def start(self):
+        self.__server = _Server(("127.0.0.1", 0), _StubRequestHandler)
+        self.__server.stub = self
+        self.__thread = threading.Thread(target=self.__server.serve_forever, args=(0.05,), daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def reset_counters(self):
+        with self.__lock:
+            self.connections = 0
+            self.requests = []
+            self.not_modified = 0
+
+    def count_connection(self):
+        with self.__lock:
+            self.connections += 1
+
+    def count_not_modified(self):
+        with self.__lock:
+            self.not_modified += 1
+
+    def count_request(self, path):
+        with self.__lock:
+            self.requests.append(path)
+
+    def __resolve_ref(self, ref):
+        if ref in self.branches:
+            return self.branches[ref]
+        for branch in self.branches.values():
+            if branch["sha"] == ref:
+                return branch
+        return None
+
+    def route(self, path, request_headers):
+        url = urlparse(path)
+        api_prefix = f"/repos/{self.account}/{self.repo}/"
+        raw_prefix = f"/raw/{self.account}/{self.repo}/"
+
+        if url.path.startswith(raw_prefix):
+            ref, _, file_path = url.path[len(raw_prefix):].partition("/")
+            return self._raw(ref, file_path, request_headers)
+
+        if url.path.startswith(api_prefix + "branches/"):
+            return self._branch(url.path[len(api_prefix + "branches/"):])
+
+        if url.path.startswith(api_prefix + "git/trees/"):
+            return self._tree(url.path[len(api_prefix + "git/trees/"):])
+
+        if url.path.startswith(api_prefix + "git/blobs/"):
+            return self._blob(url.path[len(api_prefix + "git/blobs/"):])
+
+        if url.path.startswith(api_prefix + "tarball/"):
+            return self._tarball(url.path[len(api_prefix + "tarball/"):])
+
+        if url.path.startswith(api_prefix + "contents"):
+            ref = parse_qs(url.query).get("ref", [None])[0]
+            return self._contents(ref)
+
+        return 404, b"", {}
+
+    def _json(self, status, data):
+        return status, json.dumps(data).encode(), {"Content-Type": "application/json"}
+
+    def _branch(self, name):
+        if name not in self.branches:
+            return self._json(404, {"message": "Branch not found"})
+        # simulating a failing branch api response
+        if "status" in self.branches[name]:
+            return self._json(self.branches[name]["status"], {"message": "Server Error"})
+        return self._json(200, {"name": name, "commit": {"sha": self.branches[name]["sha"]}})
+
+    def _contents(self, ref):
+        branch = self.__resolve_ref(ref)
+        if branch is None:
+            return self._json(404, {"message": "No commit found for the ref"})
+        if "contents_status" in branch:
+            return self._json(branch["contents_status"], {"message": "Server Error"})
+        listing = []
+        for file_path in branch["files"]:
+            if "/" in file_path:
+                name, kind = file_path.split("/")[0], "dir"
+            else:
+                name, kind = file_path, "file"
+            entry = {"name": name, "path": name, "type": kind}
+            if entry not in listing:
+                listing.append(entry)
+        return self._json(200, listing)
+
+    def _raw(self, ref, file_path, request_headers):
+        branch = self.__resolve_ref(ref)
+        if branch is None or file_path not in branch["files"]:
+            return 404, b"404: Not Found", {}
+        return 200, branch["files"][file_path].encode(), {"Content-Type": "text/plain"}
+
+    def _tarball(self, ref):
+        branch = self.__resolve_ref(ref)
+        if branch is None:
+            return self._json(404, {"message": "Not Found"})
+
+        top_folder = f"{self.account}-{self.repo}-{branch['sha'][:7]}"
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w:gz") as tar:
+            for file_path, content in branch["files"].items():
+                data = content.encode()
+                info = tarfile.TarInfo(f"{top_folder}/{file_path}")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return 200, archive.getvalue(), {"Content-Type": "application/x-gzip"}
+
+    @staticmethod
+    def blob_sha(content):
+        data = content.encode()
+        return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+    def _tree(self, ref):
+        branch = self.__resolve_ref(ref)
+        if branch is None:
+            return self._json(404, {"message": "Not Found"})
+
+        tree = []
+        for file_path, content in branch["files"].items():
+            folder = file_path.rpartition("/")[0]
+            if folder and {"path": folder, "type": "tree"} not in tree:
+                tree.append({"path": folder, "type": "tree"})
+            tree.append({"path": file_path, "type": "blob", "sha": self.blob_sha(content)})
+        return self._json(200, {"sha": branch["sha"], "tree": tree, "truncated": False})
+
+    def _blob(self, sha):
+        for branch in self.branches.values():
+            for content in branch["files"].values():
+                if self.blob_sha(content) == sha:
+                    return 200, content.encode(), {"Content-Type": "application/vnd.github.v3.raw"}
+        return self._json(404, {"message": "Not Found"})
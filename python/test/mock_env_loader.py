@@ -1,6 +1,20 @@
+import time
 from src.abstract_env_conf_loader import EnvConfigLoader
 
 
+def wait_for(condition, timeout=5):
+    """
+    Polls condition until it holds (ex. a background reload or notification handled), for up to timeout seconds
+
+    Returns:
+        bool -- the last outcome of condition
+    """
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
 class GithubMockEnvConfig(EnvConfigLoader):
     """
     Github environment aware config loader - mock.
@@ -9,6 +23,8 @@ class GithubMockEnvConfig(EnvConfigLoader):
 
     def __init__(self):
         super().__init__()
+        # every category passed to load (in order), for asserting fetch counts
+        self.loaded = []
 
     def mock_set_categories(self, categories):
         self.__categories = categories
@@ -23,6 +39,7 @@ class GithubMockEnvConfig(EnvConfigLoader):
         return self.__categories
 
     def load(self, category):
+        self.loaded.append(category)
         try:
             return self.__data[category.upper()]
 
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import copy
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from mock import patch, Mock
+from src.agent import ConfigAgent
+from src.agent_env_conf_loader import AgentEnvConfigLoader
+from src.agent_protocol import OP_GET, OP_RESOLVE, STATUS_NOT_FOUND, STATUS_OK, decode_fields, encode_fields
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+MOCK_BRANCHES = {
+    "master": {
+        "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2",
+        "files": {
+            "global.json": '{"section": {"key": 1}}',
+            "system.json": '{"section": {"key": "master"}}',
+        },
+    },
+    "dev": {
+        "sha": "f6e5d4c3b2a1f6e5d4c3b2a1f6e5d4c3b2a1f6e5",
+        "files": {"global.json": '{"section": {"key": "dev"}}'},
+    },
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class ConfigAgentTester(unittest.TestCase):
+    def setUp(self):
+        self.branches = copy.deepcopy(MOCK_BRANCHES)
+        self.server = GithubStubServer(self.branches).start()
+        self.socket_dir = tempfile.mkdtemp()
+        self.socket_path = os.path.join(self.socket_dir, "agent.sock")
+        self.agent = ConfigAgent("github", 1, self.server.loader_options()).start(self.socket_path)
+
+    def tearDown(self):
+        self.agent.stop()
+        self.server.stop()
+        shutil.rmtree(self.socket_dir)
+
+    def new_client(self):
+        client = AgentEnvConfigLoader()
+        client.set_options({"agent": {"socket": self.socket_path}})
+        return client
+
+    def test_client_resolves_lists_and_loads(self):
+        client = self.new_client()
+
+        self.assertTrue(client.set_env("dynamic-missing", ["dev", "master"]))
+        self.assertEqual(client.served_env(), "dev")
+        self.assertEqual(client.revision(), MOCK_BRANCHES["dev"]["sha"])
+        self.assertEqual(client.list_categories(), ["GLOBAL"])
+        self.assertEqual(client.load("global"), {"section": {"key": "dev"}})
+        client.close()
+
+    def test_unknown_env_is_not_resolved(self):
+        client = self.new_client()
+
+        self.assertFalse(client.set_env("dynamic-missing", ["other-missing"]))
+        client.close()
+
+    def test_unknown_category_loads_empty(self):
+        client = self.new_client()
+        client.set_env("master", [])
+
+        self.assertEqual(client.load("missing"), {})
+        client.close()
+
+    def test_get_serves_a_single_value(self):
+        client = self.new_client()
+        client.set_env("master", [])
+
+        status, body = client._AgentEnvConfigLoader__request(OP_GET, "system", "section", "key")
+        self.assertEqual((status, bytes(body)), (STATUS_OK, b'"master"'))
+
+        status, _ = client._AgentEnvConfigLoader__request(OP_GET, "system", "section", "missing")
+        self.assertEqual(status, STATUS_NOT_FOUND)
+        client.close()
+
+    def test_head_revision(self):
+        client = self.new_client()
+        client.set_env("master", [])
+
+        self.assertEqual(client.head_revision(), MOCK_BRANCHES["master"]["sha"])
+        client.close()
+
+    def test_requests_before_resolve_fail(self):
+        client = self.new_client()
+
+        with self.assertRaises(Exception):
+            client.list_categories()
+        client.close()
+
+    def test_each_category_fetched_once_for_all_clients(self):
+        def load_all(_):
+            client = self.new_client()
+            client.set_env("master", [])
+            loaded = {category: client.load(category) for category in client.list_categories()}
+            client.close()
+            return loaded
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(load_all, range(32)))
+
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(results[0]["SYSTEM"], {"section": {"key": "master"}})
+        for name in ["global.json", "system.json"]:
+            fetches = [path for path in self.server.requests if path.endswith("/" + name)]
+            self.assertEqual(len(fetches), 1, f"expected {name} to be fetched once, got {fetches}")
+
+    def test_unresolved_env_is_probed_once_for_all_clients(self):
+        def resolve(_):
+            client = self.new_client()
+            resolved = client.set_env("dynamic-missing", ["other-missing"])
+            client.close()
+            return resolved
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(resolve, range(16)))
+
+        self.assertEqual(results, [False] * 16)
+        probes = [path for path in self.server.requests if path.endswith("/branches/dynamic-missing")]
+        self.assertEqual(len(probes), 1, f"expected a single probe, got {probes}")
+
+    def test_slow_resolution_does_not_stall_other_envs(self):
+        self.agent.resolve("master", [])
+        self.server.latency = 0.5
+        slow = threading.Thread(target=self.agent.resolve, args=("dev", []))
+        slow.start()
+        time.sleep(0.1)
+
+        started = time.perf_counter()
+        self.assertIsNotNone(self.agent.resolve("master", []))
+        self.assertLess(time.perf_counter() - started, 0.2)
+        slow.join()
+
+    def test_failed_load_is_not_served_to_later_clients(self):
+        self.branches["master"]["files"]["system.json"] = "{not json"
+        client = self.new_client()
+        client.set_env("master", [])
+        self.assertEqual(client.load("system"), {})
+
+        self.branches["master"]["files"]["system.json"] = '{"section": {"key": "fixed"}}'
+        next_client = self.new_client()
+        next_client.set_env("master", [])
+
+        self.assertEqual(next_client.load("system"), {"section": {"key": "fixed"}})
+        client.close()
+        next_client.close()
+
+    def test_slow_category_does_not_stall_other_categories(self):
+        client = self.new_client()
+        client.set_env("master", [])
+        client.list_categories()
+        served = self.agent.resolve("master", [])
+        self.server.latency = 0.5
+        slow = threading.Thread(target=served.load, args=("system",))
+        slow.start()
+        time.sleep(0.1)
+        self.server.latency = 0
+
+        started = time.perf_counter()
+        self.assertEqual(client.load("global"), {"section": {"key": 1}})
+        self.assertLess(time.perf_counter() - started, 0.2)
+        slow.join()
+        client.close()
+
+    def move_master(self):
+        # the previous head remains reachable by its sha
+        self.branches["previous"] = copy.deepcopy(self.branches["master"])
+        self.branches["master"] = {"sha": "e" * 40, "files": {"global.json": '{"section": {"key": "moved"}}'}}
+
+    def test_pin_serves_the_pinned_revision(self):
+        self.move_master()
+        client = self.new_client()
+
+        client.pin("master", MOCK_BRANCHES["master"]["sha"])
+
+        self.assertEqual(client.revision(), MOCK_BRANCHES["master"]["sha"])
+        self.assertEqual(client.load("global"), {"section": {"key": 1}})
+        client.close()
+
+    def test_pin_does_not_reach_the_agent(self):
+        client = AgentEnvConfigLoader()
+        client.set_options({"agent": {"socket": os.path.join(self.socket_dir, "missing.sock")}})
+
+        client.pin("master", MOCK_BRANCHES["master"]["sha"])
+
+        self.assertEqual((client.served_env(), client.revision()), ("master", MOCK_BRANCHES["master"]["sha"]))
+
+    def test_connection_keeps_its_revision_once_refreshed(self):
+        client = self.new_client()
+        client.set_env("master", [])
+        self.move_master()
+
+        self.agent.refresh()
+
+        self.assertEqual(client.load("global"), {"section": {"key": 1}})
+        fresh_client = self.new_client()
+        fresh_client.set_env("master", [])
+        self.assertEqual(fresh_client.load("global"), {"section": {"key": "moved"}})
+        client.close()
+        fresh_client.close()
+
+    def test_unreachable_agent_raises(self):
+        client = AgentEnvConfigLoader()
+        client.set_options({"agent": {"socket": os.path.join(self.socket_dir, "missing.sock")}})
+
+        with self.assertRaises(Exception):
+            client.set_env("master", [])
+
+    def test_fields_round_trip(self):
+        fields = ["master", "", "ünïcode"]
+
+        self.assertEqual(decode_fields(encode_fields(fields)), fields)
+        self.assertEqual(decode_fields(memoryview(bytes([OP_RESOLVE]) + encode_fields(fields))[1:]), fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
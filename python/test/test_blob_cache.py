@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import tempfile
+import unittest
+from mock import patch, Mock
+from src.blob_cache import BlobCache, git_blob_sha
+from src.json_parsers import parse_json
+from src.github_env_conf_loader import GithubEnvConfigLoader, GIT_CONF_TOKEN_KEY
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+SHARED_CONTENT = '{"section": {"key": "shared"}}'
+
+MOCK_BRANCHES = {
+    "dev": {
+        "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2",
+        "files": {
+            "global.json": SHARED_CONTENT,
+            "system.json": '{"section": {"key": "dev"}}',
+            "nested/other.json": "{}",
+        },
+    },
+    "dynamic-env": {
+        "sha": "f6e5d4c3b2a1f6e5d4c3b2a1f6e5d4c3b2a1f6e5",
+        "files": {
+            "global.json": SHARED_CONTENT,
+            "system.json": '{"section": {"key": "dynamic"}}',
+        },
+    },
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class BlobCacheTester(unittest.TestCase):
+    def setUp(self):
+        BlobCache.clear_memory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.server = GithubStubServer(MOCK_BRANCHES).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.cache_dir.cleanup()
+
+    def load_all(self, env):
+        loader = GithubEnvConfigLoader()
+        loader.set_options(
+            {**self.server.loader_options(), "github": {**self.server.loader_options()["github"], "listing": "trees"}, "blob_cache": {"dir": self.cache_dir.name}}
+        )
+        loader.set_env(env, [])
+        return {c: loader.load(c.lower()) for c in loader.list_categories()}
+
+    def blob_requests(self):
+        return [r for r in self.server.requests if "/git/blobs/" in r]
+
+    def test_trees_listing_lists_root_level_files(self):
+        self.assertEqual(
+            self.load_all("dev"),
+            {"GLOBAL": {"section": {"key": "shared"}}, "SYSTEM": {"section": {"key": "dev"}}},
+        )
+
+    def test_shared_files_are_downloaded_once_across_branches(self):
+        self.load_all("dev")
+        actual = self.load_all("dynamic-env")
+
+        self.assertEqual(actual["SYSTEM"], {"section": {"key": "dynamic"}})
+        # global.json is identical in both branches
+        self.assertEqual(len(self.blob_requests()), 3)
+
+    def test_disk_cache_survives_process_memory(self):
+        self.load_all("dev")
+        BlobCache.clear_memory()
+        self.server.reset_counters()
+
+        self.load_all("dev")
+
+        self.assertEqual(self.blob_requests(), [])
+
+    def test_memory_keeps_the_most_recently_used_blobs(self):
+        cache = BlobCache(self.cache_dir.name, memory_entries=2)
+        contents = [b'{"v": %d}' % i for i in range(3)]
+        fetch = Mock(side_effect=lambda content: content)
+
+        def get_json(content):
+            return cache.get_json(git_blob_sha(content), lambda: fetch(content))[0]
+
+        with patch("src.blob_cache.parse_json", wraps=parse_json) as parsing:
+            for content in contents + contents[1:]:
+                get_json(content)
+            self.assertEqual(parsing.call_count, 3)
+
+            # the least recently used one was dropped from memory (yet still served from disk)
+            self.assertEqual(get_json(contents[0]), {"v": 0})
+            self.assertEqual(parsing.call_count, 4)
+        self.assertEqual(fetch.call_count, 3)
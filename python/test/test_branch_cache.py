@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import tempfile
+import unittest
+from mock import patch, Mock
+from src.github_env_conf_loader import GithubEnvConfigLoader, GIT_CONF_TOKEN_KEY
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+MASTER_SHA = "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2"
+FALLBACK_LIST = ["other-missing", "master"]
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class BranchCacheTester(unittest.TestCase):
+    def setUp(self):
+        self.branches = {"master": {"sha": MASTER_SHA, "files": {"global.json": "{}"}}}
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.server = GithubStubServer(self.branches).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.cache_dir.cleanup()
+
+    def start_loader(self, ttl=300):
+        loader = GithubEnvConfigLoader()
+        loader.set_options(
+            {**self.server.loader_options(), "branch_cache": {"path": os.path.join(self.cache_dir.name, "branches.json"), "ttl": ttl}}
+        )
+        env_exists = loader.set_env("dynamic-missing", FALLBACK_LIST)
+        return loader, env_exists
+
+    def branch_requests(self):
+        return [r for r in self.server.requests if "/branches/" in r]
+
+    def test_restart_skips_known_404_probes(self):
+        self.start_loader()
+        self.assertEqual(len(self.branch_requests()), 3)
+        self.server.latency = 0.1
+        self.server.reset_counters()
+
+        loader, env_exists = self.start_loader()
+
+        self.assertTrue(env_exists)
+        self.assertEqual((loader._env, loader.revision()), ("master", MASTER_SHA))
+        # the cached branch head alone, ahead of the background revalidation probes
+        self.assertTrue(self.branch_requests()[0].endswith("/branches/master"), "expected the cached resolution to be used without probing")
+        loader._branch_revalidation.join()
+
+    def test_restart_serves_the_moved_head_of_the_cached_branch(self):
+        self.start_loader()
+        self.branches["master"]["sha"] = "e" * 40
+
+        loader, _ = self.start_loader()
+        loader._branch_revalidation.join()
+
+        self.assertEqual((loader._env, loader.revision()), ("master", "e" * 40))
+
+    def test_background_revalidation_refreshes_cache_for_next_start(self):
+        self.start_loader()
+        self.branches["dynamic-missing"] = {"sha": "f" * 40, "files": {}}
+
+        loader, _ = self.start_loader()
+        loader._branch_revalidation.join()
+        # this process keeps its resolution for its whole lifetime
+        self.assertEqual(loader._env, "master")
+
+        next_loader, _ = self.start_loader()
+        next_loader._branch_revalidation.join()
+        self.assertEqual((next_loader._env, next_loader.revision()), ("dynamic-missing", "f" * 40))
+
+    def test_expired_resolution_is_probed_again(self):
+        self.start_loader(ttl=0)
+        self.server.reset_counters()
+
+        loader, _ = self.start_loader(ttl=-1)
+
+        self.assertIsNone(loader._branch_revalidation)
+        self.assertEqual(len(self.branch_requests()), 3)
+
+    def test_failed_resolution_is_not_cached(self):
+        del self.branches["master"]
+        self.assertFalse(self.start_loader()[1])
+
+        self.branches["master"] = {"sha": MASTER_SHA, "files": {}}
+        loader, env_exists = self.start_loader()
+
+        self.assertTrue(env_exists)
+        self.assertIsNone(loader._branch_revalidation)
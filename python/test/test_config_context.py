@@ -194,3 +194,15 @@ class EnvConfigContextTester(unittest.TestCase):
         actual = validate_no_template_left(testee)
 
         self.assertFalse(actual, "expected test not to find a template but it did!!")
+
+    @patch.dict("os.environ", {ENV_VAR_NAME: ENV_NAME})
+    def test_fingerprint_changes_with_context_data(self):
+        testee = EnvConfigContext("staging")
+        other = EnvConfigContext("staging")
+        self.assertEqual(testee.fingerprint(), other.fingerprint())
+
+        testee.add("language", "russian")
+        self.assertNotEqual(testee.fingerprint(), other.fingerprint())
+
+        other.add("language", "russian")
+        self.assertEqual(testee.fingerprint(), other.fingerprint())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import tempfile
+import unittest
+from mock import Mock
+from src.config_snapshot import ConfigSnapshot
+from src.marshal_file import MARSHAL_FILE_HEADER
+
+from src.logger import Logger
+
+Logger.instance = Mock()
+
+CATEGORIES = ["GLOBAL", "SYSTEM"]
+CONFIG = {"global": {"section": {"key": 1, "list": [1.5, "a", None, True]}}}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class ConfigSnapshotTester(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.testee = ConfigSnapshot(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_saved_snapshot_is_loaded_back(self):
+        self.assertTrue(self.testee.save("qa", "a" * 40, "ctx", CATEGORIES, CONFIG))
+
+        self.assertEqual(
+            ConfigSnapshot(self.directory.name).load("qa", "a" * 40, "ctx"), {"categories": CATEGORIES, "config": CONFIG}
+        )
+
+    def test_snapshot_of_another_key_is_not_loaded(self):
+        self.testee.save("qa", "a" * 40, "ctx", CATEGORIES, CONFIG)
+
+        self.assertIsNone(self.testee.load("qa", "b" * 40, "ctx"))
+        self.assertIsNone(self.testee.load("qa", "a" * 40, "other-ctx"))
+        self.assertIsNone(self.testee.load("staging", "a" * 40, "ctx"))
+
+    def test_corrupted_snapshot_is_ignored(self):
+        self.testee.save("qa", "a" * 40, "ctx", CATEGORIES, CONFIG)
+        (snapshot_file,) = os.listdir(self.directory.name)
+        path = os.path.join(self.directory.name, snapshot_file)
+
+        with open(path, "r+b") as snapshot:
+            snapshot.truncate(MARSHAL_FILE_HEADER.size + 5)
+        self.assertIsNone(self.testee.load("qa", "a" * 40, "ctx"))
+
+        with open(path, "r+b") as snapshot:
+            snapshot.write(b"XXXXXX")
+        self.assertIsNone(self.testee.load("qa", "a" * 40, "ctx"))
+
+    def test_unserializable_config_is_not_saved(self):
+        self.assertFalse(self.testee.save("qa", "a" * 40, "ctx", CATEGORIES, {"global": {"section": object()}}))
+
+        self.assertIsNone(self.testee.load("qa", "a" * 40, "ctx"))
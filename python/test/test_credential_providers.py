@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import signal
+import tempfile
+import time
+import unittest
+from mock import patch, Mock
+from src.credential_providers import (
+    CachedCredentials,
+    ChainCredentialProvider,
+    CredentialProvider,
+    EnvCredentialProvider,
+    FileCredentialProvider,
+    GIT_CONF_TOKEN_KEY,
+)
+from src.github_env_conf_loader import GithubEnvConfigLoader
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class CountingProvider(CredentialProvider):
+    def __init__(self, ttl=None, delay=0):
+        self.fetches = 0
+        self.ttl = ttl
+        self.delay = delay
+
+    def fetch(self):
+        time.sleep(self.delay)
+        self.fetches += 1
+        return f"token-{self.fetches}", (time.time() + self.ttl if self.ttl is not None else None)
+
+
+class CredentialProvidersTester(unittest.TestCase):
+    @unittest.skipUnless(hasattr(os, "register_at_fork"), "requires os.register_at_fork")
+    def test_forked_child_is_not_blocked_by_the_parent_refresh(self):
+        provider = CountingProvider(ttl=-1)
+        testee = CachedCredentials(provider)
+        testee.token()
+
+        # forking while another thread of the parent holds the lock, in the middle of a refresh
+        testee._CachedCredentials__lock.acquire()
+        testee._CachedCredentials__refreshing = True
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                # a child blocked on the lock dies after a while, instead of hanging the tests
+                signal.alarm(5)
+                # an expired token, resolved again in the child
+                os.write(write_fd, testee.token().encode("utf-8"))
+            finally:
+                os._exit(0)
+        testee._CachedCredentials__lock.release()
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as result:
+            self.assertEqual(result.read(), "token-2")
+
+    def test_token_is_resolved_once(self):
+        provider = CountingProvider()
+        testee = CachedCredentials(provider)
+        resolutions = CachedCredentials.resolutions
+
+        tokens = {testee.token() for _ in range(100)}
+
+        self.assertEqual(tokens, {"token-1"})
+        self.assertEqual(provider.fetches, 1)
+        self.assertEqual(CachedCredentials.resolutions - resolutions, 1)
+
+    def test_token_is_refreshed_ahead_of_expiry_in_background(self):
+        provider = CountingProvider(ttl=10, delay=0)
+        testee = CachedCredentials(provider, refresh_ahead=60)
+        self.assertEqual(testee.token(), "token-1")
+
+        # within the refresh ahead window - the valid token is served while refreshing
+        provider.delay = 0.2
+        started = time.perf_counter()
+        self.assertEqual(testee.token(), "token-1")
+        self.assertLess(time.perf_counter() - started, 0.1)
+
+        time.sleep(0.4)
+        self.assertEqual(testee.token(), "token-2")
+
+    def test_expired_token_is_resolved_synchronously(self):
+        provider = CountingProvider(ttl=-1)
+        testee = CachedCredentials(provider)
+
+        self.assertEqual(testee.token(), "token-1")
+        self.assertEqual(testee.token(), "token-2")
+
+    def test_missing_token_raises(self):
+        testee = CachedCredentials(EnvCredentialProvider("SOME_MISSING_TOKEN_VAR"))
+
+        with self.assertRaises(Exception):
+            testee.token()
+
+    @patch.dict("os.environ", {"SOME_TOKEN_VAR": ""})
+    def test_chain_uses_first_provider_yielding_a_token(self):
+        with tempfile.NamedTemporaryFile("w", delete=False) as token_file:
+            token_file.write("file-token\n")
+        try:
+            testee = ChainCredentialProvider([EnvCredentialProvider("SOME_TOKEN_VAR"), FileCredentialProvider(token_file.name)])
+            self.assertEqual(testee.fetch(), ("file-token", None))
+        finally:
+            os.remove(token_file.name)
+
+    @patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+    def test_loaders_resolve_the_token_once_per_process(self):
+        server = GithubStubServer({"master": {"sha": "0" * 40, "files": {"global.json": "{}"}}}).start()
+        options = {**server.loader_options(), "credentials": {"provider": "env", "var_name": GIT_CONF_TOKEN_KEY}}
+        resolutions = CachedCredentials.resolutions
+        try:
+            for _ in range(3):
+                loader = GithubEnvConfigLoader()
+                loader.set_options(options)
+                loader.set_env("dynamic-missing", ["master"])
+                loader.list_categories()
+                loader.load("global")
+        finally:
+            server.stop()
+
+        self.assertEqual(CachedCredentials.resolutions - resolutions, 1)
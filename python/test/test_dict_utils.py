@@ -5,7 +5,9 @@
 #############################################################################
 import unittest
 
-from src.dict_utils import override_dict
+from types import MappingProxyType
+
+from src.dict_utils import flatten_dict, freeze_dict, index_paths, override_dict, thaw_dict
 
 
 #############################################################################
@@ -85,3 +87,25 @@ class DictUtilsTester(unittest.TestCase):
             expected,
             "expected to find a list_override_and_add_mix ",
         )
+
+    def test_freeze_and_thaw(self):
+        a = {"a": 1, "n": {"x": ["a", {"b": 2}]}}
+
+        frozen = freeze_dict(a)
+        self.assertIsInstance(frozen["n"], MappingProxyType)
+        self.assertEqual(frozen["n"]["x"][1]["b"], 2)
+        with self.assertRaises(TypeError):
+            frozen["n"]["y"] = 1
+        self.assertEqual(flatten_dict(frozen), {"a": 1, "n.x": ("a", frozen["n"]["x"][1])})
+
+        self.assertEqual(thaw_dict(frozen), a)
+        self.assertIsInstance(thaw_dict(frozen)["n"], dict)
+
+    def test_index_paths(self):
+        a = {"a": 1, "n": {"x": {"y": [1]}}}
+
+        self.assertEqual(
+            index_paths(a),
+            {"a": 1, "n": {"x": {"y": [1]}}, "n.x": {"y": [1]}, "n.x.y": [1]},
+        )
+        self.assertIs(index_paths(a)["n.x"], a["n"]["x"])
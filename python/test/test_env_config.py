@@ -3,14 +3,29 @@
 #############################################################################
 # IMPORT MODULES                                                            #
 #############################################################################
+import asyncio
+import gc
+import os
+import tempfile
+import threading
+import time
 import unittest
+import uuid
+from types import MappingProxyType
 from mock import patch, Mock
 from src.env_config import EnvConfig
 from src.config_context_handler import EnvConfigContext
+from src.config_snapshot import ConfigSnapshot
+from src.dict_utils import index_paths
+from src.shared_config_store import SharedConfigStore
 from src.env_config import TWIST_ENV_KEY
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
 
 from src.logger import Logger
+from src.async_github_env_conf_loader import AsyncGithubEnvConfigLoader
 from .mock_env_loader import GithubMockEnvConfig
+from .github_stub_server import GithubStubServer
 
 Logger.instance = Mock()
 
@@ -37,6 +52,26 @@ MOCK_DATA = {
 #############################################################################
 
 
+class SlowMockEnvConfig(GithubMockEnvConfig):
+    """
+    Mock loader taking a while to load a category (so concurrent first accesses overlap)
+    """
+
+    def __init__(self, latency, failing=()):
+        super().__init__()
+        self.__latency = latency
+        self.__failing = failing
+        self.__lock = threading.Lock()
+
+    def load(self, category):
+        time.sleep(self.__latency)
+        with self.__lock:
+            loaded = super().load(category)
+        if category.upper() in self.__failing:
+            raise Exception(f"failed loading {category}")
+        return loaded
+
+
 class EnvConfigTester(unittest.TestCase):
 
     testee = None
@@ -136,3 +171,521 @@ class EnvConfigTester(unittest.TestCase):
         self.assertEqual(
             actual, expected, "expected get of existing value to return the value",
         )
+
+    def test_prefetch_loads_all_categories_once(self):
+        categories = ["PREFETCH_A", "PREFETCH_B", "PREFETCH_C"]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        self.mock_conf(categories, data)
+
+        self.testee.prefetch_categories(categories + ["PREFETCH_A"], max_workers=2)
+
+        self.assertEqual(sorted(self.conf_loader.loaded), ["prefetch_a", "prefetch_b", "prefetch_c"])
+        self.assertEqual(EnvConfig.PREFETCH_B(SECTION_NAME, GENE_KEY_NAME_A), "PREFETCH_B")
+
+    def test_require_category_skips_already_loaded_category(self):
+        self.mock_conf(["REQUIRED_A"], {"REQUIRED_A": {SECTION_NAME: {GENE_KEY_NAME_A: 1}}})
+
+        EnvConfig.get("REQUIRED_A", SECTION_NAME, GENE_KEY_NAME_A)
+        self.testee.require_category("REQUIRED_A")
+
+        self.assertEqual(self.conf_loader.loaded, ["required_a"])
+
+    def test_aget_shares_loaded_config_with_sync_get(self):
+        categories = ["ASYNC_A", "ASYNC_B"]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        self.mock_conf(categories, data)
+        self.testee.set_async_loader(AsyncGithubEnvConfigLoader(self.conf_loader))
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(EnvConfig.aprefetch(categories))
+            actual = loop.run_until_complete(EnvConfig.aget("ASYNC_B", SECTION_NAME, GENE_KEY_NAME_A))
+        finally:
+            loop.close()
+
+        self.assertEqual(actual, "ASYNC_B")
+        self.assertEqual(EnvConfig.ASYNC_A(SECTION_NAME, GENE_KEY_NAME_A), "ASYNC_A")
+        self.assertEqual(sorted(self.conf_loader.loaded), ["async_a", "async_b"])
+
+    def test_aget_shares_in_flight_load_with_sync_get(self):
+        self.conf_loader = SlowMockEnvConfig(latency=0.2)
+        self.conf_loader.set_env("dummy", [])
+        self.mock_conf(["ASYNC_FLIGHT"], {"ASYNC_FLIGHT": {SECTION_NAME: {GENE_KEY_NAME_A: 1}}})
+        self.testee.set_async_loader(AsyncGithubEnvConfigLoader(self.conf_loader))
+
+        sync_get = threading.Thread(target=EnvConfig.get, args=("ASYNC_FLIGHT", SECTION_NAME, GENE_KEY_NAME_A))
+        sync_get.start()
+        time.sleep(0.05)
+        loop = asyncio.new_event_loop()
+        try:
+            actual = loop.run_until_complete(EnvConfig.aget("ASYNC_FLIGHT", SECTION_NAME, GENE_KEY_NAME_A))
+        finally:
+            loop.close()
+        sync_get.join()
+
+        self.assertEqual(actual, 1)
+        self.assertEqual(self.conf_loader.loaded, ["async_flight"])
+
+    def test_version_is_the_loader_revision(self):
+        self.mock_conf([GLOBAL_CATEGORY], MOCK_DATA)
+        self.conf_loader._revision = "a1b2c3d4"
+
+        self.assertEqual(EnvConfig.version(), "a1b2c3d4")
+
+    def test_get_path_reaches_any_depth(self):
+        data = {"PATHS": {"person": {"address": {"city": {"name": "Haifa"}}, "tags": ["a"]}}}
+        self.mock_conf(["PATHS"], data)
+
+        self.assertEqual(EnvConfig.get_path("paths", "person.address.city.name"), "Haifa")
+        self.assertEqual(EnvConfig.get_path("PATHS", "person.address"), {"city": {"name": "Haifa"}})
+        self.assertEqual(EnvConfig.get_path("paths", "person.tags"), ["a"])
+        self.assertEqual(EnvConfig.get_path("paths", "person.address.zip", DEFAULT_VALUE), DEFAULT_VALUE)
+        self.assertEqual(EnvConfig.get_path("paths", "person.tags.0", DEFAULT_VALUE), DEFAULT_VALUE)
+
+    def test_get_path_index_follows_the_loaded_category(self):
+        self.mock_conf(["PATHS_RELOADED"], {"PATHS_RELOADED": {"a": {"b": 1}}})
+
+        with patch("src.env_config.index_paths", wraps=index_paths) as indexing:
+            self.assertEqual(EnvConfig.get_path("paths_reloaded", "a.b"), 1)
+            self.assertEqual(EnvConfig.get_path("paths_reloaded", "a.b"), 1)
+            self.assertEqual(indexing.call_count, 1)
+
+            # replaced (ex. reloaded) category - indexed again
+            self.testee._EnvConfig__config_json["paths_reloaded"] = {"a": {"b": 2}}
+            self.assertEqual(EnvConfig.get_path("paths_reloaded", "a.b"), 2)
+            self.assertEqual(indexing.call_count, 2)
+
+    def test_typed_accessors_coerce(self):
+        data = {"TYPED": {"timeouts": {"retries": "3", "ratio": 0.5, "http": "1m30s", "verbose": "on", "buffer": "4KiB", "ports": "80, 443"}}}
+        self.mock_conf(["TYPED"], data)
+
+        self.assertEqual(EnvConfig.get_int("typed", "timeouts", "retries"), 3)
+        self.assertEqual(EnvConfig.get_float("TYPED", "timeouts", "ratio"), 0.5)
+        self.assertEqual(EnvConfig.get_duration("typed", "timeouts", "http"), 90.0)
+        self.assertIs(EnvConfig.get_bool("typed", "timeouts", "verbose"), True)
+        self.assertEqual(EnvConfig.get_bytes("typed", "timeouts", "buffer"), 4096)
+        self.assertEqual(EnvConfig.get_list("typed", "timeouts", "ports", item_type=int), (80, 443))
+        self.assertEqual(EnvConfig.get_list("typed", "timeouts", "ports"), ("80", "443"))
+        self.assertEqual(EnvConfig.get_list("typed", "timeouts", "missing", []), [])
+        self.assertEqual(EnvConfig.get_int("typed", "timeouts", "missing", DEFAULT_VALUE), DEFAULT_VALUE)
+        self.assertEqual(EnvConfig.get_int("typed", "missing", "retries", DEFAULT_VALUE), DEFAULT_VALUE)
+
+        with self.assertRaisesRegex(ValueError, "typed/timeouts/http"):
+            EnvConfig.get_int("typed", "timeouts", "http")
+
+    def test_typed_accessors_reject_non_finite_values(self):
+        self.mock_conf(["TYPED_INF"], {"TYPED_INF": {"limits": {"huge": float("inf"), "text": "inf"}}})
+
+        for accessor in [EnvConfig.get_int, EnvConfig.get_bytes, EnvConfig.get_duration]:
+            for key in ["huge", "text"]:
+                with self.assertRaisesRegex(ValueError, f"typed_inf/limits/{key}"):
+                    accessor("typed_inf", "limits", key)
+
+    def test_typed_values_are_memoized_until_reloaded(self):
+        self.mock_conf(["TYPED_RELOADED"], {"TYPED_RELOADED": {"timeouts": {"http": "30s"}}})
+        parser = Mock(side_effect=lambda value: value.upper())
+
+        self.assertEqual(EnvConfig.get_typed("typed_reloaded", "timeouts", "http", parser), "30S")
+        self.assertEqual(EnvConfig.get_typed("typed_reloaded", "timeouts", "http", parser), "30S")
+        self.assertEqual(parser.call_count, 1)
+
+        # replaced (ex. reloaded) category - coerced again
+        self.testee._EnvConfig__config_json["typed_reloaded"] = {"timeouts": {"http": "1m"}}
+        self.assertEqual(EnvConfig.get_typed("typed_reloaded", "timeouts", "http", parser), "1M")
+        self.assertEqual(parser.call_count, 2)
+
+    def test_typed_values_memo_is_bounded_by_the_keys(self):
+        self.mock_conf(["TYPED_ADHOC"], {"TYPED_ADHOC": {"timeouts": {"http": "30"}}})
+
+        for _ in range(10):
+            self.assertEqual(EnvConfig.get_typed("typed_adhoc", "timeouts", "http", lambda value: int(value)), 30)
+
+        self.assertEqual(len(self.testee._EnvConfig__typed_values["typed_adhoc"][1]), 1)
+
+    def test_immutable_categories_are_returned_read_only(self):
+        self.mock_conf(["IMMUTABLE"], {"IMMUTABLE": {"section": {"key": {"a": 1}, "list": [1, {"b": 2}]}}})
+        self.assertIsInstance(EnvConfig.get("immutable", "section", None), dict)
+
+        try:
+            # the loaded category is converted, later loaded ones are stored read only
+            self.testee.set_immutable()
+            self.mock_conf(["IMMUTABLE", "IMMUTABLE_LATER"], {"IMMUTABLE": {}, "IMMUTABLE_LATER": {"section": {"key": [1]}}})
+
+            section = EnvConfig.get("immutable", "section", None)
+            self.assertTrue(EnvConfig.is_immutable())
+            self.assertIs(section, EnvConfig.get("immutable", "section", None))
+            self.assertEqual(section["list"], (1, {"b": 2}))
+            self.assertIsInstance(EnvConfig.get_path("immutable", "section.key"), MappingProxyType)
+            self.assertEqual(EnvConfig.get("immutable_later", "section", "key"), (1,))
+            with self.assertRaises(TypeError):
+                section["key"]["a"] = 2
+            with self.assertRaises(TypeError):
+                EnvConfig.get("immutable", None, None)["section"] = {}
+        finally:
+            self.testee.set_immutable(False)
+
+        self.assertEqual(type(EnvConfig.get("immutable", "section", "list")), list)
+
+    def test_immutable_categories_returned_as_plain_dicts(self):
+        self.mock_conf(["IMMUTABLE_PLAIN"], {"IMMUTABLE_PLAIN": {"section": {"key": {"a": 1}, "list": [1, {"b": 2}]}}})
+
+        try:
+            self.testee.set_immutable(plain_dicts=True)
+
+            section = EnvConfig.get("immutable_plain", "section", None)
+            self.assertEqual(section, {"key": {"a": 1}, "list": [1, {"b": 2}]})
+            self.assertEqual(type(EnvConfig.get_path("immutable_plain", "section.key")), dict)
+            # a copy - the loaded category is left untouched
+            section["key"]["a"] = 2
+            self.assertEqual(EnvConfig.get("immutable_plain", "section", "key"), {"a": 1})
+            self.assertIsInstance(self.testee._EnvConfig__config_json["immutable_plain"], MappingProxyType)
+        finally:
+            self.testee.set_immutable(False)
+
+    def __access_concurrently(self, categories, threads_per_category):
+        barrier = threading.Barrier(len(categories) * threads_per_category)
+        results, errors = [], []
+
+        def access(category):
+            barrier.wait()
+            try:
+                results.append((category, EnvConfig.get(category, SECTION_NAME, GENE_KEY_NAME_A)))
+            except BaseException as ex:
+                errors.append((category, ex))
+
+        threads = [threading.Thread(target=access, args=(c,)) for c in categories for _ in range(threads_per_category)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_first_access_loads_each_category_once(self):
+        categories = [f"FLIGHT_{i}" for i in range(4)]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        self.conf_loader = SlowMockEnvConfig(latency=0.2)
+        self.conf_loader.set_env("dummy", [])
+        self.mock_conf(categories, data)
+
+        started = time.perf_counter()
+        results, errors = self.__access_concurrently(categories, threads_per_category=16)
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(results), sorted((c, c) for c in categories for _ in range(16)))
+        self.assertEqual(sorted(self.conf_loader.loaded), [c.lower() for c in categories])
+        # categories load concurrently (a single latency, not one per category)
+        self.assertLess(elapsed, 0.6)
+
+    def test_concurrent_first_access_shares_load_failure(self):
+        self.conf_loader = SlowMockEnvConfig(latency=0.2, failing=["FLIGHT_FAIL"])
+        self.conf_loader.set_env("dummy", [])
+        self.mock_conf(["FLIGHT_FAIL"], {"FLIGHT_FAIL": {}})
+
+        results, errors = self.__access_concurrently(["FLIGHT_FAIL"], threads_per_category=8)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 8)
+        self.assertEqual(self.conf_loader.loaded, ["flight_fail"])
+
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME})
+    def test_loaded_config_is_snapshotted(self):
+        categories = ["SNAP_A", "SNAP_B"]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        snapshot_dir = tempfile.TemporaryDirectory()
+        self.conf_loader._revision = "a1b2c3d4"
+        try:
+            self.testee.set_snapshot(ConfigSnapshot(snapshot_dir.name))
+            self.mock_conf(categories, data)
+            self.testee.prefetch_categories(categories)
+            self.testee.save_snapshot()
+
+            snapshot = ConfigSnapshot(snapshot_dir.name).load(
+                EnvConfig.env(), "a1b2c3d4", EnvConfigContext(ENV_NAME).fingerprint()
+            )
+        finally:
+            self.testee.set_snapshot(None)
+            snapshot_dir.cleanup()
+
+        # (the singleton keeps the categories listed by the other tests as well)
+        self.assertTrue(set(categories) <= set(snapshot["categories"]))
+        self.assertEqual(snapshot["config"]["snap_b"], data["SNAP_B"])
+
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME})
+    def test_matching_snapshot_is_used_instead_of_loading(self):
+        snapshot_dir = tempfile.TemporaryDirectory()
+        fingerprint = EnvConfigContext(ENV_NAME).fingerprint()
+        ConfigSnapshot(snapshot_dir.name).save(
+            EnvConfig.env(), "a1b2c3d4", fingerprint, ["SNAP_C"], {"snap_c": {SECTION_NAME: {GENE_KEY_NAME_A: "snapshot"}}}
+        )
+        warm_loader = Mock(wraps=GithubMockEnvConfig())
+        warm_loader.set_env.return_value = True
+        warm_loader.revision.return_value = "a1b2c3d4"
+        try:
+            self.testee.set_snapshot(ConfigSnapshot(snapshot_dir.name))
+            self.testee.set_loader(warm_loader)
+
+            self.assertEqual(EnvConfig.SNAP_C(SECTION_NAME, GENE_KEY_NAME_A), "snapshot")
+        finally:
+            self.testee.set_snapshot(None)
+            snapshot_dir.cleanup()
+
+        warm_loader.list_categories.assert_not_called()
+        warm_loader.load.assert_not_called()
+
+    @unittest.skipUnless(SharedConfigStore.is_supported(), "requires multiprocessing.shared_memory")
+    def test_shared_store_is_published_then_attached_to(self):
+        store_name = f"envconfig_test_{uuid.uuid4().hex[:12]}"
+        categories = ["SHARED_A", "SHARED_B"]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        self.conf_loader._revision = "a1b2c3d4"
+        try:
+            # the first process of the host - loads and publishes
+            self.testee.set_shared_store(SharedConfigStore(store_name))
+            self.mock_conf(categories, data)
+            self.testee.prefetch_categories(categories)
+            self.testee.publish_shared_store()
+
+            # another process - attaches, no verification, listing nor loading
+            self.testee.set_shared_store(SharedConfigStore(store_name))
+            attached_loader = Mock(wraps=GithubMockEnvConfig())
+            self.testee.set_loader(attached_loader)
+
+            self.assertEqual(EnvConfig.SHARED_B(SECTION_NAME, GENE_KEY_NAME_A), "SHARED_B")
+            attached_loader.set_env.assert_not_called()
+            attached_loader.list_categories.assert_not_called()
+            attached_loader.load.assert_not_called()
+            attached_loader.pin.assert_called_once_with(ENV_NAME, "a1b2c3d4")
+
+            # the publisher reloads and publishes a new generation - followed by the attached process
+            SharedConfigStore(store_name).publish(ENV_NAME, "e5f6", categories, {"shared_b": {SECTION_NAME: {GENE_KEY_NAME_A: "next"}}})
+            # polling slow enough for the just published generation to be followed rather than taken over
+            self.testee.start_refresher(interval=0.5)
+            deadline = time.time() + 5
+            while EnvConfig.SHARED_B(SECTION_NAME, GENE_KEY_NAME_A) != "next" and time.time() < deadline:
+                time.sleep(0.01)
+            self.testee.stop_refresher()
+
+            self.assertEqual(EnvConfig.SHARED_B(SECTION_NAME, GENE_KEY_NAME_A), "next")
+            self.assertEqual(EnvConfig.version(), "e5f6")
+        finally:
+            self.testee.stop_refresher()
+            self.testee.set_shared_store(None)
+            SharedConfigStore(store_name).unlink()
+
+    @unittest.skipUnless(SharedConfigStore.is_supported(), "requires multiprocessing.shared_memory")
+    def test_shared_store_publishes_the_listing_then_lazily_loaded_categories(self):
+        store_name = f"envconfig_test_{uuid.uuid4().hex[:12]}"
+        categories = ["LAZY_SHARED_A", "LAZY_SHARED_B"]
+        data = {c: {SECTION_NAME: {GENE_KEY_NAME_A: c}} for c in categories}
+        self.conf_loader._revision = "a1b2c3d4"
+        store = SharedConfigStore(store_name)
+        try:
+            # no categories declared - nothing loaded at startup, yet the waiting processes must not be held off
+            self.testee.set_shared_store(store)
+            self.mock_conf(categories, data)
+            self.testee.publish_shared_store()
+
+            self.assertFalse(store.holds_publisher_lock())
+            published = SharedConfigStore(store_name).read()
+            self.assertLessEqual(set(categories), set(published["categories"]))
+            self.assertNotIn("lazy_shared_b", published["config"])
+
+            EnvConfig.LAZY_SHARED_B(SECTION_NAME, GENE_KEY_NAME_A)
+            deadline = time.time() + 5
+            while SharedConfigStore(store_name).generation() == published["generation"] and time.time() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(SharedConfigStore(store_name).read()["config"]["lazy_shared_b"], data["LAZY_SHARED_B"])
+        finally:
+            self.testee.set_shared_store(None)
+            SharedConfigStore(store_name).unlink()
+
+    @unittest.skipUnless(SharedConfigStore.is_supported(), "requires multiprocessing.shared_memory")
+    def test_attached_process_takes_over_once_the_shared_store_stops_advancing(self):
+        store_name = f"envconfig_test_{uuid.uuid4().hex[:12]}"
+        categories = ["TAKEOVER_A"]
+        self.conf_loader._revision = "a1b2c3d4"
+        try:
+            self.testee.set_shared_store(SharedConfigStore(store_name))
+            self.mock_conf(categories, {"TAKEOVER_A": {SECTION_NAME: {GENE_KEY_NAME_A: 1}}})
+            self.testee.prefetch_categories(categories)
+            self.testee.publish_shared_store()
+            published = SharedConfigStore(store_name).read()
+
+            # attached, while its publisher is gone - the segment is never published nor touched again
+            self.testee.set_shared_store(SharedConfigStore(store_name))
+            self.testee.set_loader(Mock(wraps=GithubMockEnvConfig()))
+            self.testee.start_refresher(interval=0.05)
+            deadline = time.time() + 5
+            while SharedConfigStore(store_name).generation() == published["generation"] and time.time() < deadline:
+                time.sleep(0.01)
+            self.testee.stop_refresher()
+
+            republished = SharedConfigStore(store_name).read()
+            self.assertGreater(republished["generation"], published["generation"])
+            self.assertEqual(republished["config"]["takeover_a"], {SECTION_NAME: {GENE_KEY_NAME_A: 1}})
+            self.assertIsNone(self.testee._EnvConfig__shared_generation)
+        finally:
+            self.testee.stop_refresher()
+            self.testee.set_shared_store(None)
+            SharedConfigStore(store_name).unlink()
+
+
+def reload_branches(category, sha, value):
+    return {"master": {"sha": sha * 40, "files": {f"{category.lower()}.json": '{"section": {"key": %s}}' % value}}}
+
+
+class EnvConfigReloadTester(unittest.TestCase):
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME, GIT_CONF_TOKEN_KEY: "dummy-token"})
+    def setUp(self):
+        self.testee = EnvConfig.instance()
+        self.testee.set_context_handler(EnvConfigContext(ENV_NAME))
+        # the singleton keeps the categories loaded by other tests, a reload requires all of them to still exist
+        self.testee._EnvConfig__config_json = {}
+        self.category = self._testMethodName.upper()
+        self.server = GithubStubServer(reload_branches(self.category, "a", '"old"')).start()
+
+        loader = EnvConfigLoaderFactory().get_loader("github")
+        loader.set_options(self.server.loader_options())
+        self.testee.set_loader(loader)
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "old")
+
+    def tearDown(self):
+        self.testee.stop_refresher()
+        self.server.stop()
+
+    def test_reload_installs_the_new_revision(self):
+        self.server.branches = reload_branches(self.category, "b", '"new"')
+
+        self.assertTrue(self.testee.reload())
+
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "new")
+        self.assertEqual(EnvConfig.version(), "b" * 40)
+        self.assertEqual(EnvConfig.last_reload()["revision"], "b" * 40)
+        self.assertEqual(EnvConfig.last_reload()["categories"], 1)
+
+    def test_failed_reload_keeps_the_loaded_config(self):
+        self.server.branches = reload_branches(self.category, "c", "{not json")
+
+        self.assertFalse(self.testee.reload())
+
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "old")
+        self.assertEqual(EnvConfig.version(), "a" * 40)
+
+    def test_refresher_reloads_once_the_branch_moves(self):
+        self.testee.start_refresher(interval=0.05)
+        time.sleep(0.2)
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "old")
+
+        self.server.branches = reload_branches(self.category, "d", '"refreshed"')
+
+        deadline = time.time() + 5
+        while EnvConfig.get(self.category, "section", "key") != "refreshed" and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "refreshed")
+
+
+class ResettableMockEnvConfig(GithubMockEnvConfig):
+    """
+    Mock loader counting its connection resets (see EnvConfigLoader::reset_connections)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.resets = 0
+
+    def reset_connections(self):
+        self.resets += 1
+
+
+def private_dirty_kb():
+    with open("/proc/self/smaps_rollup") as smaps:
+        for line in smaps:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1])
+    return 0
+
+
+def run_forked(child):
+    """
+    Runs child() in a forked child process
+
+    Returns:
+        str -- what child() returned
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, str(child()).encode("utf-8"))
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as result:
+        return result.read()
+
+
+@unittest.skipUnless(hasattr(os, "fork") and hasattr(gc, "freeze") and os.path.exists("/proc/self/smaps_rollup"), "linux only")
+class EnvConfigFreezeTester(unittest.TestCase):
+    CATEGORY = "FROZEN"
+
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME})
+    def setUp(self):
+        self.testee = EnvConfig.instance()
+        self.testee.set_context_handler(EnvConfigContext(ENV_NAME))
+        self.testee._EnvConfig__config_json = {}
+
+        self.loader = ResettableMockEnvConfig()
+        self.loader.mock_set_categories([self.CATEGORY])
+        # about 20MB of loaded configuration
+        self.loader.mock_set_data(
+            {
+                self.CATEGORY: {
+                    f"section{i}": {"url": f"https://host/api/{i}", "retries": i, "tags": [f"tag{i}", "b"]} for i in range(50000)
+                }
+            }
+        )
+        self.testee.set_loader(self.loader)
+        self.testee.require_category(self.CATEGORY)
+
+    def tearDown(self):
+        gc.unfreeze()
+        self.testee._EnvConfig__frozen = False
+        self.testee._EnvConfig__immutable = False
+        self.testee._EnvConfig__config_json = {}
+
+    def test_frozen_config_is_read_only(self):
+        EnvConfig.freeze()
+
+        self.assertTrue(EnvConfig.is_frozen())
+        section = EnvConfig.get(self.CATEGORY, "section1", None)
+        self.assertIsInstance(section, MappingProxyType)
+        self.assertEqual(section["tags"], ("tag1", "b"))
+        with self.assertRaises(TypeError):
+            section["retries"] = 2
+        self.assertEqual(EnvConfig.to_flat_map(self.CATEGORY.lower())["section1.retries"], 1)
+
+    def test_forked_children_share_the_frozen_config_pages(self):
+        def collect_and_read():
+            before = private_dirty_kb()
+            gc.collect()
+            EnvConfig.get(self.CATEGORY, "section1", "url")
+            return private_dirty_kb() - before
+
+        # collecting in a child touches (and so copies) every page holding the loaded config
+        not_frozen_kb = int(run_forked(collect_and_read))
+
+        EnvConfig.freeze()
+        frozen_kb = int(run_forked(collect_and_read))
+
+        self.assertGreater(not_frozen_kb, 5 * 1024)
+        self.assertLess(frozen_kb, not_frozen_kb / 10, f"{frozen_kb}KB copied by the child vs {not_frozen_kb}KB when not frozen")
+
+    def test_forked_children_reset_the_loader_connections(self):
+        EnvConfig.freeze()
+
+        self.assertEqual(run_forked(lambda: self.loader.resets), "1")
+        self.assertEqual(self.loader.resets, 0)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import subprocess
+import tempfile
+import unittest
+from mock import Mock
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+
+from src.logger import Logger
+
+Logger.instance = Mock()
+
+MASTER_FILES = {
+    "global.json": '{"section": {"key": 1}}',
+    "system.json": "{section: {key: 'master'}}",
+    "notes.txt": "not a category",
+    "dev/global.json": '{"section": {"key": "dev folder"}}',
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class GitEnvConfigLoaderTester(unittest.TestCase):
+    def git(self, *args):
+        subprocess.run(
+            ["git", "-C", self.work_tree.name, "-c", "user.name=test", "-c", "user.email=test@test"] + list(args),
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def commit_files(self, files, message):
+        for file_path, content in files.items():
+            full_path = os.path.join(self.work_tree.name, file_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as config_file:
+                config_file.write(content)
+        self.git("add", "-A")
+        self.git("commit", "-m", message)
+
+    def setUp(self):
+        # a throwaway repo (master + "qa" and "dynamic-some-env" branches), mirrored into a bare clone like on the hosts
+        self.work_tree = tempfile.TemporaryDirectory()
+        self.mirror = tempfile.TemporaryDirectory()
+        self.git("init", "-b", "master")
+        self.commit_files(MASTER_FILES, "master")
+        self.git("checkout", "-b", "qa")
+        self.commit_files({"global.json": '{"section": {"key": "qa"}}'}, "qa")
+        self.git("checkout", "master")
+        self.git("branch", "dynamic-some-env")
+        subprocess.run(
+            ["git", "clone", "--mirror", self.work_tree.name, self.mirror.name], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+
+        self.testee = EnvConfigLoaderFactory().get_loader("git")
+        self.testee.set_options({"git": {"path": self.mirror.name}})
+
+    def tearDown(self):
+        self.testee.close()
+        self.work_tree.cleanup()
+        self.mirror.cleanup()
+
+    def test_missing_branch_falls_back_and_pins_commit(self):
+        self.assertTrue(self.testee.set_env("dynamic-missing", ["qa", "master"]))
+
+        self.assertEqual(self.testee._env, "qa")
+        self.assertEqual(len(self.testee.revision()), 40)
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "qa"}})
+
+    def test_no_branch_found_returns_false(self):
+        self.assertFalse(self.testee.set_env("dynamic-missing", ["other-missing"]))
+
+    def test_lists_and_loads_through_single_cat_file_process(self):
+        self.testee.set_env("master", [])
+
+        self.assertEqual(sorted(self.testee.list_categories()), ["GLOBAL", "SYSTEM"])
+        self.assertEqual(self.testee.load("global"), {"section": {"key": 1}})
+        cat_file = self.testee._GitEnvConfigLoader__cat_file
+        self.assertEqual(self.testee.load("system"), {"section": {"key": "master"}})
+        self.assertIs(self.testee._GitEnvConfigLoader__cat_file, cat_file)
+
+    def test_missing_category_returns_empty(self):
+        self.testee.set_env("master", [])
+
+        self.assertEqual(self.testee.load("missing"), {})
+        # the batch process survives missing objects
+        self.assertEqual(self.testee.load("global"), {"section": {"key": 1}})
+
+    def test_v2_reads_env_folder(self):
+        self.testee.set_version(2)
+        self.testee.set_env("dynamic-some-env", [])
+
+        self.assertEqual(self.testee.list_categories(), ["GLOBAL"])
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "dev folder"}})
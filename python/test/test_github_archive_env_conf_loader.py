@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import unittest
+from mock import patch, Mock
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+MOCK_BRANCHES = {
+    "master": {
+        "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2",
+        "files": {
+            "global.json": '{"section": {"key": 1}}',
+            "system.json": '{"section": {"key": "master"}}',
+            "README.md": "not a category",
+            "nested/other.json": '{"section": {"key": "nested"}}',
+            "dev/global.json": '{"section": {"key": "dev folder"}}',
+        },
+    },
+}
+MOCK_BRANCHES["dynamic-some-env"] = {**MOCK_BRANCHES["master"], "sha": "b" * 40}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class GithubArchiveEnvConfigLoaderTester(unittest.TestCase):
+    def setUp(self):
+        self.server = GithubStubServer(MOCK_BRANCHES).start()
+        self.testee = EnvConfigLoaderFactory().get_loader("github-archive")
+        self.testee.set_options(self.server.loader_options())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_loads_all_categories_from_a_single_archive(self):
+        self.testee.set_env("dynamic-missing", ["master"])
+        self.server.reset_counters()
+
+        categories = sorted(self.testee.list_categories())
+        actual = [self.testee.load(c.lower()) for c in categories]
+
+        self.assertEqual(categories, ["GLOBAL", "SYSTEM"])
+        self.assertEqual(actual, [{"section": {"key": 1}}, {"section": {"key": "master"}}])
+        self.assertEqual(len(self.server.requests), 1, "expected a single archive download")
+
+    def test_v2_reads_env_folder(self):
+        self.testee.set_version(2)
+        # v2 files of dynamic envs reside in the dev folder
+        self.testee.set_env("dynamic-some-env", [])
+
+        self.assertEqual(self.testee.list_categories(), ["GLOBAL"])
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "dev folder"}})
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import asyncio
+import time
+import unittest
+from mock import patch, Mock
+from src.github_env_conf_loader import GithubEnvConfigLoader, GIT_CONF_TOKEN_KEY
+from src.async_github_env_conf_loader import AsyncGithubEnvConfigLoader
+from src.http_session import create_http_session
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+MOCK_BRANCHES = {
+    "master": {
+        "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2",
+        "files": {
+            "global.json": '{"section": {"key": 1}}',
+            "system.json": '{"section": {"key": "master"}}',
+            "dev/global.json": '{"section": {"key": 2}}',
+        },
+    },
+    "dev": {
+        "sha": "f6e5d4c3b2a1f6e5d4c3b2a1f6e5d4c3b2a1f6e5",
+        "files": {"global.json": '{"section": {"key": "dev"}}'},
+    },
+    "broken": {"sha": "0" * 40, "files": {}, "status": 500},
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class GithubEnvConfigLoaderTester(unittest.TestCase):
+    def setUp(self):
+        self.server = GithubStubServer(MOCK_BRANCHES).start()
+        self.testee = GithubEnvConfigLoader()
+        self.testee.set_options(self.server.loader_options())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_missing_branch_falls_back(self):
+        self.assertTrue(self.testee.set_env("dynamic-missing", ["dev", "master"]))
+
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "dev"}})
+
+    def test_no_branch_found_returns_false(self):
+        self.assertFalse(self.testee.set_env("dynamic-missing", ["other-missing"]))
+
+    def test_fallback_chain_is_probed_concurrently(self):
+        self.server.latency = 0.2
+
+        started = time.perf_counter()
+        self.assertTrue(self.testee.set_env("dynamic-missing", ["other-missing", "another-missing", "dev", "master"]))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(self.testee._env, "dev")
+        self.assertLess(elapsed, 0.2 * 2, "expected the fallback probes to take about a single round trip")
+
+    def test_concurrent_probes_share_one_session(self):
+        def slow_create_session(*args):
+            # every probe reaches the session creation before the first one is done
+            time.sleep(0.1)
+            return create_http_session(*args)
+
+        with patch("src.github_env_conf_loader.create_http_session", side_effect=slow_create_session) as create_session:
+            self.assertTrue(self.testee.set_env("dynamic-missing", ["other-missing", "another-missing", "dev", "master"]))
+
+        create_session.assert_called_once()
+
+    def test_unknown_response_of_higher_priority_branch_fails(self):
+        self.assertFalse(self.testee.set_env("broken", ["master"]))
+
+    def test_list_categories(self):
+        self.testee.set_env("master", [])
+
+        self.assertEqual(sorted(self.testee.list_categories()), ["GLOBAL", "SYSTEM"])
+
+    def test_all_requests_reuse_one_connection(self):
+        self.testee.set_env("master", [])
+        self.testee.list_categories()
+        self.testee.load("global")
+        self.testee.load("system")
+
+        self.assertEqual(len(self.server.requests), 4)
+        self.assertEqual(
+            self.server.connections,
+            1,
+            "expected all loader requests to share a single keep-alive connection",
+        )
+
+    def test_reads_are_pinned_to_verified_commit(self):
+        self.testee.set_env("dynamic-missing", ["master"])
+        self.testee.list_categories()
+        self.testee.load("global")
+
+        commit_sha = MOCK_BRANCHES["master"]["sha"]
+        self.assertEqual(self.testee.revision(), commit_sha)
+        self.assertEqual(
+            self.server.requests[-2:],
+            [
+                f"/repos/Twistbioscience/configuration/contents/?ref={commit_sha}",
+                f"/raw/Twistbioscience/configuration/{commit_sha}/global.json",
+            ],
+        )
+
+    def test_async_loader_gathers_categories(self):
+        async_testee = AsyncGithubEnvConfigLoader()
+        async_testee.set_options(self.server.loader_options())
+
+        async def run():
+            await async_testee.set_env("dynamic-missing", ["master"])
+            categories = await async_testee.list_categories()
+            return await asyncio.gather(*[async_testee.load(c.lower()) for c in sorted(categories)])
+
+        loop = asyncio.new_event_loop()
+        try:
+            actual = loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+        self.assertEqual(actual, [{"section": {"key": 1}}, {"section": {"key": "master"}}])
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import tempfile
+import time
+import unittest
+from mock import patch, Mock
+from src.github_env_conf_loader import GithubEnvConfigLoader, GIT_CONF_TOKEN_KEY
+from src.http_cache import HttpDiskCache
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+
+Logger.instance = Mock()
+
+MOCK_BRANCHES = {
+    "master": {
+        "sha": "a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2",
+        "files": {
+            "global.json": '{"section": {"key": 1}}',
+            "system.json": '{"section": {"key": "master"}}',
+        },
+    },
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def mock_response(content, etag):
+    response = Mock()
+    response.content = content
+    response.headers = {"ETag": etag}
+    return response
+
+
+@patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+class HttpDiskCacheTester(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.server = GithubStubServer(MOCK_BRANCHES).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.cache_dir.cleanup()
+
+    def start_loader(self):
+        loader = GithubEnvConfigLoader()
+        loader.set_options({**self.server.loader_options(), "cache": {"dir": self.cache_dir.name}})
+        loader.set_env("master", [])
+        return loader, [loader.load(c.lower()) for c in sorted(loader.list_categories())]
+
+    def test_unchanged_files_are_served_from_cache_on_304(self):
+        first_loader, expected = self.start_loader()
+        self.assertEqual(first_loader.http_cache().stats(), {"hits": 0, "misses": 4})
+
+        # a process restart: new loader, same cache dir
+        second_loader, actual = self.start_loader()
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(second_loader.http_cache().stats(), {"hits": 4, "misses": 0})
+        self.assertEqual(self.server.not_modified, 4)
+
+    def test_changed_file_is_downloaded_again(self):
+        self.start_loader()
+        MOCK_BRANCHES["master"]["files"]["global.json"] = '{"section": {"key": 2}}'
+        try:
+            loader, actual = self.start_loader()
+        finally:
+            MOCK_BRANCHES["master"]["files"]["global.json"] = '{"section": {"key": 1}}'
+
+        self.assertEqual(actual[0], {"section": {"key": 2}})
+        # the branch probe and the listing were unchanged
+        self.assertEqual(loader.http_cache().stats(), {"hits": 3, "misses": 1})
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # room for two entries only (400 bytes body + meta line each)
+        testee = HttpDiskCache(self.cache_dir.name, max_size_mb=1200 / (1024 * 1024))
+
+        testee.miss("http://a", mock_response(b"a" * 400, '"a"'))
+        testee.miss("http://b", mock_response(b"b" * 400, '"b"'))
+        past = time.time() - 10
+        for name in os.listdir(self.cache_dir.name):
+            os.utime(os.path.join(self.cache_dir.name, name), (past, past))
+        testee.hit("http://a", testee.get("http://a"))
+        testee.miss("http://c", mock_response(b"c" * 400, '"c"'))
+
+        self.assertIsNotNone(testee.get("http://a"))
+        self.assertIsNone(testee.get("http://b"))
+        self.assertIsNotNone(testee.get("http://c"))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import time
+import unittest
+import urllib.error
+import urllib.request
+from mock import patch, Mock
+from src.config_context_handler import EnvConfigContext
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.env_config import EnvConfig, TWIST_ENV_KEY
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.invalidation_listener import InvalidationListener, parse_notification, sign_payload, SIGNATURE_HEADER
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+from .mock_env_loader import wait_for
+
+Logger.instance = Mock()
+
+ENV_NAME = "dummy_env_name"
+SECRET = "shared-secret"
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def send(url, payload, secret=SECRET):
+    body = json.dumps(payload).encode("utf-8")
+    request = urllib.request.Request(url, data=body, method="POST", headers={"Content-Type": "application/json"})
+    if secret is not None:
+        request.add_header(SIGNATURE_HEADER, sign_payload(secret, body))
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as ex:
+        return ex.code
+
+
+def branches(sha, first, second):
+    return {
+        "master": {
+            "sha": sha * 40,
+            "files": {"pushed_a.json": '{"section": {"key": "%s"}}' % first, "pushed_b.json": '{"section": {"key": "%s"}}' % second},
+        }
+    }
+
+
+class InvalidationListenerTester(unittest.TestCase):
+    def setUp(self):
+        self.notifications = []
+        self.testee = InvalidationListener(SECRET, lambda *change: self.notifications.append(change)).start()
+
+    def tearDown(self):
+        self.testee.stop()
+
+    def test_signed_notification_is_dispatched(self):
+        status = send(self.testee.url, {"branch": "qa", "sha": "a" * 40, "files": ["global.json"]})
+
+        self.assertEqual(status, 202)
+        # notifications are handled right after the sender is answered
+        wait_for(lambda: len(self.notifications) > 0)
+        self.assertEqual(self.notifications, [("qa", "a" * 40, ["global.json"])])
+
+    def test_unsigned_or_badly_signed_notification_is_rejected(self):
+        self.assertEqual(send(self.testee.url, {"branch": "qa", "sha": "a" * 40}, secret=None), 401)
+        self.assertEqual(send(self.testee.url, {"branch": "qa", "sha": "a" * 40}, secret="guessed"), 401)
+        self.assertEqual(self.notifications, [])
+
+    def test_malformed_notification_is_rejected(self):
+        self.assertEqual(send(self.testee.url, {"sha": "a" * 40}), 400)
+        self.assertEqual(self.notifications, [])
+
+    def test_github_push_payload_is_parsed(self):
+        payload = {
+            "ref": "refs/heads/qa",
+            "after": "b" * 40,
+            "commits": [{"added": ["qa/new.json"], "modified": ["global.json"], "removed": []}, {"modified": ["global.json"]}],
+        }
+
+        self.assertEqual(parse_notification(payload), ("qa", "b" * 40, ["global.json", "qa/new.json"]))
+
+
+class PushedReloadTester(unittest.TestCase):
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME, GIT_CONF_TOKEN_KEY: "dummy-token"})
+    def setUp(self):
+        self.env_config = EnvConfig.instance()
+        self.env_config.set_context_handler(EnvConfigContext(ENV_NAME))
+        self.server = GithubStubServer(branches("a", "old a", "old b")).start()
+
+        loader = EnvConfigLoaderFactory().get_loader("github")
+        loader.set_options(self.server.loader_options())
+        # the singleton keeps the categories loaded by other tests, a reload requires all of them to still exist
+        self.env_config._EnvConfig__config_json = {}
+        self.env_config.set_loader(loader)
+        self.env_config.prefetch_categories(["PUSHED_A", "PUSHED_B"])
+
+        self.listener = self.env_config.start_invalidation_listener(SECRET)
+
+    def tearDown(self):
+        self.env_config.stop_invalidation_listener()
+        self.server.stop()
+
+    def test_pushed_change_reloads_only_the_changed_category(self):
+        self.server.branches = branches("b", "new a", "new b")
+        self.server.reset_counters()
+
+        started = time.perf_counter()
+        self.assertEqual(send(self.listener.url, {"branch": "master", "sha": "b" * 40, "files": ["pushed_a.json"]}), 202)
+        wait_for(lambda: EnvConfig.get("PUSHED_A", "section", "key") == "new a")
+
+        self.assertLess(time.perf_counter() - started, 1)
+        self.assertEqual(EnvConfig.get("PUSHED_A", "section", "key"), "new a")
+        # not notified as changed - kept as loaded
+        self.assertEqual(EnvConfig.get("PUSHED_B", "section", "key"), "old b")
+        self.assertEqual(EnvConfig.version(), "b" * 40)
+        self.assertEqual([path for path in self.server.requests if "pushed_" in path], [f"/raw/Twistbioscience/configuration/{'b' * 40}/pushed_a.json"])
+
+    def test_change_of_another_branch_is_ignored(self):
+        self.assertFalse(self.env_config.notify_change("qa", "c" * 40, ["pushed_a.json"]))
+        self.assertEqual(EnvConfig.version(), "a" * 40)
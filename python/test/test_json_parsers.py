@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import unittest
+from mock import patch, Mock
+from src import json_parsers
+from src.json_parsers import parse_json, strict_parser_name, PARSER_JSON, PARSER_JSON5
+
+from src.logger import Logger
+
+Logger.instance = Mock()
+
+STRICT_DOCUMENT = '{"section": {"key": 1, "list": [1.5, "a", null, true]}}'
+JSON5_DOCUMENT = "// a comment\n{section: {key: 1, list: [1.5, 'a', null, true,],},}"
+EXPECTED = {"section": {"key": 1, "list": [1.5, "a", None, True]}}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class JsonParsersTester(unittest.TestCase):
+    def test_auto_parses_strict_json_with_the_strict_parser(self):
+        self.assertEqual(parse_json(STRICT_DOCUMENT), (EXPECTED, strict_parser_name()))
+        self.assertEqual(parse_json(STRICT_DOCUMENT.encode("utf-8")), (EXPECTED, strict_parser_name()))
+
+    def test_auto_falls_back_to_json5(self):
+        self.assertEqual(parse_json(JSON5_DOCUMENT), (EXPECTED, PARSER_JSON5))
+        self.assertEqual(parse_json(JSON5_DOCUMENT.encode("utf-8")), (EXPECTED, PARSER_JSON5))
+
+    def test_explicit_parser_has_no_fallback(self):
+        self.assertEqual(parse_json(JSON5_DOCUMENT, PARSER_JSON5), (EXPECTED, PARSER_JSON5))
+        with self.assertRaises(ValueError):
+            parse_json(JSON5_DOCUMENT, PARSER_JSON)
+
+    def test_unknown_parser_raises(self):
+        with self.assertRaises(Exception):
+            parse_json(STRICT_DOCUMENT, "yaml")
+
+    @patch.object(json_parsers, "orjson", None)
+    def test_stdlib_json_is_the_strict_parser_without_orjson(self):
+        self.assertEqual(parse_json(STRICT_DOCUMENT), (EXPECTED, PARSER_JSON))
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from mock import patch, Mock
+from src.config_context_handler import EnvConfigContext
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.env_config import EnvConfig, TWIST_ENV_KEY
+from src.github_env_conf_loader import GIT_CONF_TOKEN_KEY
+from src.last_known_good import LastKnownGoodStore
+
+from src.logger import Logger
+from .github_stub_server import GithubStubServer
+from .mock_env_loader import wait_for
+
+Logger.instance = Mock()
+
+ENV_NAME = "dummy_env_name"
+CONTEXT_HASH = "context-hash"
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def branches(category, sha, value, status=None):
+    master = {"sha": sha * 40, "files": {f"{category.lower()}.json": '{"section": {"key": %s}}' % value}}
+    if status is not None:
+        master["status"] = status
+    return {"master": master}
+
+
+class LastKnownGoodStoreTester(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.testee = LastKnownGoodStore(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_categories_of_a_revision_accumulate(self):
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "a" * 40, ["GLOBAL", "SYSTEM"], {"global": {"a": 1}})
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "a" * 40, ["GLOBAL", "SYSTEM"], {"system": {"b": [1, 2]}})
+
+        stored = self.testee.load(ENV_NAME, CONTEXT_HASH)
+        self.assertEqual((stored["branch"], stored["revision"]), ("master", "a" * 40))
+        self.assertEqual(stored["categories"], ["GLOBAL", "SYSTEM"])
+        self.assertEqual(stored["config"], {"global": {"a": 1}, "system": {"b": [1, 2]}})
+
+    def test_new_revision_replaces_the_previous_one(self):
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "a" * 40, ["GLOBAL", "SYSTEM"], {"global": {"a": 1}})
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "b" * 40, ["SYSTEM"], {"system": {"b": 2}})
+
+        stored = self.testee.load(ENV_NAME, CONTEXT_HASH)
+        self.assertEqual(stored["revision"], "b" * 40)
+        self.assertEqual(stored["config"], {"system": {"b": 2}})
+
+    def test_other_env_or_context_is_not_served(self):
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "a" * 40, ["GLOBAL"], {"global": {"a": 1}})
+
+        self.assertIsNone(self.testee.load("other_env", CONTEXT_HASH))
+        self.assertIsNone(self.testee.load(ENV_NAME, "other-context-hash"))
+
+    def test_corrupted_store_is_ignored(self):
+        self.testee.save(ENV_NAME, CONTEXT_HASH, "master", "a" * 40, ["GLOBAL"], {"global": {"a": 1}})
+        for name in os.listdir(self.directory.name):
+            with open(os.path.join(self.directory.name, name), "r+b") as store_file:
+                store_file.truncate(60)
+
+        self.assertIsNone(self.testee.load(ENV_NAME, CONTEXT_HASH))
+
+
+class EnvConfigLastKnownGoodTester(unittest.TestCase):
+    @patch.dict("os.environ", {TWIST_ENV_KEY: ENV_NAME, GIT_CONF_TOKEN_KEY: "dummy-token"})
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.testee = EnvConfig.instance()
+        self.testee.set_context_handler(EnvConfigContext(ENV_NAME))
+        self.testee._EnvConfig__config_json = {}
+        self.testee.set_last_known_good(LastKnownGoodStore(self.directory.name), startup_deadline=0.3, revalidate_interval=0.05)
+
+        self.category = self._testMethodName.upper()
+        self.server = GithubStubServer(branches(self.category, "a", '"good"')).start()
+
+        # a first, healthy startup saving the last known good
+        self.start()
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+        self.assertFalse(EnvConfig.is_stale())
+
+    def tearDown(self):
+        self.testee._EnvConfig__stale = False
+        if self.testee._EnvConfig__revalidator is not None:
+            self.testee._EnvConfig__revalidator.join()
+        self.testee.set_last_known_good(None)
+        self.testee._EnvConfig__config_json = {}
+        self.server.stop()
+        self.directory.cleanup()
+
+    @patch.dict("os.environ", {GIT_CONF_TOKEN_KEY: "dummy-token"})
+    def start(self):
+        """
+        Returns:
+            float -- seconds set_loader took
+        """
+        self.testee._EnvConfig__config_json = {}
+        loader = EnvConfigLoaderFactory().get_loader("github")
+        loader.set_options({**self.server.loader_options(), "http": {"timeout": 5}})
+        started = time.perf_counter()
+        self.testee.set_loader(loader)
+        return time.perf_counter() - started
+
+    def test_outage_serves_the_last_known_good(self):
+        self.server.branches = branches(self.category, "b", '"new"', status=500)
+        self.server.reset_counters()
+
+        self.start()
+
+        self.assertTrue(EnvConfig.is_stale())
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+        self.assertEqual(EnvConfig.version(), "a" * 40)
+        self.assertFalse(any(path.endswith(".json") for path in self.server.requests), "expected no category fetch")
+
+    def test_slow_source_serves_the_last_known_good_within_the_deadline(self):
+        self.server.latency = 1.5
+
+        elapsed = self.start()
+
+        self.assertLess(elapsed, 1.0)
+        self.assertTrue(EnvConfig.is_stale())
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+
+    def test_revalidates_once_the_source_is_back(self):
+        self.server.branches = branches(self.category, "b", '"new"', status=500)
+        self.start()
+        self.assertTrue(EnvConfig.is_stale())
+
+        self.server.branches = branches(self.category, "c", '"recovered"')
+
+        self.assertTrue(wait_for(lambda: not EnvConfig.is_stale()))
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "recovered")
+        self.assertEqual(EnvConfig.version(), "c" * 40)
+
+    def test_failing_category_fetch_is_served_from_the_last_known_good(self):
+        # the branch is still there but its files cannot be fetched
+        self.server.branches = branches(self.category, "a", "{not json")
+
+        self.start()
+        self.assertFalse(EnvConfig.is_stale())
+
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+        self.assertTrue(EnvConfig.is_stale())
+
+    def test_prefetched_categories_are_saved_at_once(self):
+        categories = [f"{self.category}_{index}" for index in range(5)]
+        for category in categories:
+            self.server.branches["master"]["files"][f"{category.lower()}.json"] = '{"section": {"key": "good"}}'
+        self.start()
+        store = self.testee._EnvConfig__last_known_good
+
+        with patch.object(store, "save", wraps=store.save) as save:
+            self.testee.prefetch_categories(categories, max_workers=2)
+
+        self.assertEqual(save.call_count, 1)
+        stored = store.load(ENV_NAME, self.testee._EnvConfig__context.fingerprint())
+        self.assertLessEqual({category.lower() for category in categories}, set(stored["config"]))
+
+    def test_failing_category_fetch_is_served_from_the_last_known_good_when_awaited(self):
+        self.server.branches = branches(self.category, "a", "{not json")
+        self.start()
+        # the awaitable accessors wrap the loader just set
+        self.testee.set_async_loader(None)
+
+        loop = asyncio.new_event_loop()
+        try:
+            actual = loop.run_until_complete(EnvConfig.aget(self.category, "section", "key"))
+        finally:
+            loop.close()
+
+        self.assertEqual(actual, "good")
+        self.assertTrue(EnvConfig.is_stale())
+
+    def test_failing_listing_serves_the_last_known_good(self):
+        self.server.branches = branches(self.category, "b", '"new"')
+        self.server.branches["master"]["contents_status"] = 502
+
+        self.start()
+
+        self.assertTrue(EnvConfig.is_stale())
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+        self.assertEqual(EnvConfig.version(), "a" * 40)
+
+    def test_slow_source_without_last_known_good_is_waited_for(self):
+        self.testee.set_last_known_good(LastKnownGoodStore(os.path.join(self.directory.name, "empty")), startup_deadline=0.3)
+        self.server.latency = 0.5
+
+        self.start()
+
+        self.assertFalse(EnvConfig.is_stale())
+        self.assertEqual(EnvConfig.get(self.category, "section", "key"), "good")
+
+    def test_outage_without_last_known_good_exits(self):
+        self.testee.set_last_known_good(LastKnownGoodStore(os.path.join(self.directory.name, "empty")), startup_deadline=0.3)
+        self.server.branches = branches(self.category, "b", '"new"', status=500)
+
+        with self.assertRaises(SystemExit):
+            self.start()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import subprocess
+import sys
+import unittest
+
+#############################################################################
+# GLOBALS and CONSTANTS                                                     #
+#############################################################################
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the package import itself (not counting the interpreter startup), well above its actual cost - catches the
+# eager import of a heavy dependency rather than measuring anything
+IMPORT_BUDGET_MS = 150
+LAZY_MODULES = ["hvac", "requests", "json5", "yaml", "termcolor", "http.server", "multiprocessing.shared_memory"]
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+def run_python(code, *flags, env=None):
+    """
+    Runs code in a fresh interpreter (nothing imported yet), with the provided env vars
+
+    Returns:
+        subprocess.CompletedProcess -- the finished process
+    """
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=PACKAGE_DIR,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        env={"PATH": os.environ.get("PATH", ""), **(env or {})},
+    )
+
+
+def import_times(stderr):
+    """
+    Returns:
+        dict -- module => cumulative import time (us), as reported by python -X importtime
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class LazyImportsTester(unittest.TestCase):
+    def test_heavy_dependencies_are_not_imported(self):
+        result = run_python(f"import sys, src; print([m for m in {LAZY_MODULES!r} if m in sys.modules])")
+
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_import_time_budget(self):
+        times = import_times(run_python("import src", "-X", "importtime").stderr)
+
+        self.assertLess(times["src"] / 1000, IMPORT_BUDGET_MS)
+        self.assertEqual([m for m in LAZY_MODULES if m in times], [])
+
+    def test_env_vars_are_registered_on_import(self):
+        # OSVars.initialize without ConfigBuilder validates the package env vars as well
+        code = "from src import OSVars; OSVars.initialize(); print(OSVars.get('TWIST_ENV'), OSVars.get('VAULT_URL'))"
+        result = run_python(
+            code, env={"TWIST_ENV": "dummy_env_name", "VAULT_USER": "user", "VAULT_PASSWORD": "pass", "VAULT_URL": "https://vault.internal"}
+        )
+
+        self.assertEqual(result.stdout.strip(), "dummy_env_name https://vault.internal")
+
+    def test_late_registered_mandatory_env_var_is_validated(self):
+        code = (
+            "from src.logger import Logger; from src.os_vars import OSVars; Logger.instance().initialize(); "
+            "OSVars.initialize(); OSVars.register_mandatory('MISSING_LATE_VAR', 'late', str)"
+        )
+
+        with self.assertRaises(subprocess.CalledProcessError) as raised:
+            run_python(code, env={"TWIST_ENV": "dummy_env_name", "VAULT_USER": "user", "VAULT_PASSWORD": "pass"})
+        self.assertIn("Missing mandatory os env var MISSING_LATE_VAR", raised.exception.stdout + raised.exception.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import os
+import tempfile
+import unittest
+from mock import Mock
+from src.env_conf_loader_factory import EnvConfigLoaderFactory
+from src.json_parsers import strict_parser_name
+
+from src.logger import Logger
+
+Logger.instance = Mock()
+
+MOCK_FILES = {
+    "global.json": '{"section": {"key": 1}}',
+    "system.json": "// json5 comment\n{section: {key: 'root'}}",
+    "empty.json": "",
+    "notes.txt": "not a category",
+    "dev/global.json": '{"section": {"key": "dev"}}',
+    "qa/global.json": '{"section": {"key": "qa"}}',
+}
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class LocalDirEnvConfigLoaderTester(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        for file_path, content in MOCK_FILES.items():
+            full_path = os.path.join(self.root.name, file_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as config_file:
+                config_file.write(content)
+
+        self.testee = EnvConfigLoaderFactory().get_loader("local")
+        self.testee.set_options({"local": {"path": self.root.name}})
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def test_v1_reads_root_files(self):
+        self.assertTrue(self.testee.set_env("anything", []))
+
+        self.assertEqual(self.testee.list_categories(), ["EMPTY", "GLOBAL", "SYSTEM"])
+        self.assertEqual(self.testee.load("system"), {"section": {"key": "root"}})
+        self.assertEqual(self.testee.load("empty"), {})
+
+    def test_v2_maps_dynamic_env_to_dev_folder(self):
+        self.testee.set_version(2)
+        self.assertTrue(self.testee.set_env("dynamic-some-env", []))
+
+        self.assertEqual(self.testee.list_categories(), ["GLOBAL"])
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "dev"}})
+
+    def test_v2_falls_back_to_existing_env_folder(self):
+        self.testee.set_version(2)
+        self.assertTrue(self.testee.set_env("staging", ["qa"]))
+
+        self.assertEqual(self.testee.load("global"), {"section": {"key": "qa"}})
+
+    def test_v2_missing_env_folders_returns_false(self):
+        self.testee.set_version(2)
+
+        self.assertFalse(self.testee.set_env("staging", ["production"]))
+
+    def test_files_are_parsed_once(self):
+        self.testee.set_env("anything", [])
+        first = self.testee.load("global")
+
+        os.remove(os.path.join(self.root.name, "global.json"))
+
+        self.assertIs(self.testee.load("global"), first)
+
+    def test_records_the_parser_of_each_category(self):
+        self.testee.set_env("anything", [])
+        self.testee.load("global")
+        self.testee.load("system")
+
+        self.assertEqual(self.testee.category_parsers(), {"global": strict_parser_name(), "system": "json5"})
+
+    def test_configured_parser_is_used(self):
+        self.testee.set_options({"local": {"path": self.root.name}, "json": {"parser": "json5"}})
+        self.testee.set_env("anything", [])
+        self.testee.load("global")
+
+        self.assertEqual(self.testee.category_parsers(), {"global": "json5"})
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import json
+import os
+import struct
+import subprocess
+import sys
+import time
+import unittest
+import uuid
+from mock import Mock
+from src.shared_config_store import SharedConfigStore, GENERATION_OFFSET
+
+from src.logger import Logger
+
+Logger.instance = Mock()
+
+CATEGORIES = ["GLOBAL", "SYSTEM"]
+CONFIG = {"global": {"section": {"key": 1, "list": [1.5, "a", None, True]}}}
+READ_IN_OTHER_PROCESS = (
+    "import json, sys\n"
+    "from src.shared_config_store import SharedConfigStore\n"
+    "print(json.dumps(SharedConfigStore(sys.argv[1]).read()['config']))\n"
+)
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+@unittest.skipUnless(SharedConfigStore.is_supported(), "requires multiprocessing.shared_memory")
+class SharedConfigStoreTester(unittest.TestCase):
+    def setUp(self):
+        self.name = f"envconfig_test_{uuid.uuid4().hex[:12]}"
+        self.testee = SharedConfigStore(self.name, size_mb=1)
+
+    def tearDown(self):
+        self.testee.unlink()
+
+    def test_missing_segment_reads_none(self):
+        self.assertIsNone(self.testee.read())
+        self.assertEqual(self.testee.generation(), 0)
+
+    def test_published_config_is_read_back(self):
+        self.assertTrue(self.testee.publish("qa", "a" * 40, CATEGORIES, CONFIG))
+
+        actual = SharedConfigStore(self.name).read()
+
+        self.assertAlmostEqual(actual.pop("published_at"), time.time(), delta=5)
+        self.assertEqual(actual, {"branch": "qa", "revision": "a" * 40, "categories": CATEGORIES, "config": CONFIG, "generation": 2})
+
+    def test_every_publish_is_a_new_generation(self):
+        self.testee.publish("qa", "a" * 40, CATEGORIES, CONFIG)
+        self.testee.publish("qa", "b" * 40, CATEGORIES, {})
+
+        actual = SharedConfigStore(self.name).read()
+
+        self.assertEqual((actual["revision"], actual["config"], actual["generation"]), ("b" * 40, {}, 4))
+
+    def test_publish_in_progress_is_never_read(self):
+        self.testee.publish("qa", "a" * 40, CATEGORIES, CONFIG)
+        reader = SharedConfigStore(self.name)
+        reader.read()
+
+        # a publisher stuck in the middle of a publish (odd generation)
+        with open(f"/dev/shm/{self.name}", "r+b") as segment:
+            segment.seek(GENERATION_OFFSET)
+            segment.write(struct.pack("<Q", 3))
+
+        self.assertIsNone(reader.read())
+
+    def test_stale_config_is_not_read(self):
+        self.testee.publish("qa", "a" * 40, CATEGORIES, CONFIG)
+        time.sleep(0.1)
+
+        self.assertIsNone(SharedConfigStore(self.name, max_age=0.05).read())
+
+        self.testee.touch()
+        self.assertIsNotNone(SharedConfigStore(self.name, max_age=0.05).read())
+
+    def test_too_big_config_is_not_published(self):
+        self.assertFalse(SharedConfigStore(self.name, size_mb=0.001).publish("qa", "a" * 40, CATEGORIES, {"big": "x" * 2048}))
+
+    def test_other_processes_read_the_published_config(self):
+        self.testee.publish("qa", "a" * 40, CATEGORIES, CONFIG)
+
+        result = subprocess.run(
+            [sys.executable, "-c", READ_IN_OTHER_PROCESS, self.name],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+
+        self.assertEqual(json.loads(result.stdout), CONFIG)
+        # the reader exiting does not remove the segment
+        self.assertIsNotNone(SharedConfigStore(self.name).read())
+
+    def test_single_publisher_lock(self):
+        other = SharedConfigStore(self.name)
+        self.assertTrue(self.testee.acquire_publisher_lock())
+
+        self.assertFalse(other.acquire_publisher_lock(timeout=0.1))
+
+        self.testee.release_publisher_lock()
+        self.assertTrue(other.acquire_publisher_lock(timeout=0.1))
+        other.release_publisher_lock()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+#############################################################################
+# IMPORT MODULES                                                            #
+#############################################################################
+import unittest
+from src.value_parsers import parse_bool, parse_bytes, parse_duration, parse_float, parse_int, parse_list
+
+#############################################################################
+# IMPLEMENTATION                                                            #
+#############################################################################
+
+
+class ValueParsersTester(unittest.TestCase):
+    def assert_parses(self, parser, cases):
+        for value, expected in cases:
+            actual = parser(value)
+            self.assertEqual((actual, type(actual)), (expected, type(expected)), f"{parser.__name__}({value!r})")
+
+    def assert_malformed(self, parser, values):
+        for value in values:
+            with self.assertRaises(ValueError, msg=f"{parser.__name__}({value!r})"):
+                parser(value)
+
+    def test_int(self):
+        self.assert_parses(parse_int, [(42, 42), (" 42 ", 42), ("-1", -1), (3.0, 3)])
+        self.assert_malformed(parse_int, ["4.2", 4.2, "", None, True, [1], "inf", float("inf"), float("nan"), 1e999])
+
+    def test_float(self):
+        self.assert_parses(parse_float, [(0.5, 0.5), (2, 2.0), ("0.5", 0.5), ("1e3", 1000.0)])
+        self.assert_malformed(parse_float, ["half", None, False])
+
+    def test_bool(self):
+        self.assert_parses(parse_bool, [(True, True), (0, False), ("Yes", True), (" off", False), ("1", True)])
+        self.assert_malformed(parse_bool, [2, "maybe", "", None])
+
+    def test_duration(self):
+        self.assert_parses(
+            parse_duration, [(30, 30.0), ("1.5", 1.5), ("200ms", 0.2), ("1h30m", 5400.0), ("1d 2s", 86402.0), ("10S", 10.0)]
+        )
+        self.assert_malformed(parse_duration, [-1, "-1s", "5x", "s", "1h 30", None, "inf", float("inf"), float("nan"), "9" * 400 + "s"])
+
+    def test_bytes(self):
+        self.assert_parses(parse_bytes, [(512, 512), ("512", 512), ("10KB", 10000), ("1.5 MiB", 1572864), ("2gib", 2 * 1024 ** 3)])
+        self.assert_malformed(parse_bytes, [-1, 1.5, "3PB", "KB", "ten", None, "inf", float("inf"), 1e999, "9" * 400])
+
+    def test_list(self):
+        self.assertEqual(parse_list(["a", "b"]), ("a", "b"))
+        self.assertEqual(parse_list("a, b ,c"), ("a", "b", "c"))
+        self.assertEqual(parse_list(" "), ())
+        self.assertEqual(parse_list("80, 443", int), (80, 443))
+        self.assertEqual(parse_list(("yes", False), bool), (True, False))
+        self.assertEqual(parse_list(["1s", "1m"], parse_duration), (1.0, 60.0))
+
+        with self.assertRaisesRegex(ValueError, "item 1"):
+            parse_list(["80", "http"], int)
+        self.assert_malformed(parse_list, [{"a": 1}, 1, None])
+
+
+if __name__ == "__main__":
+    unittest.main()